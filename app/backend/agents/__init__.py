@@ -6,5 +6,6 @@ logic for the chat sidebar.
 """
 
 from .orchestrator import GeminiOrchestrator
+from .session import ChatSession
 
-__all__ = ['GeminiOrchestrator']
+__all__ = ['GeminiOrchestrator', 'ChatSession']
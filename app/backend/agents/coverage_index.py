@@ -0,0 +1,243 @@
+"""
+In-memory index of the tract coverage table for chat queries.
+
+Loads florida_tract_coverage.csv once and indexes it by normalized 11-digit
+GEOID, with county (5-digit) and state (2-digit) prefix indexes, so tract
+detail lookups are a dict access instead of a scan of the whole table and
+"tracts in county X" questions are answered without filtering the DataFrame.
+
+Records use the same field names as the pipeline's tract output
+(geoid, coverage_percent, population, ...).
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+# Florida county FIPS codes (state FIPS 12)
+FLORIDA_COUNTIES = {
+    '001': 'Alachua', '003': 'Baker', '005': 'Bay', '007': 'Bradford',
+    '009': 'Brevard', '011': 'Broward', '013': 'Calhoun', '015': 'Charlotte',
+    '017': 'Citrus', '019': 'Clay', '021': 'Collier', '023': 'Columbia',
+    '027': 'DeSoto', '029': 'Dixie', '031': 'Duval', '033': 'Escambia',
+    '035': 'Flagler', '037': 'Franklin', '039': 'Gadsden', '041': 'Gilchrist',
+    '043': 'Glades', '045': 'Gulf', '047': 'Hamilton', '049': 'Hardee',
+    '051': 'Hendry', '053': 'Hernando', '055': 'Highlands', '057': 'Hillsborough',
+    '059': 'Holmes', '061': 'Indian River', '063': 'Jackson', '065': 'Jefferson',
+    '067': 'Lafayette', '069': 'Lake', '071': 'Lee', '073': 'Leon',
+    '075': 'Levy', '077': 'Liberty', '079': 'Madison', '081': 'Manatee',
+    '083': 'Marion', '085': 'Martin', '086': 'Miami-Dade', '087': 'Monroe',
+    '089': 'Nassau', '091': 'Okaloosa', '093': 'Okeechobee', '095': 'Orange',
+    '097': 'Osceola', '099': 'Palm Beach', '101': 'Pasco', '103': 'Pinellas',
+    '105': 'Polk', '107': 'Putnam', '109': 'St. Johns', '111': 'St. Lucie',
+    '113': 'Santa Rosa', '115': 'Sarasota', '117': 'Seminole', '119': 'Sumter',
+    '121': 'Suwannee', '123': 'Taylor', '125': 'Union', '127': 'Volusia',
+    '129': 'Wakulla', '131': 'Walton', '133': 'Washington',
+}
+
+FLORIDA_STATE_FIPS = '12'
+
+# Asset count columns carried into the records
+ASSET_TYPES = ['schools', 'libraries', 'community_centers', 'transit_stops']
+
+# 11-digit runs in free text (10-digit runs are more often phone numbers
+# than GEOIDs that lost their leading zero)
+_GEOID_PATTERN = re.compile(r'(?<!\d)\d{11}(?!\d)')
+
+
+def normalize_geoid(value: Any) -> Optional[str]:
+    """
+    Normalize a tract GEOID to 11 digits.
+
+    Args:
+        value: GEOID as str/int/float (e.g. 12079110200, "1400000US12079110200")
+
+    Returns:
+        11-digit GEOID string, or None if the value is not a tract GEOID
+    """
+    if value is None:
+        return None
+    if isinstance(value, float):
+        if pd.isna(value):
+            return None
+        value = int(value)
+
+    digits = re.sub(r'\D', '', str(value).split('US')[-1])
+    if len(digits) == 10:
+        digits = digits.zfill(11)
+    return digits if len(digits) == 11 else None
+
+
+def extract_geoids(text: str) -> List[str]:
+    """
+    Find tract GEOIDs mentioned in free text.
+
+    Args:
+        text: User message
+
+    Returns:
+        Normalized GEOIDs in order of appearance (deduplicated)
+    """
+    return list(dict.fromkeys(
+        geoid for geoid in map(normalize_geoid, _GEOID_PATTERN.findall(text or '')) if geoid
+    ))
+
+
+def county_name_for_geoid(geoid: str) -> str:
+    """Get the county name for a tract or county GEOID."""
+    if not geoid or len(geoid) < 5:
+        return "Unknown County"
+
+    state_fips = geoid[:2]
+    county_fips = geoid[2:5]
+
+    if state_fips == FLORIDA_STATE_FIPS:
+        return FLORIDA_COUNTIES.get(county_fips, f"County {county_fips}")
+
+    return f"County {county_fips}"
+
+
+def county_fips_for_name(name: str, state_fips: str = FLORIDA_STATE_FIPS) -> Optional[str]:
+    """
+    Resolve a county name to its 5-digit FIPS code.
+
+    Args:
+        name: County name (e.g. "Madison County", "miami-dade")
+        state_fips: State FIPS code (only Florida names are known)
+
+    Returns:
+        5-digit county FIPS, or None if not recognized
+    """
+    if not name or state_fips != FLORIDA_STATE_FIPS:
+        return None
+
+    def _key(s: str) -> str:
+        s = re.sub(r'\bcounty\b', '', s.lower()).replace('saint', 'st')
+        return re.sub(r'[^a-z]', '', s)
+
+    wanted = _key(name)
+    for county_fips, county_name in FLORIDA_COUNTIES.items():
+        if _key(county_name) == wanted:
+            return state_fips + county_fips
+    return None
+
+
+class TractCoverageIndex:
+    """
+    Tract coverage records indexed by GEOID and GEOID prefix.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build the index from a coverage table.
+
+        Args:
+            df: Coverage table with a GEOID column (as written by calculate_coverage_from_csv)
+        """
+        self._by_geoid: Dict[str, Dict[str, Any]] = {}
+        self._by_county: Dict[str, List[str]] = {}
+        self._by_state: Dict[str, List[str]] = {}
+
+        if df is None or df.empty or 'GEOID' not in df.columns:
+            return
+
+        for record in self._records(df):
+            geoid = record['geoid']
+            self._by_geoid[geoid] = record
+            self._by_county.setdefault(geoid[:5], []).append(geoid)
+            self._by_state.setdefault(geoid[:2], []).append(geoid)
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path]) -> 'TractCoverageIndex':
+        """
+        Load and index a coverage CSV.
+
+        Args:
+            path: Path to <state>_tract_coverage.csv
+
+        Returns:
+            TractCoverageIndex
+        """
+        return cls(pd.read_csv(path, dtype={'GEOID': str}))
+
+    @staticmethod
+    def _records(df: pd.DataFrame) -> Iterable[Dict[str, Any]]:
+        """Convert coverage rows to tract records (vectorized column cleanup)."""
+        out = pd.DataFrame({'geoid': df['GEOID'].map(normalize_geoid)})
+
+        def _numeric(column: str) -> pd.Series:
+            if column not in df.columns:
+                return pd.Series(0, index=df.index)
+            return pd.to_numeric(df[column], errors='coerce').fillna(0)
+
+        out['coverage_percent'] = _numeric('coverage').astype(float)
+        out['population'] = _numeric('population').astype(int)
+        out['median_income'] = _numeric('median_income').clip(lower=0).astype(int)
+        out['poverty_rate'] = _numeric('poverty_rate').astype(float)
+        if 'population_coverage' in df.columns:
+            out['population_coverage'] = _numeric('population_coverage').astype(float)
+        for asset_type in ASSET_TYPES:
+            out[asset_type] = _numeric(f'asset_count_{asset_type}').astype(int)
+        out['total_assets'] = out[ASSET_TYPES].sum(axis=1)
+        if 'census_name' in df.columns:
+            out['census_name'] = df['census_name'].fillna('').astype(str)
+
+        out = out[out['geoid'].notna()].drop_duplicates('geoid').sort_values('geoid')
+        return out.to_dict('records')
+
+    def __len__(self) -> int:
+        return len(self._by_geoid)
+
+    def __contains__(self, geoid: Any) -> bool:
+        return normalize_geoid(geoid) in self._by_geoid
+
+    def get(self, geoid: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up a tract.
+
+        Args:
+            geoid: Tract GEOID in any format accepted by normalize_geoid
+
+        Returns:
+            Copy of the tract record, or None if unknown
+        """
+        record = self._by_geoid.get(normalize_geoid(geoid))
+        return dict(record) if record else None
+
+    def get_many(self, geoids: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Look up several tracts (unknown GEOIDs are skipped).
+
+        Args:
+            geoids: Tract GEOIDs
+
+        Returns:
+            Tract records in the order given
+        """
+        return [record for record in map(self.get, geoids) if record]
+
+    def tracts_in_county(self, county_geoid: str) -> List[Dict[str, Any]]:
+        """
+        Get all tracts of a county.
+
+        Args:
+            county_geoid: 5-digit county FIPS (state + county)
+
+        Returns:
+            Tract records ordered by GEOID
+        """
+        return self.get_many(self._by_county.get(str(county_geoid).zfill(5), []))
+
+    def tracts_in_state(self, state_fips: str) -> List[Dict[str, Any]]:
+        """
+        Get all tracts of a state.
+
+        Args:
+            state_fips: 2-digit state FIPS
+
+        Returns:
+            Tract records ordered by GEOID
+        """
+        return self.get_many(self._by_state.get(str(state_fips).zfill(2), []))
@@ -0,0 +1,208 @@
+"""
+Rule-based fast path for chat intent classification.
+
+Resolves the common, unambiguous messages locally - explicit tract GEOIDs,
+greetings, methodology questions and deployment requests naming a known
+state or Florida county - so they skip the Gemini classification round
+trip. Anything the rules are not sure about returns None and is classified
+by Gemini as before.
+
+Intents use the same shape as GeminiOrchestrator._classify_intent.
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add services directory to path
+services_dir = Path(__file__).parent.parent / 'services'
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
+
+from agents.coverage_index import FLORIDA_COUNTIES, extract_geoids
+from tiger_api import TIGERAPIService
+
+# Longest message still treated as a bare greeting
+_MAX_GREETING_CHARS = 40
+
+_GREETING = re.compile(
+    r"^\s*(?:hi|hello|hey|howdy|greetings|yo|good (?:morning|afternoon|evening)|"
+    r"thanks?(?: you)?|thank you(?: so much)?|ok(?:ay)?|cool|great|"
+    r"i'?m ready|ready|let'?s (?:start|begin|go))"
+    r"(?:\s+(?:there|everyone|all|again|bot|assistant))?[\s!.,?]*$",
+    re.IGNORECASE,
+)
+
+_METHODOLOGY = re.compile(
+    r"\bmethodolog|\bhow (?:is|are|do|does|did) (?:the |you |it |this |your )*"
+    r"(?:scor|rank|tier|calculat|weight|priorit|comput|determin|choos|select)"
+    r"|\bwhat (?:does|do|is|are) (?:the |a |an )?(?:\w+ )?(?:scores?|tiers?|ranks?|rankings?)\b.*\bmean"
+    r"|\bwhat data (?:sources?|do you use)",
+    re.IGNORECASE,
+)
+
+# Explicit deployment phrasing only; topic words such as "WiFi" or
+# "broadband" alone also appear in questions about coverage
+_DEPLOYMENT = re.compile(
+    r"\bwhere should\b"
+    r"|\bdeploy(?:ment|ing|s)?\b.*\b(?:in|for|across)\b"
+    r"|\brecommend\w*\b.*\b(?:sites?|locations?)\b"
+    r"|\b(?:wi-?fi|hotspot) (?:sites?|zones?|locations?)\b",
+    re.IGNORECASE,
+)
+
+_TRACTS = re.compile(r"\btracts?\b", re.IGNORECASE)
+
+# "<name> County" for every Florida county (bare names such as "Lake" or "Orange" are ambiguous)
+_COUNTY_NAMES = {
+    re.sub(r'[^a-z]', '', name.lower()): name for name in FLORIDA_COUNTIES.values()
+}
+_COUNTY = re.compile(
+    r"\b((?:[A-Za-z][\w.'-]*\s+){0,2}?[A-Za-z][\w.'-]*)\s+county\b", re.IGNORECASE
+)
+
+_STATES = {name.lower(): name for name in TIGERAPIService.STATE_FIPS}
+_STATE = re.compile(
+    r"\b(" + "|".join(sorted((re.escape(s) for s in _STATES), key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def _find_counties(message: str) -> Optional[List[str]]:
+    """
+    Florida county names written as '<name> County' in a message.
+
+    Returns:
+        County names, or None if some '<name> County' is not a Florida county
+    """
+    found = []
+    for match in _COUNTY.finditer(message):
+        words = match.group(1).split()
+        # Try the longest suffix first ("Palm Beach", then "Beach")
+        for start in range(len(words)):
+            key = re.sub(r'[^a-z]', '', " ".join(words[start:]).lower().replace('saint', 'st'))
+            if key in _COUNTY_NAMES:
+                found.append(_COUNTY_NAMES[key])
+                break
+        else:
+            return None
+    return list(dict.fromkeys(found))
+
+
+def _find_states(message: str) -> List[str]:
+    """State names mentioned in a message (excluding '<name> County')."""
+    text = _COUNTY.sub(" ", message)
+    return list(dict.fromkeys(_STATES[m.group(1).lower()] for m in _STATE.finditer(text)))
+
+
+class FastIntentClassifier:
+    """
+    Local intent rules with hit-rate counters.
+    """
+
+    def __init__(self):
+        """Initialize classifier counters."""
+        self.fast_path_hits = 0
+        self.fallbacks = 0
+        self.intent_counts: Dict[str, int] = {}
+
+    def classify(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Classify a message if a rule matches unambiguously.
+
+        Args:
+            message: User message
+
+        Returns:
+            Intent dict (type + parameters), or None to fall back to Gemini
+        """
+        intent = self._match(message or "")
+
+        if intent is None:
+            self.fallbacks += 1
+        else:
+            self.fast_path_hits += 1
+            self.intent_counts[intent["type"]] = self.intent_counts.get(intent["type"], 0) + 1
+
+        return intent
+
+    def _match(self, message: str) -> Optional[Dict[str, Any]]:
+        """Apply the rules in order."""
+        geoids = extract_geoids(message)
+        if geoids:
+            return {
+                "type": "tract_details",
+                "tract_id": geoids[0] if len(geoids) == 1 else geoids,
+                "location_name": None,
+            }
+
+        if len(message) <= _MAX_GREETING_CHARS and _GREETING.match(message):
+            return {"type": "general", "location_name": None}
+
+        location = self.resolve_location(message)
+        if location is not None:
+            if _DEPLOYMENT.search(message):
+                return {"type": "deployment_recommendation", **location}
+            if _TRACTS.search(message) and location["location_type"] == "city":
+                return {"type": "tract_details", "tract_id": None, **location}
+            return None
+
+        if _METHODOLOGY.search(message):
+            return {"type": "methodology", "location_name": None}
+
+        return None
+
+    @staticmethod
+    def may_request_deployment(message: str) -> bool:
+        """
+        Whether a message uses deployment phrasing.
+
+        Messages without it are not deployment requests, so the orchestrator
+        does not warm the pipeline for them.
+        """
+        return bool(_DEPLOYMENT.search(message or ""))
+
+    @staticmethod
+    def resolve_location(message: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve the single location a message names.
+
+        Returns:
+            location_name/location_type/state_name, or None if no location or several
+        """
+        counties = _find_counties(message)
+        if counties is None:
+            return None
+        states = _find_states(message)
+
+        if len(counties) == 1 and states in ([], ["Florida"]):
+            return {
+                "location_name": f"{counties[0]} County",
+                "location_type": "city",
+                "state_name": "Florida",
+            }
+
+        if not counties and len(states) == 1:
+            return {
+                "location_name": states[0],
+                "location_type": "state",
+                "state_name": states[0],
+            }
+
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Fast-path counters.
+
+        Returns:
+            Hits, fallbacks, hit rate and per-intent hit counts
+        """
+        total = self.fast_path_hits + self.fallbacks
+        return {
+            "fast_path_hits": self.fast_path_hits,
+            "fallbacks": self.fallbacks,
+            "hit_rate": self.fast_path_hits / total if total else 0.0,
+            "intents": dict(self.intent_counts),
+        }
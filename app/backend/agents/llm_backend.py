@@ -0,0 +1,174 @@
+"""
+LLM backends for the chat orchestrator.
+
+GeminiOrchestrator talks to the model through a small interface -
+generate(prompt) for a full response and stream(prompt) for text chunks -
+so the Gemini client can be swapped for a local stand-in. StubBackend
+answers deterministically after a configurable delay, which lets the
+/ws/chat path be load-tested without calling the Gemini API.
+
+Select the backend with LLM_BACKEND ('gemini', the default, or 'stub').
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+# Backend used by create_backend ('gemini' or 'stub')
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'gemini')
+
+# Gemini model name
+GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.5-flash')
+
+# Stub timings: delay before the first chunk and between chunks
+LLM_STUB_LATENCY_MS = float(os.getenv('LLM_STUB_LATENCY_MS', '300'))
+LLM_STUB_CHUNK_MS = float(os.getenv('LLM_STUB_CHUNK_MS', '20'))
+
+
+class LLMBackend(ABC):
+    """
+    Text generation interface used by the orchestrator.
+
+    Both methods block and are called from worker threads.
+    """
+
+    name = 'base'
+
+    def generate(self, prompt: str) -> str:
+        """
+        Generate a full response.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Response text
+        """
+        return "".join(self.stream(prompt))
+
+    @abstractmethod
+    def stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate a response as text chunks.
+
+        Args:
+            prompt: Prompt text
+
+        Yields:
+            Response text chunks
+        """
+
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini via google.generativeai"""
+
+    name = 'gemini'
+
+    def __init__(self, api_key: str, model_name: str = GEMINI_MODEL):
+        """
+        Configure the Gemini client.
+
+        Args:
+            api_key: Google Gemini API key
+            model_name: Gemini model name
+        """
+        if not api_key:
+            raise ValueError("Gemini API key is required")
+
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, prompt: str) -> str:
+        return self.model.generate_content(prompt).text
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        for chunk in self.model.generate_content(prompt, stream=True):
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunk without text parts (e.g. finish/safety metadata)
+                continue
+            if text:
+                yield text
+
+
+class StubBackend(LLMBackend):
+    """
+    Deterministic local stand-in for load testing.
+
+    Intent classification prompts get a "general" intent; every other prompt
+    gets a fixed answer tagged with a short hash of the prompt, streamed
+    word by word. The same prompt always produces the same text.
+    """
+
+    name = 'stub'
+
+    def __init__(
+        self,
+        latency_ms: float = LLM_STUB_LATENCY_MS,
+        chunk_ms: float = LLM_STUB_CHUNK_MS,
+        words: int = 40
+    ):
+        """
+        Initialize the stub.
+
+        Args:
+            latency_ms: Delay before the first chunk (simulated time to first token)
+            chunk_ms: Delay between chunks
+            words: Length of non-classification answers in words
+        """
+        self.latency_ms = latency_ms
+        self.chunk_ms = chunk_ms
+        self.words = words
+        self.calls = 0
+
+    def _response(self, prompt: str) -> str:
+        """Deterministic response text for a prompt"""
+        if re.search(r"classify its intent", prompt, re.IGNORECASE):
+            return json.dumps({"type": "general", "location_name": None})
+
+        digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:8]
+        filler = " ".join(f"word{i}" for i in range(max(self.words - 3, 0)))
+        return f"Stub response {digest}: {filler}".strip()
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        self.calls += 1
+        time.sleep(self.latency_ms / 1000)
+
+        words = self._response(prompt).split(" ")
+        for i, word in enumerate(words):
+            if i:
+                time.sleep(self.chunk_ms / 1000)
+            yield word if i == len(words) - 1 else word + " "
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        time.sleep(self.latency_ms / 1000)
+        return self._response(prompt)
+
+
+def create_backend(gemini_api_key: Optional[str] = None, backend: Optional[str] = None) -> LLMBackend:
+    """
+    Create the configured LLM backend.
+
+    Args:
+        gemini_api_key: Google Gemini API key (required for 'gemini')
+        backend: Backend name (default: LLM_BACKEND)
+
+    Returns:
+        LLMBackend instance
+    """
+    backend = (backend or LLM_BACKEND).lower()
+
+    if backend == 'stub':
+        return StubBackend()
+    if backend == 'gemini':
+        return GeminiBackend(gemini_api_key)
+
+    raise ValueError(f"Unknown LLM backend: {backend}")
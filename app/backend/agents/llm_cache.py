@@ -0,0 +1,245 @@
+"""
+Gemini response cache for the chat orchestrator.
+
+Keys are built from the kind of call, the normalized user question and a
+fingerprint of the data the prompt was built from (site summary, tract
+record, conversation history), so the same question about the same county
+or tract is answered from memory instead of another Gemini call.
+
+Entries expire after a TTL (methodology answers, which are nearly static,
+use a longer one) and the cache is bounded by the size of the stored text,
+evicting least recently used entries. Set LLM_CACHE_PATH to also persist
+entries in SQLite so they survive restarts.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Memory budget for cached response text
+LLM_CACHE_MB = float(os.getenv('LLM_CACHE_MB', '16'))
+
+# Default entry lifetime
+LLM_CACHE_TTL_S = float(os.getenv('LLM_CACHE_TTL_S', '3600'))
+
+# Lifetime of answers that do not depend on data (methodology)
+LLM_CACHE_STATIC_TTL_S = float(os.getenv('LLM_CACHE_STATIC_TTL_S', str(7 * 24 * 3600)))
+
+# Optional SQLite file for persisting entries ('' = memory only)
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', '')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def normalize_question(text: str) -> str:
+    """
+    Normalize a user question for cache keys.
+
+    Case, punctuation and whitespace differences are ignored, so
+    "How are scores calculated?" and "how are scores calculated" match.
+
+    Args:
+        text: User message
+
+    Returns:
+        Normalized question
+    """
+    text = re.sub(r"[^\w\s.-]", " ", (text or "").lower())
+    return " ".join(text.split()).strip(" .-")
+
+
+def make_key(kind: str, question: str, *data: Any) -> str:
+    """
+    Build a cache key.
+
+    Args:
+        kind: Kind of call (e.g. 'deployment', 'tract', 'methodology')
+        question: User message (normalized here)
+        *data: JSON-serializable data the prompt was built from
+
+    Returns:
+        Hex digest identifying the call
+    """
+    payload = json.dumps(
+        [kind, normalize_question(question), data], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """Size-bounded LRU of model responses with TTL and optional SQLite persistence"""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = LLM_CACHE_TTL_S, db_path: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for cached text
+            ttl_seconds: Default entry lifetime
+            db_path: SQLite file to persist entries in (None = memory only)
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._conn = None
+        if db_path:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute("DELETE FROM llm_responses WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key (see make_key)
+
+        Returns:
+            Response text, or None if missing or expired
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < now:
+                self._remove(key)
+                entry = None
+
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT response, expires_at FROM llm_responses WHERE key = ? AND expires_at >= ?",
+                    (key, now)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._insert(key, *entry)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, response: str, ttl_seconds: Optional[float] = None):
+        """
+        Cache a response.
+
+        Args:
+            key: Cache key (see make_key)
+            response: Response text (empty responses are not cached)
+            ttl_seconds: Entry lifetime (default: the cache TTL)
+        """
+        if not response:
+            return
+
+        expires_at = time.time() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+
+        with self._lock:
+            self._insert(key, response, expires_at)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO llm_responses (key, response, expires_at) VALUES (?, ?, ?)",
+                        (key, response, expires_at)
+                    )
+
+    def _insert(self, key: str, response: str, expires_at: float):
+        """Add an entry to the memory tier and evict beyond the budget (lock held)"""
+        size = len(response.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (response, expires_at)
+        self.bytes += size
+
+        while self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        """Drop an entry from the memory tier (lock held)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry[0].encode('utf-8'))
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM llm_responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters, hit rate and current size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def close(self):
+        """Close the SQLite connection (if persisting)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global LLM response cache (initialized once)
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    Get or create the global LLM response cache
+
+    Returns:
+        LLMResponseCache instance
+    """
+    global _llm_cache
+
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache(
+            int(LLM_CACHE_MB * 1024 * 1024),
+            db_path=Path(LLM_CACHE_PATH) if LLM_CACHE_PATH else None
+        )
+
+    return _llm_cache
@@ -7,13 +7,32 @@ census tract details, and methodology explanations.
 
 import os
 import json
+import time
 import asyncio
-from typing import Dict, Any, AsyncGenerator, Optional
-import google.generativeai as genai
+from typing import Dict, Any, AsyncGenerator, Callable, List, Optional, Tuple
 from pathlib import Path
-import pandas as pd
 
-from data_pipeline.run_pipeline import run_deployment_pipeline_with_location
+from agents.coverage_index import (
+    TractCoverageIndex,
+    county_fips_for_name,
+    county_name_for_geoid,
+    extract_geoids,
+)
+from agents.intent_rules import FastIntentClassifier
+from agents.llm_backend import LLMBackend, create_backend
+from agents.llm_cache import LLM_CACHE_STATIC_TTL_S, get_llm_cache, make_key
+from agents.session import ChatSession
+from data_pipeline.run_pipeline import (
+    run_deployment_pipeline_with_location,
+    warm_deployment_pipeline,
+)
+from metrics import Sample, cache_samples, track_upstream
+
+# Maximum number of tracts described in one answer
+MAX_COMPARED_TRACTS = 5
+
+# Seconds before a location whose speculative warm-up failed is warmed again
+WARMUP_RETRY_AFTER_S = float(os.getenv("WARMUP_RETRY_AFTER_S", "300"))
 
 
 class GeminiOrchestrator:
@@ -24,36 +43,50 @@ class GeminiOrchestrator:
     - Deployment recommendation queries
     - Census tract detail queries
     - Methodology explanation queries
+
+    One instance is created at app startup and shared by all connections;
+    per-conversation state is passed in as a ChatSession.
     """
 
-    def __init__(self, gemini_api_key: str, census_api_key: str):
+    def __init__(
+        self, gemini_api_key: str, census_api_key: str, backend: Optional[LLMBackend] = None
+    ):
         """
         Initialize the Gemini orchestrator.
 
         Args:
-            gemini_api_key: Google Gemini API key
+            gemini_api_key: Google Gemini API key (not needed with a non-Gemini backend)
             census_api_key: Census API key (for future use)
+            backend: LLM backend (default: create_backend(), selected by LLM_BACKEND)
         """
-        if not gemini_api_key:
-            raise ValueError("Gemini API key is required")
-
-        # Configure Gemini
-        genai.configure(api_key=gemini_api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.backend = backend or create_backend(gemini_api_key)
         self.census_api_key = census_api_key
 
-        # Load Florida tract coverage data for detailed queries
+        # Local rules for common intents (skips the Gemini classification call)
+        self.fast_classifier = FastIntentClassifier()
+
+        # Responses to repeated questions about the same data
+        self.llm_cache = get_llm_cache()
+
+        # Speculative pipeline warm-ups in flight, keyed by pipeline location
+        self._warmups: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self._warmup_failed: Dict[Tuple[str, str, str], float] = {}  # Location -> time of failure
+        self.speculative_started = 0
+        self.speculative_used = 0
+        self.speculative_discarded = 0
+
+        # Load Florida tract coverage data for detailed queries (indexed by GEOID)
         project_root = Path(__file__).parent.parent.parent.parent
-        self.coverage_data = None
+        self.coverage_index = TractCoverageIndex(None)
         try:
             coverage_path = project_root / "florida_tract_coverage.csv"
             if coverage_path.exists():
-                self.coverage_data = pd.read_csv(coverage_path)
+                self.coverage_index = TractCoverageIndex.from_csv(coverage_path)
         except Exception as e:
             print(f"Warning: Could not load coverage data: {e}")
 
     async def process_query(
-        self, user_message: str, city: str
+        self, user_message: str, city: str, session: Optional[ChatSession] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Process a user query and stream agent steps + final response.
@@ -61,10 +94,25 @@ class GeminiOrchestrator:
         Args:
             user_message: The user's question
             city: The city/location context (e.g., "Atlanta", "Madison County")
+            session: Conversation state of the connection (history is used as context)
 
         Yields:
             Dict containing agent steps and final response
         """
+        history = session.context_text() if session else ""
+        if session:
+            session.add_turn("user", user_message)
+            session.last_city = city
+
+        async for step in self._process_query(user_message, city, history):
+            if session and step.get("type") == "final_response":
+                session.add_turn("assistant", step.get("explanation", ""))
+            yield step
+
+    async def _process_query(
+        self, user_message: str, city: str, history: str = ""
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Classify a query and dispatch it to the matching handler."""
         try:
             # STEP 1: Query Understanding
             yield {
@@ -74,8 +122,15 @@ class GeminiOrchestrator:
                 "status": "in_progress",
             }
 
-            # Use Gemini to classify the query intent
-            intent = await self._classify_intent(user_message, city)
+            # Classify the query intent (local rules first, Gemini for ambiguous messages)
+            intent = self.fast_classifier.classify(user_message)
+            warmup = None
+            if intent is None:
+                # Warm the pipeline for the current city while Gemini classifies
+                # (only when the message could be a deployment request)
+                if self.fast_classifier.may_request_deployment(user_message):
+                    warmup = self._start_warmup(city)
+                intent = await self._classify_intent(user_message, city, history)
 
             yield {
                 "type": "agent_step",
@@ -84,10 +139,22 @@ class GeminiOrchestrator:
                 "status": "completed",
             }
 
+            # Keep the speculative warm-up only if it matches the requested location
+            if warmup is not None:
+                key, task = warmup
+                if (
+                    intent["type"] == "deployment_recommendation"
+                    and self._pipeline_location(intent, city)[:3] == key
+                ):
+                    self.speculative_used += 1
+                else:
+                    self.speculative_discarded += 1
+                    warmup = None
+
             # STEP 2: Data Processing based on intent
             if intent["type"] == "deployment_recommendation":
                 async for step in self._handle_deployment_query(
-                    user_message, city, intent
+                    user_message, city, intent, warmup[1] if warmup else None
                 ):
                     yield step
 
@@ -103,13 +170,15 @@ class GeminiOrchestrator:
 
             else:
                 # General query - provide helpful response
-                async for step in self._handle_general_query(user_message, city):
+                async for step in self._handle_general_query(user_message, city, history):
                     yield step
 
         except Exception as e:
             yield {"type": "error", "message": f"Failed to process query: {str(e)}"}
 
-    async def _classify_intent(self, user_message: str, city: str) -> Dict[str, Any]:
+    async def _classify_intent(
+        self, user_message: str, city: str, history: str = ""
+    ) -> Dict[str, Any]:
         """
         Use Gemini to classify the user's intent.
 
@@ -117,13 +186,13 @@ class GeminiOrchestrator:
             Dict with 'type' and extracted parameters
         """
         prompt = f"""Analyze this user query and classify its intent.
-
+{self._history_block(history)}
 User query: "{user_message}"
 Location context: {city}
 
 Classify into ONE of these categories:
 1. deployment_recommendation - ONLY if user explicitly asks about WHERE to deploy WiFi, which sites to prioritize, or requests deployment recommendations for a SPECIFIC location
-2. tract_details - User asks about a specific census tract's details (must mention tract or GEOID)
+2. tract_details - User asks about specific census tracts' details or compares tracts (must mention tract or GEOID), or asks about the tracts in a county
 3. methodology - User asks how rankings work, what scores mean, or methodology questions
 4. general - Greetings, general conversation, questions without a specific location, or unclear requests
 
@@ -135,7 +204,7 @@ IMPORTANT:
 Also extract any relevant parameters (set to null if not mentioned):
 - location_name (city/county name if explicitly mentioned, otherwise null)
 - location_type (state or city)
-- tract_id (GEOID if asking about specific tract)
+- tract_id (GEOID if asking about specific tract; a list of GEOIDs if comparing several)
 
 Respond ONLY with valid JSON in this format:
 {{
@@ -152,12 +221,14 @@ OR if location is mentioned:
 }}"""
 
         # Run Gemini classification
-        response = await asyncio.to_thread(lambda: self.model.generate_content(prompt))
+        response_text = await self._generate_text(
+            prompt, cache_key=make_key("intent", user_message, city, history)
+        )
 
         # Parse JSON response
         try:
             # Extract JSON from response
-            response_text = response.text.strip()
+            response_text = response_text.strip()
             # Remove markdown code blocks if present
             if response_text.startswith("```"):
                 response_text = response_text.split("```")[1]
@@ -174,7 +245,8 @@ OR if location is mentioned:
             }
 
     async def _handle_deployment_query(
-        self, user_message: str, city: str, intent: Dict[str, Any]
+        self, user_message: str, city: str, intent: Dict[str, Any],
+        warmup: Optional[asyncio.Task] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Handle deployment recommendation queries."""
 
@@ -186,9 +258,7 @@ OR if location is mentioned:
         }
 
         # Extract location parameters
-        location_name = intent.get("location_name", city)
-        location_type = intent.get("location_type", "city")
-        state_name = intent.get("state_name", "Florida")
+        location_name, location_type, state_name, slug = self._pipeline_location(intent, city)
 
         # Validate location_name
         if not location_name or location_name == "None":
@@ -198,9 +268,12 @@ OR if location is mentioned:
             }
             return
 
+        # Let a speculative warm-up for this location finish first (its caches are reused)
+        if warmup is not None:
+            await asyncio.wait({warmup})
+
         # Run the deployment pipeline
         try:
-            slug = location_name.lower().replace(" ", "-") if location_name else "unknown"
             pipeline_result = await asyncio.to_thread(
                 lambda: run_deployment_pipeline_with_location(
                     location_name=location_name,
@@ -231,11 +304,20 @@ OR if location is mentioned:
             "status": "in_progress",
         }
 
-        # Generate human-readable explanation
-        explanation = await self._generate_deployment_explanation(
-            user_message, pipeline_result
+        # Format deployment plan for frontend while the explanation is generated
+        plan_task = asyncio.create_task(
+            asyncio.to_thread(self._format_deployment_plan, pipeline_result)
         )
 
+        # Generate human-readable explanation (streamed as explanation_delta events)
+        deltas: asyncio.Queue = asyncio.Queue()
+        synthesis = asyncio.create_task(self._generate_deployment_explanation(
+            user_message, pipeline_result, on_delta=deltas.put_nowait
+        ))
+        async for event in self._stream_deltas(synthesis, deltas):
+            yield event
+        explanation = synthesis.result()
+
         yield {
             "type": "agent_step",
             "agent": "Synthesis Agent",
@@ -243,8 +325,7 @@ OR if location is mentioned:
             "status": "completed",
         }
 
-        # Format deployment plan for frontend
-        deployment_plan = self._format_deployment_plan(pipeline_result)
+        deployment_plan = await plan_task
 
         # FINAL RESPONSE
         yield {
@@ -267,25 +348,26 @@ OR if location is mentioned:
             "status": "in_progress",
         }
 
-        # Extract tract ID if provided
-        tract_id = intent.get("tract_id")
-
-        # Search for tract in coverage data
-        tract_data = None
-        if self.coverage_data is not None:
-            if tract_id:
-                tract_data = self.coverage_data[
-                    self.coverage_data["geoid"].astype(str) == str(tract_id)
-                ]
-            else:
-                # Try to extract from query using Gemini
-                # For now, return general info
-                pass
+        # Tract IDs from the classifier plus any GEOIDs written in the message
+        tract_ids = intent.get("tract_id") or []
+        if not isinstance(tract_ids, list):
+            tract_ids = str(tract_ids).split(",")
+        tract_ids = list(dict.fromkeys(
+            [*extract_geoids(" ".join(map(str, tract_ids))), *extract_geoids(user_message)]
+        ))
+
+        # Index lookups (O(1) per tract)
+        tracts = self.coverage_index.get_many(tract_ids[:MAX_COMPARED_TRACTS])
+        county_fips = None
+        if not tracts:
+            county_fips = county_fips_for_name(intent.get("location_name") or "")
+            if county_fips:
+                tracts = self.coverage_index.tracts_in_county(county_fips)
 
         yield {
             "type": "agent_step",
             "agent": "Data Pipeline",
-            "action": "Tract data retrieved",
+            "action": f"Tract data retrieved ({len(tracts)} tracts)" if tracts else "Tract data retrieved",
             "status": "completed",
         }
 
@@ -297,10 +379,27 @@ OR if location is mentioned:
             "status": "in_progress",
         }
 
-        if tract_data is not None and len(tract_data) > 0:
-            explanation = await self._generate_tract_explanation(
-                user_message, tract_data.iloc[0].to_dict()
+        deltas: asyncio.Queue = asyncio.Queue()
+        if county_fips and tracts:
+            synthesis = self._generate_county_tracts_explanation(
+                user_message, county_fips, tracts, on_delta=deltas.put_nowait
+            )
+        elif len(tracts) > 1:
+            synthesis = self._generate_tract_comparison(
+                user_message, tracts, on_delta=deltas.put_nowait
+            )
+        elif tracts:
+            synthesis = self._generate_tract_explanation(
+                user_message, tracts[0], on_delta=deltas.put_nowait
             )
+        else:
+            synthesis = None
+
+        if synthesis is not None:
+            synthesis = asyncio.create_task(synthesis)
+            async for event in self._stream_deltas(synthesis, deltas):
+                yield event
+            explanation = synthesis.result()
         else:
             explanation = "I don't have specific tract data available for that query. Please try asking about deployment recommendations for a specific location, or provide a valid tract GEOID."
 
@@ -346,14 +445,19 @@ Our WiFi deployment recommendation system uses a data-driven approach:
 - OpenStreetMap civic assets (schools, libraries, community centers, transit)
 
 **WiFi Zone Generation:**
-- Each tract gets 3 WiFi deployment points in a triangular pattern
-- Zones are positioned ~0.5km from the tract centroid
+- Each tract gets up to 3 WiFi deployment points
+- Points are placed at Census block centroids chosen to maximize the number of residents within ~0.5km of a zone
+- When block population data is unavailable, zones fall back to a triangular pattern ~0.5km from the tract centroid
 - All zones are validated to be within tract boundaries
         """
 
-        explanation = await self._generate_methodology_explanation(
-            user_message, methodology_context
-        )
+        deltas: asyncio.Queue = asyncio.Queue()
+        synthesis = asyncio.create_task(self._generate_methodology_explanation(
+            user_message, methodology_context, on_delta=deltas.put_nowait
+        ))
+        async for event in self._stream_deltas(synthesis, deltas):
+            yield event
+        explanation = synthesis.result()
 
         yield {
             "type": "agent_step",
@@ -365,7 +469,7 @@ Our WiFi deployment recommendation system uses a data-driven approach:
         yield {"type": "final_response", "explanation": explanation}
 
     async def _handle_general_query(
-        self, user_message: str, city: str
+        self, user_message: str, city: str, history: str = ""
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Handle general queries."""
 
@@ -376,16 +480,13 @@ Our WiFi deployment recommendation system uses a data-driven approach:
             "status": "in_progress",
         }
 
-        prompt = f"""You are an AI assistant helping with WiFi deployment planning for underserved communities.
-
-User asked: "{user_message}"
-Context: {city}
-
-Provide a helpful response. If they're asking about deployment recommendations, tract details, or methodology, guide them to ask more specific questions.
-
-Be concise and helpful."""
-
-        response = await asyncio.to_thread(lambda: self.model.generate_content(prompt))
+        deltas: asyncio.Queue = asyncio.Queue()
+        synthesis = asyncio.create_task(self._generate_general_response(
+            user_message, city, history, on_delta=deltas.put_nowait
+        ))
+        async for event in self._stream_deltas(synthesis, deltas):
+            yield event
+        explanation = synthesis.result()
 
         yield {
             "type": "agent_step",
@@ -394,10 +495,30 @@ Be concise and helpful."""
             "status": "completed",
         }
 
-        yield {"type": "final_response", "explanation": response.text}
+        yield {"type": "final_response", "explanation": explanation}
+
+    async def _generate_general_response(
+        self, user_message: str, city: str, history: str = "",
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Generate a response to a general query."""
+
+        prompt = f"""You are an AI assistant helping with WiFi deployment planning for underserved communities.
+{self._history_block(history)}
+User asked: "{user_message}"
+Context: {city}
+
+Provide a helpful response. If they're asking about deployment recommendations, tract details, or methodology, guide them to ask more specific questions.
+
+Be concise and helpful."""
+
+        return await self._generate_text(
+            prompt, on_delta, cache_key=make_key("general", user_message, city, history)
+        )
 
     async def _generate_deployment_explanation(
-        self, user_message: str, pipeline_result: Dict[str, Any]
+        self, user_message: str, pipeline_result: Dict[str, Any],
+        on_delta: Optional[Callable[[str], None]] = None
     ) -> str:
         """Generate human-readable explanation of deployment results."""
 
@@ -430,16 +551,21 @@ Summary: {summary}
 
 Make it conversational (2-3 sentences) explaining why these sites were chosen and what impact they could have. Focus on serving underserved communities."""
 
+        # The summary is local, so it can be shown before Gemini starts answering
+        if on_delta:
+            on_delta(f"{summary}\n")
+
         try:
-            response = await asyncio.to_thread(
-                lambda: self.model.generate_content(prompt)
+            text = await self._generate_text(
+                prompt, on_delta, cache_key=make_key("deployment", user_message, summary)
             )
-            return f"{summary}\n{response.text}"
-        except:
+            return f"{summary}\n{text}"
+        except Exception:
             return summary
 
     async def _generate_tract_explanation(
-        self, user_message: str, tract_data: Dict[str, Any]
+        self, user_message: str, tract_data: Dict[str, Any],
+        on_delta: Optional[Callable[[str], None]] = None
     ) -> str:
         """Generate explanation about a specific census tract."""
 
@@ -460,11 +586,73 @@ Tract Data:
 
 Write 2-3 sentences highlighting key demographics and why this tract might be prioritized for WiFi deployment."""
 
-        response = await asyncio.to_thread(lambda: self.model.generate_content(prompt))
-        return response.text
+        return await self._generate_text(
+            prompt, on_delta, cache_key=make_key("tract", user_message, tract_data)
+        )
+
+    @staticmethod
+    def _tract_summary_line(tract: Dict[str, Any]) -> str:
+        """One-line summary of a tract record for prompts."""
+        return (
+            f"- GEOID {tract['geoid']} ({county_name_for_geoid(tract['geoid'])} County): "
+            f"coverage {tract['coverage_percent']:.1f}%, population {tract['population']:,}, "
+            f"median income ${tract['median_income']:,}, poverty rate {tract['poverty_rate']:.1f}%, "
+            f"{tract['total_assets']} civic assets"
+        )
+
+    async def _generate_tract_comparison(
+        self, user_message: str, tracts: List[Dict[str, Any]],
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Generate a comparison of several census tracts."""
+
+        tract_lines = "\n".join(self._tract_summary_line(t) for t in tracts)
+        prompt = f"""Compare these census tracts for WiFi deployment.
+
+User asked: "{user_message}"
+
+Tracts:
+{tract_lines}
+
+Write 3-4 sentences comparing their coverage and demographics and which tract should be prioritized for WiFi deployment."""
+
+        return await self._generate_text(
+            prompt, on_delta, cache_key=make_key("tract_comparison", user_message, tract_lines)
+        )
+
+    async def _generate_county_tracts_explanation(
+        self, user_message: str, county_fips: str, tracts: List[Dict[str, Any]],
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Generate an overview of the tracts in a county."""
+
+        population = sum(t["population"] for t in tracts)
+        avg_coverage = sum(t["coverage_percent"] for t in tracts) / len(tracts)
+        least_covered = sorted(tracts, key=lambda t: t["coverage_percent"])[:MAX_COMPARED_TRACTS]
+        tract_lines = "\n".join(self._tract_summary_line(t) for t in least_covered)
+
+        prompt = f"""Summarize broadband coverage across the census tracts of a county.
+
+User asked: "{user_message}"
+
+{county_name_for_geoid(county_fips)} County: {len(tracts)} tracts, population {population:,}, average coverage {avg_coverage:.1f}%
+
+Least covered tracts:
+{tract_lines}
+
+Write 3-4 sentences answering the question, highlighting the least covered tracts."""
+
+        return await self._generate_text(
+            prompt, on_delta,
+            cache_key=make_key(
+                "county_tracts", user_message, county_fips, len(tracts), population,
+                round(avg_coverage, 1), tract_lines
+            )
+        )
 
     async def _generate_methodology_explanation(
-        self, user_message: str, methodology_context: str
+        self, user_message: str, methodology_context: str,
+        on_delta: Optional[Callable[[str], None]] = None
     ) -> str:
         """Generate explanation about the methodology."""
 
@@ -477,42 +665,194 @@ Methodology:
 
 Provide a clear, concise answer (2-4 sentences) addressing their specific question."""
 
-        response = await asyncio.to_thread(lambda: self.model.generate_content(prompt))
-        return response.text
+        # Methodology answers only depend on the (static) context, so they are kept longer
+        return await self._generate_text(
+            prompt, on_delta,
+            cache_key=make_key("methodology", user_message, methodology_context),
+            cache_ttl_seconds=LLM_CACHE_STATIC_TTL_S
+        )
 
-    def _extract_county_from_geoid(self, geoid: str) -> str:
-        """Extract county name from census tract GEOID."""
-        if not geoid or len(geoid) < 5:
-            return "Unknown County"
-
-        state_fips = geoid[:2]
-        county_fips = geoid[2:5]
-
-        # Florida county FIPS codes
-        florida_counties = {
-            '001': 'Alachua', '003': 'Baker', '005': 'Bay', '007': 'Bradford',
-            '009': 'Brevard', '011': 'Broward', '013': 'Calhoun', '015': 'Charlotte',
-            '017': 'Citrus', '019': 'Clay', '021': 'Collier', '023': 'Columbia',
-            '027': 'DeSoto', '029': 'Dixie', '031': 'Duval', '033': 'Escambia',
-            '035': 'Flagler', '037': 'Franklin', '039': 'Gadsden', '041': 'Gilchrist',
-            '043': 'Glades', '045': 'Gulf', '047': 'Hamilton', '049': 'Hardee',
-            '051': 'Hendry', '053': 'Hernando', '055': 'Highlands', '057': 'Hillsborough',
-            '059': 'Holmes', '061': 'Indian River', '063': 'Jackson', '065': 'Jefferson',
-            '067': 'Lafayette', '069': 'Lake', '071': 'Lee', '073': 'Leon',
-            '075': 'Levy', '077': 'Liberty', '079': 'Madison', '081': 'Manatee',
-            '083': 'Marion', '085': 'Martin', '086': 'Miami-Dade', '087': 'Monroe',
-            '089': 'Nassau', '091': 'Okaloosa', '093': 'Okeechobee', '095': 'Orange',
-            '097': 'Osceola', '099': 'Palm Beach', '101': 'Pasco', '103': 'Pinellas',
-            '105': 'Polk', '107': 'Putnam', '109': 'St. Johns', '111': 'St. Lucie',
-            '113': 'Santa Rosa', '115': 'Sarasota', '117': 'Seminole', '119': 'Sumter',
-            '121': 'Suwannee', '123': 'Taylor', '125': 'Union', '127': 'Volusia',
-            '129': 'Wakulla', '131': 'Walton', '133': 'Washington',
+    async def _generate_text(
+        self, prompt: str, on_delta: Optional[Callable[[str], None]] = None,
+        cache_key: Optional[str] = None, cache_ttl_seconds: Optional[float] = None
+    ) -> str:
+        """
+        Run a Gemini prompt off the event loop.
+
+        Args:
+            prompt: Prompt text
+            on_delta: Called on the event loop with each streamed text chunk
+                (without it the full response is awaited in one call)
+            cache_key: Response cache key (see llm_cache.make_key); None disables caching
+            cache_ttl_seconds: Lifetime of the cached response (default: cache TTL)
+
+        Returns:
+            Full response text
+        """
+        if cache_key is not None:
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                if on_delta:
+                    on_delta(cached)
+                return cached
+
+        text = await self._generate_uncached(prompt, on_delta)
+
+        if cache_key is not None:
+            self.llm_cache.put(cache_key, text, cache_ttl_seconds)
+        return text
+
+    async def _generate_uncached(
+        self, prompt: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """Call the LLM backend, streaming chunks to on_delta when given."""
+        if on_delta is None:
+            with track_upstream(self.backend.name, 'generate'):
+                return await asyncio.to_thread(self.backend.generate, prompt)
+
+        loop = asyncio.get_running_loop()
+
+        def _stream() -> str:
+            parts = []
+            for text in self.backend.stream(prompt):
+                parts.append(text)
+                loop.call_soon_threadsafe(on_delta, text)
+            return "".join(parts)
+
+        with track_upstream(self.backend.name, 'stream'):
+            return await asyncio.to_thread(_stream)
+
+    @staticmethod
+    async def _stream_deltas(
+        synthesis: "asyncio.Task[str]", deltas: asyncio.Queue
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Forward streamed text as explanation_delta events until synthesis finishes.
+
+        Args:
+            synthesis: Task generating the explanation
+            deltas: Queue the task puts text chunks on
+        """
+        try:
+            while not synthesis.done():
+                next_delta = asyncio.ensure_future(deltas.get())
+                await asyncio.wait({next_delta, synthesis}, return_when=asyncio.FIRST_COMPLETED)
+                if next_delta.done():
+                    yield {"type": "explanation_delta", "delta": next_delta.result()}
+                else:
+                    next_delta.cancel()
+
+            while not deltas.empty():
+                yield {"type": "explanation_delta", "delta": deltas.get_nowait()}
+        finally:
+            if not synthesis.done():
+                synthesis.cancel()
+
+    @staticmethod
+    def _pipeline_location(intent: Dict[str, Any], city: str) -> Tuple[Any, Any, Any, str]:
+        """Pipeline location parameters (name, type, state, slug) for an intent."""
+        location_name = intent.get("location_name", city)
+        location_type = intent.get("location_type", "city")
+        state_name = intent.get("state_name", "Florida")
+        slug = location_name.lower().replace(" ", "-") if location_name else "unknown"
+        return location_name, location_type, state_name, slug
+
+    def _start_warmup(self, city: str) -> Optional[Tuple[Tuple[str, str, str], asyncio.Task]]:
+        """
+        Speculatively warm the deployment pipeline for the message's city.
+
+        Fetches the boundary and computes the spatial filter in a worker thread
+        while the intent is classified. Concurrent messages for the same city
+        share one warm-up; failures are ignored (the pipeline reports them)
+        and the location is not warmed again for WARMUP_RETRY_AFTER_S.
+
+        Args:
+            city: City/location context of the message
+
+        Returns:
+            (location key, warm-up task), or None if the city is not a known
+            state or Florida county, or warming it failed recently
+        """
+        # Only locations whose state is known without asking Gemini
+        intent = self.fast_classifier.resolve_location(city or "")
+        if intent is None:
+            return None
+
+        location_name, location_type, state_name, slug = self._pipeline_location(intent, city)
+        key = (location_name, location_type, state_name)
+        failed_at = self._warmup_failed.get(key)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < WARMUP_RETRY_AFTER_S:
+                return None
+            del self._warmup_failed[key]
+
+        task = self._warmups.get(key)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(
+                warm_deployment_pipeline, location_name, location_type, state_name, slug
+            ))
+            self._warmups[key] = task
+            self.speculative_started += 1
+
+            def _finished(done: asyncio.Task):
+                self._warmups.pop(key, None)
+                if not done.cancelled() and done.exception() is not None:
+                    self._warmup_failed[key] = time.monotonic()
+                    print(f"Speculative warm-up for {location_name} failed: {done.exception()}")
+
+            task.add_done_callback(_finished)
+
+        return key, task
+
+    def speculation_stats(self) -> Dict[str, int]:
+        """Speculative warm-up counters."""
+        return {
+            "started": self.speculative_started,
+            "used": self.speculative_used,
+            "discarded": self.speculative_discarded,
+            "in_flight": len(self._warmups),
         }
 
-        if state_fips == '12':  # Florida
-            return florida_counties.get(county_fips, f"County {county_fips}")
+    def metrics_samples(self) -> List[Sample]:
+        """
+        Chat metrics for the /metrics endpoint.
+
+        Returns:
+            Samples for the intent fast path, speculative warm-ups and the LLM response cache
+        """
+        fast_path = self.fast_classifier.stats()
+        speculation = self.speculation_stats()
+
+        samples: List[Sample] = [
+            ("chat_intent_classifications_total", "counter", "Intent classifications by path",
+             {"path": "fast"}, fast_path["fast_path_hits"]),
+            ("chat_intent_classifications_total", "counter", "Intent classifications by path",
+             {"path": "llm"}, fast_path["fallbacks"]),
+            ("chat_speculative_warmups_in_flight", "gauge", "Speculative pipeline warm-ups running",
+             {}, speculation["in_flight"]),
+        ]
+        samples += [
+            ("chat_fast_path_intents_total", "counter", "Fast-path classifications by intent",
+             {"intent": intent}, count)
+            for intent, count in fast_path["intents"].items()
+        ]
+        samples += [
+            ("chat_speculative_warmups_total", "counter", "Speculative pipeline warm-ups by outcome",
+             {"outcome": outcome}, speculation[outcome])
+            for outcome in ("started", "used", "discarded")
+        ]
+        return samples + cache_samples("llm_response", self.llm_cache.stats())
+
+    @staticmethod
+    def _history_block(history: str) -> str:
+        """Format recent conversation for a prompt ("" when there is none)."""
+        if not history:
+            return ""
+        return f"\nRecent conversation (oldest first):\n{history}\n"
 
-        return f"County {county_fips}"
+    def _extract_county_from_geoid(self, geoid: str) -> str:
+        """Extract county name from census tract GEOID."""
+        return county_name_for_geoid(geoid)
 
     def _format_deployment_plan(
         self, pipeline_result: Dict[str, Any]
@@ -0,0 +1,63 @@
+"""
+Per-connection chat state for the chat sidebar.
+
+The GeminiOrchestrator (model handle, coverage table) is created once per
+process and shared by every websocket connection; anything that belongs to
+a single conversation lives in a ChatSession instead.
+"""
+
+import uuid
+from typing import Any, Dict, List, Optional
+
+# Number of recent turns kept (and passed to Gemini as context)
+MAX_HISTORY_TURNS = 10
+
+
+class ChatSession:
+    """
+    Conversation state for one websocket connection.
+
+    Holds the recent message history and the last location/intent so
+    follow-up questions can be interpreted in context.
+    """
+
+    def __init__(self, session_id: Optional[str] = None, max_turns: int = MAX_HISTORY_TURNS):
+        """
+        Initialize a chat session.
+
+        Args:
+            session_id: Session identifier (default: random UUID)
+            max_turns: Number of recent turns to keep
+        """
+        self.session_id = session_id or uuid.uuid4().hex
+        self.max_turns = max_turns
+        self.history: List[Dict[str, str]] = []
+        self.last_city: Optional[str] = None
+        self.last_intent: Optional[Dict[str, Any]] = None
+
+    def add_turn(self, role: str, content: str):
+        """
+        Record a message.
+
+        Args:
+            role: "user" or "assistant"
+            content: Message text
+        """
+        if not content:
+            return
+        self.history.append({"role": role, "content": content})
+        del self.history[:-self.max_turns]
+
+    def context_text(self, max_chars: int = 2000) -> str:
+        """
+        Format the recent history for a prompt.
+
+        Args:
+            max_chars: Maximum characters per message
+
+        Returns:
+            One line per turn, oldest first ("" if there is no history)
+        """
+        return "\n".join(
+            f"{turn['role']}: {turn['content'][:max_chars]}" for turn in self.history
+        )
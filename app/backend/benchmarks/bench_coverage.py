@@ -0,0 +1,526 @@
+"""
+Coverage Build Benchmark
+
+Times the offline coverage scripts on synthetic fixtures of configurable
+size, so regressions in their pandas/geopandas hot paths show up without the
+multi-GB FCC BDC downloads:
+
+- csv: data_pipeline/calculate_coverage_from_csv.py (BDC CSV -> tract
+  aggregation -> block-share coverage, population-weighted coverage, asset
+  sjoin, GPKG/CSV export). Block populations come from a synthetic fixture
+  instead of the Census API.
+- hexagon: calculate_coverage_no_api.py at the project root (FCC hexagon
+  GeoPackage -> hexagon aggregation -> tract/hexagon overlay, GPKG/CSV export)
+- georgia: the same stages through calculate_georgia_coverage.py. That script
+  imports app.backend.agents.fcc_filter, which is not in this tree, so the
+  suite is reported as skipped until the module is restored.
+
+Each suite reports the median and best wall time of every stage (load,
+aggregate, overlay, merge, population, export) over --repeat runs. Fixtures are
+generated from --seed, so two runs with the same arguments measure the same
+input. --profile DIR writes one cProfile file per stage (open with snakeviz
+or pstats) plus a text summary of the top functions; for a sampling profile,
+run the harness under py-spy instead:
+
+    py-spy record -o coverage.svg -- python benchmarks/bench_coverage.py --repeat 1
+
+Results include the git commit and input sizes, and --compare prints
+per-stage changes against a previous --output file.
+
+Usage:
+    python benchmarks/bench_coverage.py [--tracts 200] [--blocks-per-tract 20]
+        [--hexagons-per-tract 16] [--providers 3] [--assets 500] [--repeat 3]
+        [--suite csv hexagon georgia] [--profile DIR] [--output results.json]
+        [--compare baseline.json]
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import logging
+import math
+import platform
+import pstats
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add project root and backend directory to path so the coverage scripts import as modules
+backend_dir = Path(__file__).parent.parent
+PROJECT_ROOT = backend_dir.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(backend_dir))
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from shapely.geometry import Point, Polygon, box
+
+# Synthetic fixtures sit in Madison County, FL
+STATE_FIPS = '12'
+COUNTY_FIPS = '079'
+ORIGIN = (-83.6, 30.3)
+TRACT_SIZE_DEG = 0.02
+
+# (download, upload) Mbps tiers offered by synthetic providers
+SPEED_TIERS = [(10, 1), (25, 3), (100, 20), (300, 30), (1000, 100)]
+TECHNOLOGIES = [10, 40, 50, 70, 71]
+ASSET_TYPES = ['hospitals', 'schools', 'libraries', 'police', 'community_centers']
+
+STAGES = ['load', 'aggregate', 'overlay', 'merge', 'population', 'export']
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def make_tracts(count: int) -> gpd.GeoDataFrame:
+    """Square census tracts on a grid, with TIGER-style GEOID and NAME"""
+    columns = max(1, math.ceil(math.sqrt(count)))
+    records = []
+    for i in range(count):
+        x = ORIGIN[0] + (i % columns) * TRACT_SIZE_DEG
+        y = ORIGIN[1] + (i // columns) * TRACT_SIZE_DEG
+        tract = f"{100100 + i:06d}"
+        records.append({
+            'GEOID': f"{STATE_FIPS}{COUNTY_FIPS}{tract}",
+            'NAME': f"Census Tract {int(tract) / 100:.2f}",
+            'geometry': box(x, y, x + TRACT_SIZE_DEG, y + TRACT_SIZE_DEG),
+        })
+    return gpd.GeoDataFrame(records, geometry='geometry', crs='EPSG:4326')
+
+
+def _provider_offers(rng: np.random.Generator, providers: int) -> List[Tuple[int, int, int]]:
+    """Random (provider_id, tier index, technology) offers for one location"""
+    offered = rng.choice(providers, size=rng.integers(1, providers + 1), replace=False)
+    return [
+        (130000 + int(p), int(rng.integers(len(SPEED_TIERS))), int(rng.choice(TECHNOLOGIES)))
+        for p in offered
+    ]
+
+
+def make_bdc(tracts: gpd.GeoDataFrame, blocks_per_tract: int, providers: int, seed: int) -> pd.DataFrame:
+    """
+    Provider-level BDC availability rows, one per block and provider.
+
+    block_geoid is numeric, as in the FCC CSV downloads, so load_fcc_csv_files
+    has to reformat it the same way it does for real files.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for tract_geoid in tracts['GEOID']:
+        for block in range(blocks_per_tract):
+            block_geoid = int(f"{tract_geoid}{1000 + block:04d}")
+            for provider_id, tier, technology in _provider_offers(rng, providers):
+                down, up = SPEED_TIERS[tier]
+                rows.append({
+                    'provider_id': provider_id,
+                    'brand_name': f"Provider {provider_id}",
+                    'location_id': 1000000000 + len(rows),
+                    'technology': technology,
+                    'max_advertised_download_speed': down,
+                    'max_advertised_upload_speed': up,
+                    'low_latency': int(technology != 60),
+                    'business_residential_code': 'X',
+                    'state_usps': 'FL',
+                    'block_geoid': block_geoid,
+                    'h3_res8_id': f"8844{block_geoid % 10 ** 9:09x}ff",
+                })
+    return pd.DataFrame(rows)
+
+
+def make_block_population(tracts: gpd.GeoDataFrame, blocks_per_tract: int, seed: int) -> pd.DataFrame:
+    """Census block populations for the BDC fixture blocks (load_county_block_population shape)"""
+    rng = np.random.default_rng(seed)
+    tract_geoids = np.repeat(tracts['GEOID'].to_numpy(), blocks_per_tract)
+    block_suffixes = np.tile([f"{1000 + block:04d}" for block in range(blocks_per_tract)], len(tracts))
+    return pd.DataFrame({
+        'block_geoid': [t + b for t, b in zip(tract_geoids, block_suffixes)],
+        'tract_geoid': tract_geoids,
+        'population': rng.integers(0, 200, len(tract_geoids)),
+    })
+
+
+def _hexagon(cx: float, cy: float, radius: float) -> Polygon:
+    """Flat-topped regular hexagon"""
+    return Polygon([
+        (cx + radius * math.cos(math.pi / 3 * k), cy + radius * math.sin(math.pi / 3 * k))
+        for k in range(6)
+    ])
+
+
+def make_hexagons(
+    tracts: gpd.GeoDataFrame, hexagons_per_tract: int, providers: int, seed: int
+) -> gpd.GeoDataFrame:
+    """
+    Provider-level FCC hexagon rows covering the tract grid.
+
+    Hexagons are laid out on a grid over each tract and overhang tract edges,
+    so the overlay has to split them like real H3 cells.
+    """
+    rng = np.random.default_rng(seed)
+    per_side = max(1, math.ceil(math.sqrt(hexagons_per_tract)))
+    step = TRACT_SIZE_DEG / per_side
+    radius = step * 0.6
+
+    rows = []
+    for tract_index, geometry in enumerate(tracts.geometry):
+        min_x, min_y = geometry.bounds[:2]
+        for k in range(hexagons_per_tract):
+            cx = min_x + (k % per_side + 0.5) * step
+            cy = min_y + (k // per_side + 0.5) * step
+            hexagon = _hexagon(cx, cy, radius)
+            hex_id = f"88{tract_index:07x}{k:04x}fff"
+            for provider_id, tier, technology in _provider_offers(rng, providers):
+                down, up = SPEED_TIERS[tier]
+                rows.append({
+                    'provider_id': provider_id,
+                    'technology': technology,
+                    'max_advertised_download_speed': down,
+                    'max_advertised_upload_speed': up,
+                    'h3_res8_id': hex_id,
+                    'geometry': hexagon,
+                })
+    return gpd.GeoDataFrame(rows, geometry='geometry', crs='EPSG:4326')
+
+
+def make_assets(tracts: gpd.GeoDataFrame, count: int, seed: int) -> gpd.GeoDataFrame:
+    """Community asset points scattered over the tract grid"""
+    rng = np.random.default_rng(seed)
+    min_x, min_y, max_x, max_y = tracts.total_bounds
+    xs = rng.uniform(min_x, max_x, count)
+    ys = rng.uniform(min_y, max_y, count)
+    return gpd.GeoDataFrame(
+        {
+            'asset_type': rng.choice(ASSET_TYPES, count),
+            'name': [f"Asset {i}" for i in range(count)],
+        },
+        geometry=[Point(x, y) for x, y in zip(xs, ys)],
+        crs='EPSG:4326',
+    )
+
+
+def write_fixtures(args: argparse.Namespace, fixture_dir: Path) -> Dict[str, Any]:
+    """
+    Generate and write all fixtures (untimed).
+
+    Returns:
+        In-memory fixtures plus their paths and row counts
+    """
+    tracts = make_tracts(args.tracts)
+    bdc = make_bdc(tracts, args.blocks_per_tract, args.providers, args.seed)
+    hexagons = make_hexagons(tracts, args.hexagons_per_tract, args.providers, args.seed + 1)
+    assets = make_assets(tracts, args.assets, args.seed + 2)
+    block_population = make_block_population(tracts, args.blocks_per_tract, args.seed + 3)
+
+    # File names the scripts look for
+    bdc_dir = fixture_dir / 'bdc'
+    hexagon_dir = fixture_dir / 'fcc_hexagons'
+    bdc_dir.mkdir(parents=True)
+    hexagon_dir.mkdir(parents=True)
+    bdc.to_csv(bdc_dir / 'florida_fcc_cable.csv', index=False)
+    hexagons.to_file(hexagon_dir / 'bdc_12_hexagons.gpkg', driver='GPKG')
+
+    return {
+        'tracts': tracts,
+        'assets': assets,
+        'block_population': block_population,
+        'bdc_dir': bdc_dir,
+        'hexagon_dir': hexagon_dir,
+        'sizes': {
+            'tracts': len(tracts),
+            'bdc_rows': len(bdc),
+            'blocks': args.tracts * args.blocks_per_tract,
+            'hexagon_rows': len(hexagons),
+            'hexagons': args.tracts * args.hexagons_per_tract,
+            'assets': len(assets),
+            'bdc_csv_bytes': (bdc_dir / 'florida_fcc_cable.csv').stat().st_size,
+            'hexagon_gpkg_bytes': (hexagon_dir / 'bdc_12_hexagons.gpkg').stat().st_size,
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Suites
+# ---------------------------------------------------------------------------
+
+# A suite is an ordered list of (stage, func(state)); each func reads its
+# inputs from state and stores its output there for the next stage.
+Suite = List[Tuple[str, Callable[[Dict[str, Any]], None]]]
+
+
+def _export(state: Dict[str, Any], key: str):
+    """Write a result GeoDataFrame the way the scripts' main() does"""
+    out_dir = state['out_dir']
+    result = state[key]
+    result.to_file(out_dir / 'tract_coverage.gpkg', driver='GPKG')
+    result.drop(columns='geometry').to_csv(out_dir / 'tract_coverage.csv', index=False)
+
+
+def csv_suite(fixtures: Dict[str, Any]) -> Suite:
+    """
+    data_pipeline/calculate_coverage_from_csv.py stages
+
+    The population stage runs add_population_weighted_coverage with the
+    county block population loader replaced by the synthetic fixture, so it
+    never calls the Census API or touches the on-disk cache.
+    """
+    from data_pipeline import calculate_coverage_from_csv as script
+
+    by_county = {
+        county: frame.reset_index(drop=True)
+        for county, frame in fixtures['block_population'].groupby(
+            fixtures['block_population']['tract_geoid'].str[:5]
+        )
+    }
+    script.load_county_block_population = lambda state_fips, county_fips: by_county.get(
+        state_fips + county_fips, pd.DataFrame(columns=['block_geoid', 'tract_geoid', 'population'])
+    )
+
+    def load(state):
+        state['fcc'] = script.load_fcc_csv_files(str(fixtures['bdc_dir']))
+
+    def aggregate(state):
+        state['tract_coverage'] = script.aggregate_to_tract_level(state['fcc'])
+
+    def overlay(state):
+        state['tracts'] = script.add_asset_counts_to_tracts(
+            fixtures['tracts'], fixtures['assets'], ASSET_TYPES
+        )
+
+    def merge(state):
+        state['result'] = script.calculate_coverage_percentage(state['tract_coverage'], state['tracts'])
+
+    def population(state):
+        state['result'] = script.add_population_weighted_coverage(state['result'], state['fcc'])
+
+    return [
+        ('load', load),
+        ('aggregate', aggregate),
+        ('overlay', overlay),
+        ('merge', merge),
+        ('population', population),
+        ('export', lambda state: _export(state, 'result')),
+    ]
+
+
+def _hexagon_suite(script: Any, fixtures: Dict[str, Any]) -> Suite:
+    """
+    Hexagon script stages.
+
+    calculate_tract_coverage intersects and merges in one call, so it is
+    timed as 'overlay' and the suite has no separate merge stage.
+    """
+    def load(state):
+        gpkg_files = sorted(fixtures['hexagon_dir'].glob('*.gpkg'))
+        hexagons = [gpd.read_file(path) for path in gpkg_files]
+        state['hexagons'] = gpd.GeoDataFrame(pd.concat(hexagons, ignore_index=True), crs=hexagons[0].crs)
+
+    def aggregate(state):
+        state['aggregated'] = script.aggregate_hexagon_coverage(state['hexagons'])
+
+    def overlay(state):
+        state['result'] = script.calculate_tract_coverage(fixtures['tracts'].copy(), state['aggregated'])
+
+    return [
+        ('load', load),
+        ('aggregate', aggregate),
+        ('overlay', overlay),
+        ('export', lambda state: _export(state, 'result')),
+    ]
+
+
+def hexagon_suite(fixtures: Dict[str, Any]) -> Suite:
+    """calculate_coverage_no_api.py stages"""
+    import calculate_coverage_no_api as script
+
+    suite = _hexagon_suite(script, fixtures)
+    # Time the script's own loader, which also logs per file
+    suite[0] = ('load', lambda state: state.update(
+        hexagons=script.load_local_fcc_hexagons(str(fixtures['hexagon_dir']))
+    ))
+    return suite
+
+
+def georgia_suite(fixtures: Dict[str, Any]) -> Suite:
+    """calculate_georgia_coverage.py stages"""
+    import calculate_georgia_coverage as script
+
+    return _hexagon_suite(script, fixtures)
+
+
+SUITES = {
+    'csv': csv_suite,
+    'hexagon': hexagon_suite,
+    'georgia': georgia_suite,
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run_suite(
+    suite: Suite, out_dir: Path, repeat: int, profile_dir: Optional[Path] = None, prefix: str = ''
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run a suite repeat times and time each stage.
+
+    With profile_dir set, one extra run is made under cProfile (so profiling
+    overhead never reaches the timings) and each stage's profile is written
+    to <prefix>_<stage>.prof with a top-25 cumulative summary alongside.
+
+    Returns:
+        Stage name -> median and best wall time in ms
+    """
+    timings: Dict[str, List[float]] = {stage: [] for stage, _ in suite}
+
+    for _ in range(repeat):
+        state = {'out_dir': out_dir}
+        for stage, func in suite:
+            start = time.perf_counter()
+            func(state)
+            timings[stage].append((time.perf_counter() - start) * 1000)
+
+    if profile_dir is not None:
+        state = {'out_dir': out_dir}
+        for stage, func in suite:
+            profiler = cProfile.Profile()
+            profiler.runcall(func, state)
+            profiler.dump_stats(str(profile_dir / f"{prefix}_{stage}.prof"))
+
+            text = io.StringIO()
+            pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(25)
+            (profile_dir / f"{prefix}_{stage}.txt").write_text(text.getvalue())
+
+    return {
+        stage: {'median_ms': statistics.median(values), 'best_ms': min(values)}
+        for stage, values in timings.items()
+    }
+
+
+def git_revision() -> Dict[str, Any]:
+    """Current commit and whether the working tree has local changes"""
+    def git(*cmd: str) -> str:
+        return subprocess.run(
+            ['git', *cmd], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return {'commit': git('rev-parse', 'HEAD'), 'dirty': bool(git('status', '--porcelain', '--untracked-files=no'))}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def print_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    """Print stage timings, with change against baseline when given"""
+    header = f"{'suite':<10}{'stage':<12}{'median ms':>12}{'best ms':>12}"
+    if baseline:
+        header += f"{'baseline ms':>14}{'change':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for suite_name, stages in results['suites'].items():
+        if 'skipped' in stages or 'failed' in stages:
+            status = 'skipped' if 'skipped' in stages else 'failed'
+            print(f"{suite_name:<10}{status}: {stages[status]}")
+            continue
+
+        base_stages = (baseline or {}).get('suites', {}).get(suite_name, {})
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            timing = stages[stage]
+            line = f"{suite_name:<10}{stage:<12}{timing['median_ms']:>12.1f}{timing['best_ms']:>12.1f}"
+            if baseline:
+                base = base_stages.get(stage)
+                if base:
+                    change = (timing['median_ms'] / base['median_ms'] - 1) * 100 if base['median_ms'] else 0.0
+                    line += f"{base['median_ms']:>14.1f}{change:>+9.1f}%"
+                else:
+                    line += f"{'-':>14}{'':>10}"
+            print(line)
+
+
+def main():
+    """Generate fixtures, run the selected suites and report"""
+    parser = argparse.ArgumentParser(description='Benchmark the offline coverage build scripts')
+    parser.add_argument('--tracts', type=int, default=200, help='Census tracts (default: 200)')
+    parser.add_argument('--blocks-per-tract', type=int, default=20, help='BDC blocks per tract (default: 20)')
+    parser.add_argument('--hexagons-per-tract', type=int, default=16, help='FCC hexagons per tract (default: 16)')
+    parser.add_argument('--providers', type=int, default=3, help='Max providers per block/hexagon (default: 3)')
+    parser.add_argument('--assets', type=int, default=500, help='Asset points for the sjoin (default: 500)')
+    parser.add_argument('--seed', type=int, default=42, help='Fixture random seed (default: 42)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per suite (default: 3)')
+    parser.add_argument('--suite', nargs='+', choices=list(SUITES), default=list(SUITES),
+                        help='Suites to run (default: all)')
+    parser.add_argument('--profile', metavar='DIR', help='Write cProfile output per stage to DIR')
+    parser.add_argument('--output', help='Write full results as JSON to this file')
+    parser.add_argument('--compare', metavar='FILE', help='Previous --output file to compare against')
+    parser.add_argument('--verbose', action='store_true', help="Keep the scripts' INFO logging")
+    args = parser.parse_args()
+
+    profile_dir = Path(args.profile) if args.profile else None
+    if profile_dir:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+    results = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'versions': {'pandas': pd.__version__, 'geopandas': gpd.__version__, 'numpy': np.__version__},
+        'params': {k: v for k, v in vars(args).items() if k not in ('output', 'compare', 'profile', 'verbose')},
+        'suites': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='bench_coverage_') as tmp:
+        fixtures = write_fixtures(args, Path(tmp))
+        results['sizes'] = fixtures['sizes']
+        sizes = fixtures['sizes']
+        print(
+            f"Fixtures: {sizes['tracts']} tracts, {sizes['bdc_rows']:,} BDC rows, "
+            f"{sizes['hexagon_rows']:,} hexagon rows ({sizes['hexagons']:,} hexagons), "
+            f"{sizes['assets']} assets (median of {args.repeat} runs)\n"
+        )
+
+        for name in args.suite:
+            try:
+                suite = SUITES[name](fixtures)
+            except ImportError as e:
+                results['suites'][name] = {'skipped': f"{type(e).__name__}: {e}"}
+                continue
+
+            # The scripts configure INFO logging at import
+            if not args.verbose:
+                logging.getLogger().setLevel(logging.WARNING)
+
+            out_dir = Path(tmp) / f"out_{name}"
+            out_dir.mkdir()
+            try:
+                results['suites'][name] = run_suite(suite, out_dir, args.repeat, profile_dir, prefix=name)
+            except Exception as e:
+                # Report the broken script and keep benchmarking the others
+                results['suites'][name] = {'failed': f"{type(e).__name__}: {e}"}
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    if baseline:
+        base_rev = baseline.get('revision', {}).get('commit') or 'unknown'
+        print(f"Compared with {args.compare} ({base_rev[:10]})")
+        if baseline.get('sizes') != results['sizes']:
+            print("Warning: baseline was run with different fixture sizes")
+    print_results(results, baseline)
+
+    if profile_dir:
+        print(f"\nProfiles written to {profile_dir}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
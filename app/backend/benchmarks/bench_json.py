@@ -0,0 +1,164 @@
+"""
+JSON Serialization Benchmark
+
+Compares the stdlib JSON paths the backend used before (FastAPI's
+jsonable_encoder + json.dumps for responses, json.dump(indent=2) for cache
+files) with the fast_json layer, on real pipeline output:
+
+- a deployment-pipeline-style payload built from the cached tract geometries
+  (app/frontend/public/data/tract-geometries/*.json)
+- the cached Florida state boundary (cache/tiger/state_florida.json)
+- the Miami-Dade census tract file and city boundaries
+- any extra files passed with --input (e.g. a saved /api/deployment/run-pipeline response)
+
+Usage:
+    python benchmarks/bench_json.py [--repeat N] [--input FILE ...] [--output results.json]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add backend and services directories to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+sys.path.insert(0, str(backend_dir / 'services'))
+
+from fastapi.encoders import jsonable_encoder
+
+import fast_json
+
+PROJECT_ROOT = backend_dir.parent.parent
+DATA_DIR = PROJECT_ROOT / 'app' / 'frontend' / 'public' / 'data'
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Run func repeat times; return median and best wall time in ms"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {'median_ms': statistics.median(timings), 'best_ms': min(timings)}
+
+
+def pipeline_payload() -> Dict[str, Any]:
+    """Deployment pipeline response shape built from cached tract geometries"""
+    features = [
+        json.loads(path.read_text())
+        for path in sorted((DATA_DIR / 'tract-geometries').glob('*.json'))
+    ]
+    ranked_sites = [
+        {
+            'rank': i + 1,
+            'geoid': f['properties'].get('GEOID'),
+            'impact_score': 100.0 - i * 0.75,
+            'wifi_zones': [
+                {'zone_id': z, 'lng': -81.0 + z * 0.01, 'lat': 28.0 + z * 0.01, 'within_bounds': True}
+                for z in range(1, 4)
+            ],
+        }
+        for i, f in enumerate(features)
+    ]
+    return {
+        'status': 'success',
+        'data': {
+            'ranked_sites': ranked_sites,
+            'tract_geometries': {'type': 'FeatureCollection', 'features': features},
+        },
+    }
+
+
+def load_payloads(extra_inputs: List[str]) -> Dict[str, Any]:
+    """Collect benchmark payloads that exist in this checkout"""
+    payloads = {}
+
+    if (DATA_DIR / 'tract-geometries').exists():
+        payloads['pipeline_response'] = pipeline_payload()
+
+    candidates = {
+        'florida_state_boundary': PROJECT_ROOT / 'cache' / 'tiger' / 'state_florida.json',
+        'miami_dade_tracts': DATA_DIR / 'census-tracts' / '12-121.json',
+        'madison_county_boundary': DATA_DIR / 'cities' / 'madison-county-fl.json',
+        'underserved_tracts': DATA_DIR / 'processed' / 'underserved_tracts.json',
+    }
+    for name, path in candidates.items():
+        if path.exists():
+            payloads[name] = json.loads(path.read_text())
+
+    for path in extra_inputs:
+        payloads[Path(path).stem] = json.loads(Path(path).read_text())
+
+    return payloads
+
+
+def bench_payload(payload: Any, repeat: int) -> Dict[str, Any]:
+    """Benchmark one payload with the old and new serialization paths"""
+    pretty = json.dumps(payload, indent=2)
+    compact = fast_json.dumps(payload)
+
+    return {
+        'size_bytes': {
+            'stdlib_indent2': len(pretty.encode('utf-8')),
+            'stdlib_default': len(json.dumps(payload).encode('utf-8')),
+            'fast_json': len(compact),
+        },
+        'serialize': {
+            'fastapi_default': time_call(lambda: json.dumps(jsonable_encoder(payload)).encode('utf-8'), repeat),
+            'stdlib_indent2': time_call(lambda: json.dumps(payload, indent=2), repeat),
+            'fast_json': time_call(lambda: fast_json.dumps(payload), repeat),
+        },
+        'parse': {
+            'stdlib_indent2': time_call(lambda: json.loads(pretty), repeat),
+            'fast_json': time_call(lambda: fast_json.loads(compact), repeat),
+        },
+    }
+
+
+def main():
+    """Run the benchmark and print a summary table"""
+    parser = argparse.ArgumentParser(description='Benchmark JSON serialization paths')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per measurement (default: 20)')
+    parser.add_argument('--input', nargs='*', default=[], help='Extra JSON files to benchmark')
+    parser.add_argument('--output', help='Write full results as JSON to this file')
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.input)
+    if not payloads:
+        print("No benchmark payloads found")
+        return
+
+    results = {'backend': fast_json.JSON_BACKEND, 'repeat': args.repeat, 'payloads': {}}
+
+    print(f"fast_json backend: {fast_json.JSON_BACKEND} (median of {args.repeat} runs)\n")
+    header = f"{'payload':<26}{'size KB':>18}{'serialize ms':>34}{'parse ms':>22}"
+    print(header)
+    print(f"{'':<26}{'indent2 -> fast':>18}{'fastapi / indent2 -> fast':>34}{'stdlib -> fast':>22}")
+    print("-" * len(header))
+
+    for name, payload in payloads.items():
+        result = bench_payload(payload, args.repeat)
+        results['payloads'][name] = result
+
+        size = result['size_bytes']
+        ser = result['serialize']
+        parse = result['parse']
+        print(
+            f"{name:<26}"
+            f"{size['stdlib_indent2'] / 1024:>8.0f} -> {size['fast_json'] / 1024:<7.0f}"
+            f"{ser['fastapi_default']['median_ms']:>12.1f} / {ser['stdlib_indent2']['median_ms']:.1f}"
+            f" -> {ser['fast_json']['median_ms']:<8.1f}"
+            f"{parse['stdlib_indent2']['median_ms']:>10.1f} -> {parse['fast_json']['median_ms']:<8.1f}"
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
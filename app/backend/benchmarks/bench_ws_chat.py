@@ -0,0 +1,233 @@
+"""
+WebSocket Chat Benchmark (in-process)
+
+Starts the FastAPI app under uvicorn inside this process, with the stub LLM
+backend and a synthetic deployment pipeline in place of Gemini and the
+TIGER/Census downloads, then opens N concurrent /ws/chat clients replaying a
+mix of greetings, tract, methodology, deployment and free-form questions.
+
+Exercises the real websocket handler, shared orchestrator, intent fast path,
+asyncio.to_thread pipeline calls, response caches and JSON streaming
+together, and reports messages/sec plus p50/p95/p99 latency for the first
+event, first explanation_delta, gaps between streamed steps and the final
+response. No server, API keys or network access are needed.
+
+Usage:
+    python benchmarks/bench_ws_chat.py [--sessions 10 50 200] [--messages 5]
+        [--llm-latency-ms 300] [--pipeline-ms 500] [--sites 25] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add backend directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from load_ws_chat import print_summary, run_load
+
+# Replayed message mix (city context: Madison County, Florida)
+MESSAGE_MIX = [
+    'hello',
+    'Tell me about tract 12079110200',
+    'How are scores calculated?',
+    'Where should we deploy WiFi in Madison County?',
+    'Compare 12079110200 and 12079110300',
+    'What should I look at first?',
+    'Which tracts in Madison County are worst?',
+    'thanks',
+]
+
+CITY = 'Madison County'
+COUNTY_FIPS = '12079'
+
+
+def synthetic_tracts(count: int) -> List[Dict[str, Any]]:
+    """Deterministic tract records for the benchmark county"""
+    return [
+        {
+            'geoid': f"{COUNTY_FIPS}{110100 + i * 100:06d}",
+            'population': 2000 + (i * 137) % 3000,
+            'poverty_rate': round(10 + (i * 7.3) % 30, 1),
+            'median_income': 30000 + (i * 911) % 40000,
+            'coverage_percent': round(40 + (i * 11.7) % 60, 1),
+            'total_assets': i % 6,
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_pipeline(sites: int, pipeline_ms: float):
+    """
+    Build stand-ins for the deployment pipeline entry points.
+
+    The pipeline sleeps pipeline_ms (it runs in a worker thread, like the
+    real one) and returns the same result shape as
+    run_deployment_pipeline_with_location.
+    """
+    tracts = synthetic_tracts(sites)
+    tiers = ['tier_1_critical', 'tier_2_high', 'tier_3_medium', 'tier_4_low']
+
+    def run_pipeline(location_name: str, location_type: str, state_name: str, slug: str) -> Dict[str, Any]:
+        time.sleep(pipeline_ms / 1000)
+        ranked = sorted(tracts, key=lambda t: t['coverage_percent'])
+        features = []
+        site_list = []
+        for i, tract in enumerate(ranked):
+            lng, lat = -83.4 + (i % 5) * 0.02, 30.4 + (i // 5) * 0.02
+            site_list.append({
+                **tract,
+                'impact_score': 100.0 - i * (100.0 / max(len(ranked), 1)),
+                'deployment_tier': tiers[min(i * len(tiers) // max(len(ranked), 1), len(tiers) - 1)],
+                'centroid': {'lng': lng + 0.01, 'lat': lat + 0.01},
+            })
+            features.append({
+                'type': 'Feature',
+                'properties': {'GEOID': tract['geoid']},
+                'geometry': {
+                    'type': 'Polygon',
+                    'coordinates': [[
+                        [lng, lat], [lng + 0.02, lat], [lng + 0.02, lat + 0.02], [lng, lat + 0.02], [lng, lat]
+                    ]],
+                },
+            })
+        return {
+            'sites': site_list,
+            'geometries': {'type': 'FeatureCollection', 'features': features},
+            'all_wifi_zones': {
+                s['geoid']: [{
+                    'zone_id': 1,
+                    **s['centroid'],
+                    'offset_from_centroid_km': 0,
+                    'within_bounds': True,
+                }]
+                for s in site_list
+            },
+        }
+
+    def warm_pipeline(location_name: str, location_type: str, state_name: str, slug: str) -> int:
+        time.sleep(pipeline_ms / 2000)
+        return len(tracts)
+
+    return run_pipeline, warm_pipeline
+
+
+def free_port() -> int:
+    """Pick an unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Start the app in-process and run one load test per concurrency level"""
+    import pandas as pd
+    import uvicorn
+
+    import agents.orchestrator as orchestrator_module
+    from agents.coverage_index import TractCoverageIndex
+    from main import app
+
+    # Stub the network-bound pipeline calls
+    run_pipeline, warm_pipeline = synthetic_pipeline(args.sites, args.pipeline_ms)
+    orchestrator_module.run_deployment_pipeline_with_location = run_pipeline
+    orchestrator_module.warm_deployment_pipeline = warm_pipeline
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(
+        app, host='127.0.0.1', port=port, log_level='warning', lifespan='on', ws_max_size=2 ** 24
+    ))
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        if serve_task.done():
+            serve_task.result()
+        await asyncio.sleep(0.05)
+
+    orchestrator = app.state.orchestrator
+    if orchestrator is None:
+        raise RuntimeError("Chat orchestrator failed to start")
+    if len(orchestrator.coverage_index) == 0:
+        # Same tracts the synthetic pipeline returns, for tract detail questions
+        orchestrator.coverage_index = TractCoverageIndex(pd.DataFrame([
+            {'GEOID': t['geoid'], 'coverage': t['coverage_percent'], **{
+                k: t[k] for k in ('population', 'poverty_rate', 'median_income')
+            }}
+            for t in synthetic_tracts(args.sites)
+        ]))
+
+    url = f"ws://127.0.0.1:{port}/ws/chat"
+    results = {
+        'llm_latency_ms': args.llm_latency_ms,
+        'pipeline_ms': args.pipeline_ms,
+        'sites': args.sites,
+        'runs': [],
+    }
+
+    try:
+        for sessions in args.sessions:
+            orchestrator.llm_cache.clear()
+            summary = await run_load(
+                url, sessions, args.messages, MESSAGE_MIX,
+                city=CITY, ramp_s=args.ramp_s, timeout_s=args.timeout_s
+            )
+            results['runs'].append(summary)
+
+            print()
+            print_summary(summary)
+            print(f"{'slowest messages (p95 ms)':<30}")
+            by_p95 = sorted(summary['by_message'].items(), key=lambda kv: -kv[1]['p95_ms'])
+            for message, stats in by_p95[:4]:
+                print(f"  {stats['p95_ms']:>8.0f}  {message}")
+
+        results['llm_cache'] = orchestrator.llm_cache.stats()
+        results['fast_path'] = orchestrator.fast_classifier.stats()
+    finally:
+        server.should_exit = True
+        await serve_task
+
+    return results
+
+
+def main():
+    """Parse arguments, configure the stub backend and run the benchmark"""
+    parser = argparse.ArgumentParser(description='Benchmark /ws/chat in-process under concurrency')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[10, 50, 200],
+                        help='Concurrency levels to run (default: 10 50 200)')
+    parser.add_argument('--messages', type=int, default=len(MESSAGE_MIX),
+                        help=f'Messages per session (default: {len(MESSAGE_MIX)})')
+    parser.add_argument('--llm-latency-ms', type=float, default=300, help='Stub LLM time to first token')
+    parser.add_argument('--llm-chunk-ms', type=float, default=20, help='Stub LLM delay between chunks')
+    parser.add_argument('--pipeline-ms', type=float, default=500, help='Synthetic pipeline run time')
+    parser.add_argument('--sites', type=int, default=25, help='Sites returned by the synthetic pipeline')
+    parser.add_argument('--ramp-s', type=float, default=1.0, help='Spread session starts over N seconds')
+    parser.add_argument('--timeout-s', type=float, default=120.0, help='Per-message timeout')
+    parser.add_argument('--output', help='Write full results as JSON to this file')
+    args = parser.parse_args()
+
+    # Must be set before the agents package is imported
+    os.environ['LLM_BACKEND'] = 'stub'
+    os.environ['LLM_STUB_LATENCY_MS'] = str(args.llm_latency_ms)
+    os.environ['LLM_STUB_CHUNK_MS'] = str(args.llm_chunk_ms)
+    os.environ.setdefault('LLM_CACHE_PATH', '')
+
+    print(
+        f"/ws/chat in-process: stub LLM {args.llm_latency_ms:.0f} ms, "
+        f"pipeline {args.pipeline_ms:.0f} ms, {args.sites} sites, {args.messages} messages/session"
+    )
+    results = asyncio.run(run_benchmark(args))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+WebSocket Chat Load Test
+
+Opens many concurrent /ws/chat sessions against a running backend, sends a
+mix of chat messages on each and measures end-to-end latency (time to first
+event, first explanation_delta and final_response), the gap between
+consecutive streamed steps, and overall throughput.
+
+Start the backend with the stub LLM so the numbers measure our own code
+rather than the Gemini API:
+
+    LLM_BACKEND=stub LLM_STUB_LATENCY_MS=300 uvicorn main:app --port 8000
+
+Usage:
+    python benchmarks/load_ws_chat.py [--url ws://localhost:8000/ws/chat]
+        [--sessions 200] [--messages 5] [--ramp-s 2] [--output results.json]
+
+Messages avoid deployment requests by default (those run the full pipeline
+and TIGER downloads); pass --message to use your own mix.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import websockets
+
+DEFAULT_URL = 'ws://localhost:8000/ws/chat'
+
+# Default message mix: fast-path intents, cached and uncached synthesis, Gemini classification
+DEFAULT_MESSAGES = [
+    'hello',
+    'How are scores calculated?',
+    'What data sources do you use?',
+    'Tell me about tract 12073000200',
+    'What should I look at first?',
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary(values: List[float]) -> Dict[str, float]:
+    """Mean and tail percentiles of latencies in ms"""
+    return {
+        'count': len(values),
+        'mean_ms': statistics.fmean(values) if values else 0.0,
+        'p50_ms': percentile(values, 50),
+        'p95_ms': percentile(values, 95),
+        'p99_ms': percentile(values, 99),
+        'max_ms': max(values) if values else 0.0,
+    }
+
+
+async def run_session(
+    url: str, session_id: int, messages: List[str], city: str, timeout_s: float
+) -> List[Dict[str, Any]]:
+    """
+    Run one chat session and time every message.
+
+    Args:
+        url: /ws/chat URL
+        session_id: Session number (selects the starting message)
+        messages: Message mix
+        city: City sent with every message
+        timeout_s: Per-message timeout
+
+    Returns:
+        One timing record per message
+    """
+    records = []
+
+    try:
+        async with websockets.connect(url, max_size=None, open_timeout=timeout_s) as ws:
+            for i in range(len(messages)):
+                message = messages[(session_id + i) % len(messages)]
+                record = {'message': message, 'ok': False}
+                record['step_gaps_ms'] = gaps = []
+                start = previous = time.perf_counter()
+
+                try:
+                    await ws.send(json.dumps({'message': message, 'city': city}))
+                    while True:
+                        event = json.loads(await asyncio.wait_for(ws.recv(), timeout_s))
+                        now = time.perf_counter()
+                        elapsed = (now - start) * 1000
+                        gaps.append((now - previous) * 1000)
+                        previous = now
+                        record.setdefault('first_event_ms', elapsed)
+
+                        if event.get('type') == 'explanation_delta':
+                            record.setdefault('first_delta_ms', elapsed)
+                        elif event.get('type') == 'final_response':
+                            record['total_ms'] = elapsed
+                            record['ok'] = True
+                            break
+                        elif event.get('type') == 'error':
+                            record['error'] = event.get('message', 'error')
+                            break
+                except Exception as e:
+                    record['error'] = f"{type(e).__name__}: {e}"
+
+                records.append(record)
+                if not record['ok']:
+                    break
+    except Exception as e:
+        records.append({'message': None, 'ok': False, 'error': f"connect: {type(e).__name__}: {e}"})
+
+    return records
+
+
+async def run_load(
+    url: str,
+    sessions: int,
+    messages_per_session: int,
+    messages: Optional[List[str]] = None,
+    city: str = 'Madison County',
+    ramp_s: float = 0.0,
+    timeout_s: float = 60.0
+) -> Dict[str, Any]:
+    """
+    Run concurrent chat sessions and summarize latency and throughput.
+
+    Args:
+        url: /ws/chat URL
+        sessions: Number of concurrent sessions
+        messages_per_session: Messages sent sequentially on each session
+        messages: Message mix (default: DEFAULT_MESSAGES)
+        city: City sent with every message
+        ramp_s: Spread session start times over this many seconds
+        timeout_s: Per-message timeout
+
+    Returns:
+        Summary with throughput, error counts, latency percentiles (overall
+        and per message) and step gap percentiles
+    """
+    mix = messages or DEFAULT_MESSAGES
+    plan = [mix[i % len(mix)] for i in range(messages_per_session)]
+
+    async def _delayed(session_id: int) -> List[Dict[str, Any]]:
+        if ramp_s > 0:
+            await asyncio.sleep(ramp_s * session_id / sessions)
+        return await run_session(url, session_id, plan, city, timeout_s)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_delayed(i) for i in range(sessions)))
+    wall_s = time.perf_counter() - start
+
+    records = [record for session in results for record in session]
+    ok = [r for r in records if r['ok']]
+    errors: Dict[str, int] = {}
+    for record in records:
+        if not record['ok']:
+            key = record.get('error', 'unknown').split(':')[0]
+            errors[key] = errors.get(key, 0) + 1
+
+    by_message: Dict[str, List[float]] = {}
+    for record in ok:
+        by_message.setdefault(record['message'], []).append(record['total_ms'])
+
+    return {
+        'url': url,
+        'sessions': sessions,
+        'messages_per_session': messages_per_session,
+        'wall_s': wall_s,
+        'completed': len(ok),
+        'failed': len(records) - len(ok),
+        'errors': errors,
+        'throughput_msgs_per_s': len(ok) / wall_s if wall_s else 0.0,
+        'first_event': latency_summary([r['first_event_ms'] for r in ok]),
+        'first_delta': latency_summary([r['first_delta_ms'] for r in ok if 'first_delta_ms' in r]),
+        'total': latency_summary([r['total_ms'] for r in ok]),
+        'step': latency_summary([gap for r in ok for gap in r['step_gaps_ms']]),
+        'by_message': {message: latency_summary(totals) for message, totals in by_message.items()},
+    }
+
+
+def print_summary(summary: Dict[str, Any]):
+    """Print a load test summary table"""
+    print(
+        f"{summary['sessions']} sessions x {summary['messages_per_session']} messages: "
+        f"{summary['completed']} ok, {summary['failed']} failed in {summary['wall_s']:.1f}s "
+        f"({summary['throughput_msgs_per_s']:.1f} msg/s)"
+    )
+    if summary['errors']:
+        print(f"errors: {summary['errors']}")
+
+    header = f"{'latency':<14}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+    print(header)
+    print("-" * len(header))
+    for name in ('first_event', 'first_delta', 'step', 'total'):
+        s = summary[name]
+        print(
+            f"{name:<14}{s['count']:>8}{s['mean_ms']:>10.0f}{s['p50_ms']:>10.0f}"
+            f"{s['p95_ms']:>10.0f}{s['p99_ms']:>10.0f}{s['max_ms']:>10.0f}"
+        )
+
+
+def main():
+    """Run the load test against a running backend"""
+    parser = argparse.ArgumentParser(description='Load test the /ws/chat websocket')
+    parser.add_argument('--url', default=DEFAULT_URL, help=f'WebSocket URL (default: {DEFAULT_URL})')
+    parser.add_argument('--sessions', type=int, default=200, help='Concurrent sessions (default: 200)')
+    parser.add_argument('--messages', type=int, default=5, help='Messages per session (default: 5)')
+    parser.add_argument('--message', action='append', help='Message to send (repeatable; default: built-in mix)')
+    parser.add_argument('--city', default='Madison County', help='City sent with each message')
+    parser.add_argument('--ramp-s', type=float, default=2.0, help='Spread session starts over N seconds')
+    parser.add_argument('--timeout-s', type=float, default=60.0, help='Per-message timeout')
+    parser.add_argument('--output', help='Write the summary as JSON to this file')
+    args = parser.parse_args()
+
+    summary = asyncio.run(run_load(
+        args.url, args.sessions, args.messages, args.message,
+        city=args.city, ramp_s=args.ramp_s, timeout_s=args.timeout_s
+    ))
+    print_summary(summary)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
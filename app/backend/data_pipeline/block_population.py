@@ -2,48 +2,58 @@
 Census Block Population Data Fetcher
 
 Fetches population counts for Census blocks from the Decennial Census API
+
+The PL endpoint can return every block in a county in a single request, so
+populations are fetched one county at a time and persisted to a local Parquet
+cache (2020 decennial counts never change). Tract lookups are then served from
+the county cache without further API calls.
 """
 
 import logging
+import os
+import sys
 import requests
-from typing import Dict, List, Optional
-from functools import lru_cache
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add services directory to path
+services_dir = Path(__file__).parent.parent / 'services'
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
+
+from metrics import record_cache_lookup, track_upstream
 
 logger = logging.getLogger(__name__)
 
 # Census Decennial 2020 API endpoint for block-level population
 CENSUS_BLOCK_API = "https://api.census.gov/data/2020/dec/pl"
 
+# Persistent cache directory (one Parquet file per county)
+BLOCK_POPULATION_CACHE_DIR = Path(__file__).parent.parent.parent.parent / 'cache' / 'block_population'
 
-@lru_cache(maxsize=100)
-def fetch_block_population_for_tract(tract_geoid: str) -> Dict[str, int]:
-    """
-    Fetch population counts for all Census blocks within a tract
+# In-process cache of county frames, keyed by (state_fips, county_fips)
+_county_frames: Dict[Tuple[str, str], pd.DataFrame] = {}
 
-    Args:
-        tract_geoid: 11-digit tract GEOID (SSCCCTTTTTT format)
-                    Example: "12047960202" (State 12, County 047, Tract 960202)
 
-    Returns:
-        Dictionary mapping full block GEOID (15 digits) -> population count
+def _county_cache_path(state_fips: str, county_fips: str) -> Path:
+    """Get Parquet cache file path for a county"""
+    return BLOCK_POPULATION_CACHE_DIR / f"blocks_{state_fips}{county_fips}.parquet"
 
-    Example:
-        {
-            "120479602021001": 250,
-            "120479602021002": 180,
-            ...
-        }
+
+def _request_county_block_population(state_fips: str, county_fips: str) -> Optional[pd.DataFrame]:
     """
-    if len(tract_geoid) != 11:
-        logger.error(f"Invalid tract GEOID length: {tract_geoid} (expected 11 digits)")
-        return {}
+    Request population for every block in a county from the Census API
 
-    # Parse tract GEOID components
-    state_fips = tract_geoid[:2]
-    county_fips = tract_geoid[2:5]
-    tract_code = tract_geoid[5:11]
+    Args:
+        state_fips: 2-digit state FIPS code
+        county_fips: 3-digit county FIPS code
 
-    logger.info(f"Fetching block population for tract {tract_geoid}...")
+    Returns:
+        DataFrame with block_geoid, tract_geoid and population columns,
+        or None if the request failed
+    """
+    logger.info(f"Fetching block population for county {state_fips}{county_fips}...")
 
     try:
         # Query parameters for Census API
@@ -51,80 +61,196 @@ def fetch_block_population_for_tract(tract_geoid: str) -> Dict[str, int]:
         params = {
             'get': 'P1_001N',  # Total population variable
             'for': 'block:*',  # All blocks
-            'in': f'state:{state_fips}+county:{county_fips}+tract:{tract_code}'
+            'in': f'state:{state_fips}+county:{county_fips}+tract:*'
         }
+        api_key = os.getenv('CENSUS_API_KEY')
+        if api_key:
+            params['key'] = api_key
 
-        response = requests.get(CENSUS_BLOCK_API, params=params, timeout=30)
-        response.raise_for_status()
+        with track_upstream('census', 'block_population'):
+            response = requests.get(CENSUS_BLOCK_API, params=params, timeout=60)
+            response.raise_for_status()
 
-        data = response.json()
+            data = response.json()
 
         # Parse response
         # Format: [["P1_001N", "state", "county", "tract", "block"], ["250", "12", "047", "960202", "1001"], ...]
         if len(data) < 2:
-            logger.warning(f"No block data returned for tract {tract_geoid}")
-            return {}
+            logger.warning(f"No block data returned for county {state_fips}{county_fips}")
+            return pd.DataFrame(columns=['block_geoid', 'tract_geoid', 'population'])
 
-        headers = data[0]
-        rows = data[1:]
+        df = pd.DataFrame(data[1:], columns=data[0])
 
-        # Find column indices
-        try:
-            pop_idx = headers.index('P1_001N')
-            state_idx = headers.index('state')
-            county_idx = headers.index('county')
-            tract_idx = headers.index('tract')
-            block_idx = headers.index('block')
-        except ValueError as e:
-            logger.error(f"Missing expected column in Census API response: {e}")
-            return {}
-
-        # Build GEOID -> population map
-        block_population = {}
-        for row in rows:
-            try:
-                population = int(row[pop_idx])
-                state = row[state_idx]
-                county = row[county_idx]
-                tract = row[tract_idx]
-                block = row[block_idx]
-
-                # Construct full 15-digit block GEOID
-                # Format: SSCCCTTTTTTBBBB
-                full_geoid = f"{state}{county}{tract}{block}"
-
-                block_population[full_geoid] = population
-
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Skipping invalid row: {row} - {e}")
-                continue
-
-        logger.info(f"✓ Fetched population for {len(block_population)} blocks in tract {tract_geoid}")
-        return block_population
+        missing = {'P1_001N', 'state', 'county', 'tract', 'block'} - set(df.columns)
+        if missing:
+            logger.error(f"Missing expected column in Census API response: {sorted(missing)}")
+            return None
+
+        # Construct full 15-digit block GEOID
+        # Format: SSCCCTTTTTTBBBB
+        tract_geoid = df['state'] + df['county'] + df['tract']
+        population = pd.to_numeric(df['P1_001N'], errors='coerce')
+
+        result = pd.DataFrame({
+            'block_geoid': tract_geoid + df['block'],
+            'tract_geoid': tract_geoid,
+            'population': population,
+        })
+
+        invalid = result['population'].isna()
+        if invalid.any():
+            logger.warning(f"Skipping {int(invalid.sum())} blocks with invalid population")
+            result = result[~invalid]
+
+        result['population'] = result['population'].astype('int64')
+        result = result.reset_index(drop=True)
+
+        logger.info(f"✓ Fetched population for {len(result)} blocks in county {state_fips}{county_fips}")
+        return result
 
     except requests.RequestException as e:
         logger.error(f"Failed to fetch block population from Census API: {e}")
-        return {}
+        return None
     except Exception as e:
         logger.error(f"Unexpected error fetching block population: {e}")
+        return None
+
+
+def cached_county_block_population(state_fips: str, county_fips: str) -> Optional[pd.DataFrame]:
+    """
+    Get a county's block populations from memory or the Parquet cache
+
+    Never calls the Census API, so it is safe on the request path.
+
+    Args:
+        state_fips: 2-digit state FIPS code
+        county_fips: 3-digit county FIPS code
+
+    Returns:
+        DataFrame with block_geoid, tract_geoid and population columns,
+        or None if the county has not been cached
+    """
+    key = (state_fips, county_fips)
+    record_cache_lookup('block_population_memory', key in _county_frames)
+    if key in _county_frames:
+        return _county_frames[key]
+
+    cache_file = _county_cache_path(state_fips, county_fips)
+    record_cache_lookup('block_population_parquet', cache_file.exists())
+    if cache_file.exists():
+        try:
+            frame = pd.read_parquet(cache_file)
+            _county_frames[key] = frame
+            logger.info(f"✓ Loaded {len(frame)} blocks for county {state_fips}{county_fips} from cache")
+            return frame
+        except Exception as e:
+            logger.warning(f"Failed to read block population cache {cache_file}: {e}")
+
+    return None
+
+
+def load_county_block_population(state_fips: str, county_fips: str) -> pd.DataFrame:
+    """
+    Load population for every block in a county
+
+    Served from memory, then from the Parquet cache, and only fetched from the
+    Census API when neither has the county. Failed fetches are not cached.
+
+    Args:
+        state_fips: 2-digit state FIPS code
+        county_fips: 3-digit county FIPS code
+
+    Returns:
+        DataFrame with block_geoid, tract_geoid and population columns.
+        Callers must treat the returned frame as read-only.
+    """
+    frame = cached_county_block_population(state_fips, county_fips)
+    if frame is not None:
+        return frame
+
+    frame = _request_county_block_population(state_fips, county_fips)
+    if frame is None:
+        return pd.DataFrame(columns=['block_geoid', 'tract_geoid', 'population'])
+
+    # Cache the result (write to a temp file first so readers never see a partial file)
+    cache_file = _county_cache_path(state_fips, county_fips)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.parquet.tmp')
+        frame.to_parquet(tmp_file, index=False)
+        tmp_file.replace(cache_file)
+    except Exception as e:
+        logger.warning(f"Failed to cache block population: {e}")
+
+    _county_frames[(state_fips, county_fips)] = frame
+    return frame
+
+
+def has_cached_block_population() -> bool:
+    """Check whether any county's block populations are cached"""
+    if _county_frames:
+        return True
+    return BLOCK_POPULATION_CACHE_DIR.is_dir() and any(BLOCK_POPULATION_CACHE_DIR.glob('blocks_*.parquet'))
+
+
+def fetch_block_population_for_tract(tract_geoid: str) -> Dict[str, int]:
+    """
+    Fetch population counts for all Census blocks within a tract
+
+    Args:
+        tract_geoid: 11-digit tract GEOID (SSCCCTTTTTT format)
+                    Example: "12047960202" (State 12, County 047, Tract 960202)
+
+    Returns:
+        Dictionary mapping full block GEOID (15 digits) -> population count
+
+    Example:
+        {
+            "120479602021001": 250,
+            "120479602021002": 180,
+            ...
+        }
+    """
+    if len(tract_geoid) != 11:
+        logger.error(f"Invalid tract GEOID length: {tract_geoid} (expected 11 digits)")
         return {}
 
+    county_blocks = load_county_block_population(tract_geoid[:2], tract_geoid[2:5])
+    tract_blocks = county_blocks[county_blocks['tract_geoid'] == tract_geoid]
+
+    return dict(zip(tract_blocks['block_geoid'].tolist(), tract_blocks['population'].tolist()))
+
 
 def fetch_block_population_for_tracts(tract_geoids: List[str]) -> Dict[str, int]:
     """
     Fetch population for blocks across multiple tracts
 
+    Tracts are grouped by county so each county costs at most one API request.
+
     Args:
         tract_geoids: List of 11-digit tract GEOIDs
 
     Returns:
         Dictionary mapping block GEOID -> population for all tracts
     """
+    tracts_by_county: Dict[Tuple[str, str], List[str]] = {}
+    for tract_geoid in tract_geoids:
+        if len(tract_geoid) != 11:
+            logger.error(f"Invalid tract GEOID length: {tract_geoid} (expected 11 digits)")
+            continue
+        tracts_by_county.setdefault((tract_geoid[:2], tract_geoid[2:5]), []).append(tract_geoid)
+
     all_block_population = {}
 
-    for tract_geoid in tract_geoids:
-        tract_blocks = fetch_block_population_for_tract(tract_geoid)
-        all_block_population.update(tract_blocks)
+    for (state_fips, county_fips), county_tracts in tracts_by_county.items():
+        county_blocks = load_county_block_population(state_fips, county_fips)
+        tract_blocks = county_blocks[county_blocks['tract_geoid'].isin(county_tracts)]
+        all_block_population.update(
+            zip(tract_blocks['block_geoid'].tolist(), tract_blocks['population'].tolist())
+        )
 
-    logger.info(f"✓ Fetched population for {len(all_block_population)} total blocks across {len(tract_geoids)} tracts")
+    logger.info(
+        f"✓ Fetched population for {len(all_block_population)} total blocks across "
+        f"{len(tract_geoids)} tracts ({len(tracts_by_county)} counties)"
+    )
     return all_block_population
@@ -0,0 +1,218 @@
+"""
+Census Block Store
+
+Compact on-disk store for Census block geometries, built once from a state
+TIGER tabblock20 shapefile and memory-mapped at runtime so that blocks can be
+read lazily per tract instead of parsing the whole shapefile on startup.
+
+Store layout (one directory):
+- geometry.wkb: WKB geometries of all blocks, concatenated and sorted by GEOID
+- wkb_offsets.npy: byte offset of each geometry in geometry.wkb (n_blocks + 1)
+- block_geoids.npy: 15-digit block GEOIDs (fixed-width bytes)
+- land_area.npy / water_area.npy: block land and water areas in m²
+- tract_geoids.npy: sorted unique 11-digit tract GEOIDs
+- tract_rows.npy: first block row of each tract (n_tracts + 1)
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import shapefile  # pyshp library
+import shapely
+from shapely.geometry import shape
+
+logger = logging.getLogger(__name__)
+
+STORE_FILES = (
+    'geometry.wkb',
+    'wkb_offsets.npy',
+    'block_geoids.npy',
+    'land_area.npy',
+    'water_area.npy',
+    'tract_geoids.npy',
+    'tract_rows.npy',
+)
+
+
+def default_store_dir(shapefile_path: Path) -> Path:
+    """
+    Get the default store directory for a block shapefile
+
+    Args:
+        shapefile_path: Path to Census block shapefile (.shp)
+
+    Returns:
+        Sibling directory named after the shapefile (e.g. tl_2024_12_tabblock20.blockstore)
+    """
+    shapefile_path = Path(shapefile_path)
+    return shapefile_path.parent / f"{shapefile_path.stem}.blockstore"
+
+
+def build_block_store(shapefile_path: str, store_dir: Optional[str] = None) -> Path:
+    """
+    Convert a Census block shapefile into a memory-mappable block store
+
+    Args:
+        shapefile_path: Path to Census block shapefile (.shp)
+        store_dir: Output directory (defaults to default_store_dir(shapefile_path))
+
+    Returns:
+        Path to the store directory
+    """
+    shapefile_path = Path(shapefile_path)
+    if not shapefile_path.exists():
+        raise FileNotFoundError(f"Shapefile not found: {shapefile_path}")
+
+    store_dir = Path(store_dir) if store_dir else default_store_dir(shapefile_path)
+
+    logger.info(f"Building Census block store from {shapefile_path}")
+
+    geoids: List[str] = []
+    wkbs: List[bytes] = []
+    land_areas: List[float] = []
+    water_areas: List[float] = []
+
+    # Remove .shp extension if present
+    shp_path_str = str(shapefile_path).replace('.shp', '')
+
+    with shapefile.Reader(shp_path_str) as sf:
+        # Get field names
+        field_names = [field[0] for field in sf.fields[1:]]  # Skip deletion flag field
+        total_records = len(sf)
+        logger.info(f"Total records in shapefile: {total_records:,}")
+
+        for idx, shape_record in enumerate(sf.iterShapeRecords()):
+            # Log progress every 50,000 records
+            if idx > 0 and idx % 50000 == 0:
+                logger.info(
+                    f"  Progress: {idx:,}/{total_records:,} records processed "
+                    f"({(idx/total_records)*100:.1f}%)"
+                )
+
+            record = dict(zip(field_names, shape_record.record))
+            geoid = record.get('GEOID20')
+
+            if not geoid or len(geoid) != 15:
+                continue
+
+            geom = shape(shape_record.shape.__geo_interface__)
+
+            geoids.append(geoid)
+            wkbs.append(geom.wkb)
+            land_areas.append(float(record.get('ALAND20', 0) or 0))
+            water_areas.append(float(record.get('AWATER20', 0) or 0))
+
+    # Sort blocks by GEOID so every tract occupies a contiguous row range
+    block_geoids = np.array(geoids, dtype='S15')
+    order = np.argsort(block_geoids, kind='stable')
+    block_geoids = block_geoids[order]
+
+    lengths = np.fromiter((len(wkbs[i]) for i in order), dtype=np.int64, count=len(order))
+    wkb_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=wkb_offsets[1:])
+
+    tract_of_block = block_geoids.astype('S11')
+    tract_geoids, tract_starts = np.unique(tract_of_block, return_index=True)
+    tract_rows = np.append(tract_starts, len(block_geoids)).astype(np.int64)
+
+    # Write into a temporary directory, then swap it in
+    tmp_dir = store_dir.with_name(store_dir.name + '.tmp')
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    with open(tmp_dir / 'geometry.wkb', 'wb') as f:
+        for i in order:
+            f.write(wkbs[i])
+
+    np.save(tmp_dir / 'wkb_offsets.npy', wkb_offsets)
+    np.save(tmp_dir / 'block_geoids.npy', block_geoids)
+    np.save(tmp_dir / 'land_area.npy', np.asarray(land_areas, dtype=np.float64)[order])
+    np.save(tmp_dir / 'water_area.npy', np.asarray(water_areas, dtype=np.float64)[order])
+    np.save(tmp_dir / 'tract_geoids.npy', tract_geoids)
+    np.save(tmp_dir / 'tract_rows.npy', tract_rows)
+
+    if store_dir.exists():
+        shutil.rmtree(store_dir)
+    tmp_dir.rename(store_dir)
+
+    logger.info(
+        f"✓ Built block store with {len(block_geoids):,} blocks across "
+        f"{len(tract_geoids):,} tracts at {store_dir}"
+    )
+    return store_dir
+
+
+class BlockStore:
+    """Memory-mapped reader for a Census block store"""
+
+    def __init__(self, store_dir: str):
+        """
+        Open a block store
+
+        Args:
+            store_dir: Directory created by build_block_store
+        """
+        self.store_dir = Path(store_dir)
+        if not self.exists(self.store_dir):
+            raise FileNotFoundError(f"Block store not found: {store_dir}")
+
+        # Arrays are memory-mapped; pages are only read when a tract is touched
+        self._wkb = np.memmap(self.store_dir / 'geometry.wkb', dtype=np.uint8, mode='r')
+        self._wkb_offsets = np.load(self.store_dir / 'wkb_offsets.npy', mmap_mode='r')
+        self._block_geoids = np.load(self.store_dir / 'block_geoids.npy', mmap_mode='r')
+        self._land_area = np.load(self.store_dir / 'land_area.npy', mmap_mode='r')
+        self._water_area = np.load(self.store_dir / 'water_area.npy', mmap_mode='r')
+
+        # The tract index is small (a few thousand entries) so keep it in memory
+        tract_geoids = np.load(self.store_dir / 'tract_geoids.npy')
+        self._tract_rows = np.load(self.store_dir / 'tract_rows.npy')
+        self._tract_index: Dict[str, int] = {
+            geoid.decode(): i for i, geoid in enumerate(tract_geoids)
+        }
+
+        logger.info(
+            f"Opened block store {self.store_dir} "
+            f"({len(self._block_geoids):,} blocks, {len(self._tract_index):,} tracts)"
+        )
+
+    @staticmethod
+    def exists(store_dir: Path) -> bool:
+        """Check whether a complete block store exists at store_dir"""
+        store_dir = Path(store_dir)
+        return all((store_dir / name).exists() for name in STORE_FILES)
+
+    def tract_geoids(self) -> List[str]:
+        """Get all tract GEOIDs in the store"""
+        return list(self._tract_index.keys())
+
+    def read_tract(self, tract_geoid: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Read all blocks of a tract
+
+        Args:
+            tract_geoid: 11-digit tract GEOID
+
+        Returns:
+            Dict of parallel arrays (geoids, geometries, land_area_m2, water_area_m2),
+            or None if the tract is not in the store
+        """
+        i = self._tract_index.get(tract_geoid)
+        if i is None:
+            return None
+
+        start, end = int(self._tract_rows[i]), int(self._tract_rows[i + 1])
+        offsets = np.asarray(self._wkb_offsets[start:end + 1])
+        chunk = self._wkb[offsets[0]:offsets[-1]].tobytes()
+        relative = offsets - offsets[0]
+        wkbs = [chunk[relative[j]:relative[j + 1]] for j in range(end - start)]
+
+        return {
+            'geoids': np.asarray(self._block_geoids[start:end]).astype(str),
+            'geometries': shapely.from_wkb(wkbs),
+            'land_area_m2': np.asarray(self._land_area[start:end]),
+            'water_area_m2': np.asarray(self._water_area[start:end]),
+        }
@@ -13,6 +13,7 @@ The CSV has columns:
 
 import logging
 import os
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -21,12 +22,22 @@ import geopandas as gpd
 import pandas as pd
 import requests
 from shapely.geometry import Point
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.block_population import load_county_block_population
+from data_pipeline.population_coverage import calculate_population_weighted_coverage
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Population-weighted coverage needs block populations from the Census API
+# (one request per county, cached on disk); off by default so builds stay offline
+POPULATION_WEIGHTED_COVERAGE = os.getenv("POPULATION_WEIGHTED_COVERAGE", "false").lower() == "true"
+
 ASSET_FILTERS = {
     "hospitals": '["amenity"="hospital"]',
     "schools": '["amenity"="school"]',
@@ -311,6 +322,50 @@ def calculate_coverage_percentage(
     return result
 
 
+def add_population_weighted_coverage(
+    tracts_gdf: gpd.GeoDataFrame, fcc_df: pd.DataFrame
+) -> gpd.GeoDataFrame:
+    """
+    Attach population-weighted coverage columns to tracts
+
+    Block populations are loaded per county from the Decennial Census
+    (cached on disk after the first run).
+
+    Args:
+        tracts_gdf: Census tracts with GEOID column
+        fcc_df: FCC provider-level data
+
+    Returns:
+        GeoDataFrame with total_population, served_population_{tier}
+        and pop_coverage_percent_{tier} columns
+    """
+    county_geoids = sorted(tracts_gdf["GEOID"].astype(str).str[:5].unique())
+    logger.info(f"Loading block populations for {len(county_geoids)} counties...")
+
+    block_frames = [
+        load_county_block_population(county_geoid[:2], county_geoid[2:])
+        for county_geoid in county_geoids
+    ]
+    block_frames = [frame for frame in block_frames if not frame.empty]
+    if not block_frames:
+        logger.warning("No block populations available; skipping population-weighted coverage.")
+        return tracts_gdf
+    loaded_counties = {frame["tract_geoid"].iloc[0][:5] for frame in block_frames}
+
+    block_population = pd.concat(block_frames, ignore_index=True)
+    pop_coverage = calculate_population_weighted_coverage(fcc_df, block_population)
+
+    result = tracts_gdf.merge(
+        pop_coverage.rename(columns={"tract_geoid": "GEOID"}), on="GEOID", how="left"
+    )
+    pop_cols = [col for col in pop_coverage.columns if col != "tract_geoid"]
+    # Tracts in counties whose populations failed to load stay empty rather than 0
+    loaded = result["GEOID"].astype(str).str[:5].isin(loaded_counties)
+    result.loc[loaded, pop_cols] = result.loc[loaded, pop_cols].fillna(0)
+
+    return result
+
+
 def load_census_tracts(state_fips: str = "13") -> gpd.GeoDataFrame:
     """
     Load census tracts from US Census
@@ -595,6 +650,12 @@ def main():
     # Step 4: Calculate coverage percentages
     tracts_with_coverage = calculate_coverage_percentage(tract_coverage, tracts_gdf)
 
+    # Step 4b: Population-weighted coverage from block populations (opt-in)
+    if POPULATION_WEIGHTED_COVERAGE:
+        tracts_with_coverage = add_population_weighted_coverage(tracts_with_coverage, fcc_data)
+    else:
+        logger.info("Skipping population-weighted coverage (set POPULATION_WEIGHTED_COVERAGE=true to enable)")
+
     # Step 5: Enrich with asset counts
     asset_labels = list(ASSET_FILTERS.keys())
     asset_columns = [f"asset_count_{label}" for label in asset_labels]
@@ -643,6 +704,8 @@ def main():
         ["GEOID", "coverage_percent_25_3", *asset_columns, *census_columns]
     ].copy()
     coverage_df = coverage_df.rename(columns={"coverage_percent_25_3": "coverage"})
+    if "pop_coverage_percent_25_3" in tracts_with_coverage.columns:
+        coverage_df["population_coverage"] = tracts_with_coverage["pop_coverage_percent_25_3"]
 
     coverage_df.to_csv(csv_file, index=False)
     logger.info(f"Saved CSV to: {csv_file}")
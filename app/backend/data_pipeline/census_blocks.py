@@ -5,6 +5,10 @@ Loads Census block shapefiles and provides utilities for:
 - Filtering blocks within a tract
 - Calculating block centroids
 - Indexing blocks by tract GEOID
+
+When a block store has been built from the shapefile (see block_store.py and
+scripts/build_census_block_store.py), blocks are read lazily per tract from the
+memory-mapped store instead of loading the whole shapefile.
 """
 
 import logging
@@ -12,35 +16,54 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import shapefile  # pyshp library
 from shapely.geometry import shape, Point, Polygon
-from functools import lru_cache
+
+from .block_store import BlockStore, default_store_dir
+from .tract_blocks import TractBlocks
 
 logger = logging.getLogger(__name__)
 
+# Florida tabblock20 shapefile (its block store is built alongside it)
+DEFAULT_SHAPEFILE_PATH = (
+    Path(__file__).parent.parent.parent.parent / "data/tl_2024_12_tabblock20/tl_2024_12_tabblock20.shp"
+)
+
 
 class CensusBlockLoader:
     """Loads and indexes Census block shapefiles for efficient lookup"""
 
-    def __init__(self, shapefile_path: str):
+    def __init__(self, shapefile_path: str, store_dir: Optional[str] = None):
         """
         Initialize block loader with path to shapefile
 
         Args:
             shapefile_path: Path to Census block shapefile (.shp)
+            store_dir: Optional block store directory (defaults to the
+                      store built next to the shapefile, if any)
         """
         self.shapefile_path = Path(shapefile_path)
-        if not self.shapefile_path.exists():
+        self.store_dir = Path(store_dir) if store_dir else default_store_dir(self.shapefile_path)
+
+        self._store: Optional[BlockStore] = None
+        if BlockStore.exists(self.store_dir):
+            self._store = BlockStore(self.store_dir)
+        elif not self.shapefile_path.exists():
             raise FileNotFoundError(f"Shapefile not found: {shapefile_path}")
+        else:
+            logger.warning(
+                f"No block store at {self.store_dir}; falling back to full shapefile load. "
+                "Run scripts/build_census_block_store.py to build one."
+            )
 
         logger.info(f"Initializing Census block loader from {shapefile_path}")
-        self._blocks_by_tract = None  # Lazy load
+        self._blocks_by_tract = None  # Lazy load (shapefile fallback)
+        self._tract_blocks: Dict[str, TractBlocks] = {}  # Tracts read from the store
 
-    @lru_cache(maxsize=1)
-    def _load_blocks(self) -> Dict[str, List[Dict]]:
+    def _load_blocks(self) -> Dict[str, TractBlocks]:
         """
         Load all blocks from shapefile and index by tract GEOID
 
         Returns:
-            Dict mapping tract GEOID (11 digits) -> List of block features
+            Dict mapping tract GEOID (11 digits) -> TractBlocks
         """
         logger.info("Loading Census blocks from shapefile...")
         blocks_by_tract = {}
@@ -81,37 +104,57 @@ class CensusBlockLoader:
                 geom_dict = shape_record.shape.__geo_interface__
                 geom = shape(geom_dict)
 
-                # Store block data
-                block_data = {
-                    'geoid': geoid,
-                    'geometry': geom,
-                    'land_area_m2': record.get('ALAND20', 0),
-                    'water_area_m2': record.get('AWATER20', 0),
-                }
-
+                # Store block data as per-tract columns
                 if tract_geoid not in blocks_by_tract:
-                    blocks_by_tract[tract_geoid] = []
+                    blocks_by_tract[tract_geoid] = ([], [], [], [])
 
-                blocks_by_tract[tract_geoid].append(block_data)
+                geoids, geoms, land, water = blocks_by_tract[tract_geoid]
+                geoids.append(geoid)
+                geoms.append(geom)
+                land.append(record.get('ALAND20', 0) or 0)
+                water.append(record.get('AWATER20', 0) or 0)
                 total_blocks += 1
 
         logger.info(f"✓ Loaded {total_blocks} blocks across {len(blocks_by_tract)} tracts")
-        return blocks_by_tract
+        return {
+            tract_geoid: TractBlocks(*columns)
+            for tract_geoid, columns in blocks_by_tract.items()
+        }
 
-    def get_blocks_for_tract(self, tract_geoid: str) -> List[Dict]:
+    def get_tract_blocks(self, tract_geoid: str) -> TractBlocks:
         """
-        Get all Census blocks within a tract
+        Get all Census blocks within a tract as arrays
 
         Args:
             tract_geoid: 11-digit tract GEOID
 
         Returns:
-            List of block dictionaries with geometry and attributes
+            TractBlocks (shared cached instance; do not modify)
         """
+        if self._store is not None:
+            if tract_geoid not in self._tract_blocks:
+                arrays = self._store.read_tract(tract_geoid)
+                self._tract_blocks[tract_geoid] = (
+                    TractBlocks(**arrays) if arrays is not None else TractBlocks.empty()
+                )
+            return self._tract_blocks[tract_geoid]
+
         if self._blocks_by_tract is None:
             self._blocks_by_tract = self._load_blocks()
 
-        return self._blocks_by_tract.get(tract_geoid, [])
+        return self._blocks_by_tract.get(tract_geoid) or TractBlocks.empty()
+
+    def get_blocks_for_tract(self, tract_geoid: str) -> List[Dict]:
+        """
+        Get all Census blocks within a tract
+
+        Args:
+            tract_geoid: 11-digit tract GEOID
+
+        Returns:
+            List of block dictionaries with geometry, attributes and centroid
+        """
+        return self.get_tract_blocks(tract_geoid).to_records()
 
     def get_blocks_within_geometry(self, tract_geoid: str, tract_geometry) -> List[Dict]:
         """
@@ -124,21 +167,7 @@ class CensusBlockLoader:
         Returns:
             List of blocks that intersect with the tract boundary
         """
-        blocks = self.get_blocks_for_tract(tract_geoid)
-
-        # Filter by spatial intersection
-        filtered_blocks = []
-        for block in blocks:
-            if tract_geometry.intersects(block['geometry']):
-                # Add centroid for convenience
-                centroid = block['geometry'].centroid
-                block['centroid'] = {
-                    'lng': centroid.x,
-                    'lat': centroid.y
-                }
-                filtered_blocks.append(block)
-
-        return filtered_blocks
+        return self.get_tract_blocks(tract_geoid).intersecting(tract_geometry).to_records()
 
 
 # Global singleton instance (lazy-loaded)
@@ -150,7 +179,8 @@ def get_block_loader(shapefile_path: Optional[str] = None) -> CensusBlockLoader:
     Get or create the global Census block loader instance
 
     Args:
-        shapefile_path: Path to shapefile (required on first call)
+        shapefile_path: Path to shapefile (defaults to the Florida tabblock20 shapefile;
+                       its block store is used when present)
 
     Returns:
         CensusBlockLoader instance
@@ -159,9 +189,7 @@ def get_block_loader(shapefile_path: Optional[str] = None) -> CensusBlockLoader:
 
     if _block_loader is None:
         if shapefile_path is None:
-            # Default path
-            project_root = Path(__file__).parent.parent.parent.parent
-            shapefile_path = str(project_root / "data/tl_2024_12_tabblock20/tl_2024_12_tabblock20.shp")
+            shapefile_path = str(DEFAULT_SHAPEFILE_PATH)
 
         _block_loader = CensusBlockLoader(shapefile_path)
 
@@ -1,31 +1,81 @@
 """
 Fetch Census Tract Geometry by GEOID
 
-This module fetches individual census tract geometries from the Census Bureau
-TIGERweb API using GEOID as the lookup key.
+This module fetches census tract geometries using GEOID as the lookup key,
+from local TIGER/Line shapefiles when present and otherwise from the Census
+Bureau TIGERweb API, either one tract at a time or in bulk with batched
+`GEOID IN (...)` queries.
 """
 
 import requests
-import json
-from typing import Optional, Dict
+from requests.adapters import HTTPAdapter
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
 import logging
 from pathlib import Path
+import pandas as pd
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Add services directory to path
+services_dir = Path(__file__).parent.parent / 'services'
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
+
+import fast_json
+from geometry_cache import GeometryCache, get_geometry_cache
+from tiger_local import LocalTIGERSource, get_local_tiger_source
+
 
 class TractGeometryFetcher:
     """Fetch census tract geometries from Census Bureau TIGERweb API"""
 
-    def __init__(self, cache_dir: Optional[Path] = None):
+    # GEOIDs per `GEOID IN (...)` query (keeps request URLs well under server limits)
+    BATCH_SIZE = 100
+
+    # Records requested per page; TIGERweb caps responses at its maxRecordCount
+    PAGE_SIZE = 1000
+
+    # Concurrent batch requests (also the HTTP connection pool size)
+    MAX_WORKERS = 4
+
+    # Attempts per page before the whole batch is given up
+    PAGE_ATTEMPTS = 3
+
+    # Seconds to wait before a retry (multiplied by the attempt number)
+    RETRY_WAIT_S = 1.0
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        cache: Optional[GeometryCache] = None,
+        local_source: Optional[LocalTIGERSource] = None
+    ):
+        """
+        Initialize tract geometry fetcher
+
+        Args:
+            cache_dir: Legacy per-GEOID JSON cache directory, imported into the geometry cache on miss
+            cache: Geometry cache (default: shared global cache)
+            local_source: Local TIGER/Line source (default: global source, if shapefiles exist)
+        """
         self.api_base = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_Current/MapServer/8/query"
 
-        # Cache directory for storing geometries
+        # Pooled session shared by all requests from this fetcher
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_WORKERS)
+        self.session.mount("https://", adapter)
+
+        # Geometries are stored in the shared geometry cache
+        self.cache = cache or get_geometry_cache()
+        self.local = local_source or get_local_tiger_source()
+
         if cache_dir is None:
             cache_dir = Path(__file__).parent.parent.parent / "frontend/public/data/tract-geometries"
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def fetch_geometry_by_geoid(self, geoid: str, use_cache: bool = True) -> Optional[Dict]:
         """
@@ -38,7 +88,14 @@ class TractGeometryFetcher:
         Returns:
             GeoJSON feature with tract geometry, or None if not found
         """
-        # Check cache first
+        # Local TIGER/Line data first
+        if self.local:
+            feature = self.local.get_tract(geoid)
+            if feature:
+                feature["properties"]["geoid"] = geoid
+                return feature
+
+        # Check cache
         if use_cache:
             cached = self._load_from_cache(geoid)
             if cached:
@@ -57,7 +114,7 @@ class TractGeometryFetcher:
         }
 
         try:
-            response = requests.get(self.api_base, params=params, timeout=30)
+            response = self.session.get(self.api_base, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -82,6 +139,159 @@ class TractGeometryFetcher:
             logger.error(f"Error fetching geometry for {geoid}: {e}")
             return None
 
+    def _fetch_batch(self, geoids: List[str]) -> List[Dict]:
+        """
+        Fetch one batch of tracts with a `GEOID IN (...)` query, following pages
+
+        Each page is retried up to PAGE_ATTEMPTS times. If a page still fails,
+        the error is raised rather than returning the pages read so far, so a
+        truncated batch is never mistaken for a complete one.
+
+        Args:
+            geoids: GEOIDs in this batch (at most BATCH_SIZE)
+
+        Returns:
+            List of GeoJSON features returned for the batch
+
+        Raises:
+            requests.RequestException or ValueError if a page cannot be fetched
+        """
+        id_list = ",".join(f"'{geoid}'" for geoid in geoids)
+        features = []
+        offset = 0
+
+        while True:
+            params = {
+                "where": f"GEOID IN ({id_list})",
+                "outFields": "*",
+                "f": "geojson",
+                "returnGeometry": "true",
+                "spatialRel": "esriSpatialRelIntersects",
+                "orderByFields": "GEOID",
+                "resultOffset": offset,
+                "resultRecordCount": self.PAGE_SIZE,
+            }
+
+            for attempt in range(1, self.PAGE_ATTEMPTS + 1):
+                try:
+                    response = self.session.get(self.api_base, params=params, timeout=60)
+                    response.raise_for_status()
+                    data = response.json()
+                    break
+                except (requests.RequestException, ValueError) as e:
+                    if attempt == self.PAGE_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        f"Attempt {attempt}/{self.PAGE_ATTEMPTS} failed for batch of "
+                        f"{len(geoids)} geometries at offset {offset}: {e}"
+                    )
+                    time.sleep(self.RETRY_WAIT_S * attempt)
+
+            page = data.get("features") or []
+            features.extend(page)
+
+            # ArcGIS flags truncated results either at the top level or under properties
+            exceeded = data.get("exceededTransferLimit") or (
+                data.get("properties") or {}
+            ).get("exceededTransferLimit")
+            if not exceeded or not page:
+                break
+            offset += len(page)
+
+        return features
+
+    def _fetch_batch_or_none(self, geoids: List[str]) -> Optional[List[Dict]]:
+        """
+        Fetch one batch, logging failures instead of raising
+
+        Args:
+            geoids: GEOIDs in this batch
+
+        Returns:
+            List of GeoJSON features, or None if the batch failed
+        """
+        try:
+            return self._fetch_batch(geoids)
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Error fetching batch of {len(geoids)} geometries: {e}")
+            return None
+
+    def fetch_geometries_bulk(
+        self,
+        geoids: list,
+        use_cache: bool = True,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict]:
+        """
+        Fetch geometries for many tracts with batched, concurrent queries
+
+        Local TIGER/Line tracts and cached geometries are used first; only the
+        remaining GEOIDs are queried from TIGERweb.
+
+        Args:
+            geoids: List of GEOIDs to fetch
+            use_cache: Whether to use cached geometries
+            batch_size: GEOIDs per query (default BATCH_SIZE)
+            max_workers: Concurrent batch requests (default MAX_WORKERS)
+
+        Returns:
+            Dictionary mapping GEOID to GeoJSON feature
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        max_workers = max_workers or self.MAX_WORKERS
+
+        results = self.local.get_tracts(geoids) if self.local else {}
+        for geoid, feature in results.items():
+            feature["properties"]["geoid"] = geoid
+
+        if use_cache:
+            pending = [geoid for geoid in geoids if geoid not in results]
+            results.update(self._load_many_from_cache(pending))
+
+        missing = [geoid for geoid in dict.fromkeys(geoids) if geoid not in results]
+
+        if missing:
+            batches = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+            logger.info(
+                f"Fetching {len(missing)} geometries from Census Bureau "
+                f"in {len(batches)} batches ({len(results)} cached)"
+            )
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batch_results = list(executor.map(self._fetch_batch_or_none, batches))
+
+            fetched_at = pd.Timestamp.now().isoformat()
+            wanted = set(missing)
+            fetched = {}
+            failed = 0
+            for batch, features in zip(batches, batch_results):
+                if features is None:
+                    # Failed batches leave their GEOIDs missing
+                    failed += len(batch)
+                    continue
+                for feature in features:
+                    geoid = str(feature.get("properties", {}).get("GEOID", ""))
+                    if geoid not in wanted:
+                        continue
+
+                    # Enhance properties
+                    feature["properties"]["geoid"] = geoid
+                    feature["properties"]["fetched_at"] = fetched_at
+                    fetched[geoid] = feature
+
+            # Write all new geometries in one pass
+            self._save_many_to_cache(fetched)
+            results.update(fetched)
+
+            if failed:
+                logger.warning(f"Could not fetch {failed} GEOIDs (failed batches)")
+            not_found = len(missing) - len(fetched) - failed
+            if not_found:
+                logger.warning(f"No geometry found for {not_found} GEOIDs")
+
+        return {geoid: results[geoid] for geoid in geoids if geoid in results}
+
     def fetch_multiple_geometries(self, geoids: list, use_cache: bool = True) -> Dict[str, Dict]:
         """
         Fetch geometries for multiple tracts
@@ -95,11 +305,7 @@ class TractGeometryFetcher:
         """
         logger.info(f"Fetching geometries for {len(geoids)} tracts...")
 
-        results = {}
-        for geoid in geoids:
-            feature = self.fetch_geometry_by_geoid(geoid, use_cache=use_cache)
-            if feature:
-                results[geoid] = feature
+        results = self.fetch_geometries_bulk(geoids, use_cache=use_cache)
 
         logger.info(f"Successfully fetched {len(results)}/{len(geoids)} geometries")
         return results
@@ -127,22 +333,32 @@ class TractGeometryFetcher:
         }
 
     def _get_cache_path(self, geoid: str) -> Path:
-        """Get cache file path for a GEOID"""
+        """Get legacy cache file path for a GEOID"""
         return self.cache_dir / f"{geoid}.json"
 
     def _load_from_cache(self, geoid: str) -> Optional[Dict]:
         """Load geometry from cache"""
-        cache_file = self._get_cache_path(geoid)
-        if cache_file.exists():
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        return None
+        return self._load_many_from_cache([geoid]).get(geoid)
+
+    def _load_many_from_cache(self, geoids: list) -> Dict[str, Dict]:
+        """Load geometries from cache in one read, importing legacy files for misses"""
+        results = self.cache.get_many('tract', geoids)
+
+        for geoid in geoids:
+            if geoid not in results:
+                feature = self.cache.import_legacy_file('tract', geoid, self._get_cache_path(geoid))
+                if feature:
+                    results[geoid] = feature
+
+        return results
 
     def _save_to_cache(self, geoid: str, feature: Dict):
         """Save geometry to cache"""
-        cache_file = self._get_cache_path(geoid)
-        with open(cache_file, 'w') as f:
-            json.dump(feature, f, indent=2)
+        self.cache.put('tract', geoid, feature)
+
+    def _save_many_to_cache(self, features: Dict[str, Dict]):
+        """Save several geometries to cache in one transaction"""
+        self.cache.put_many('tract', features)
 
 
 def fetch_geometries_for_underserved_tracts(
@@ -160,8 +376,7 @@ def fetch_geometries_for_underserved_tracts(
         GeoJSON FeatureCollection with tract geometries
     """
     # Load underserved tracts
-    with open(underserved_json_path, 'r') as f:
-        underserved_data = json.load(f)
+    underserved_data = fast_json.load(underserved_json_path)
 
     geoids = [str(int(tract['geoid'])) for tract in underserved_data['tracts']]
 
@@ -188,8 +403,7 @@ def fetch_geometries_for_underserved_tracts(
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w') as f:
-            json.dump(feature_collection, f, indent=2)
+        fast_json.dump(feature_collection, output_file)
 
         logger.info(f"Saved to {output_file}")
 
@@ -200,10 +414,6 @@ def main():
     """Main execution - fetch geometries for underserved tracts"""
     import sys
 
-    # Add pandas import here for timestamp
-    import pandas as pd
-    globals()['pd'] = pd
-
     project_root = Path(__file__).parent.parent.parent.parent
     underserved_file = project_root / "app/frontend/public/data/processed/underserved_tracts.json"
     output_file = project_root / "app/frontend/public/data/processed/underserved_tracts_geo.json"
@@ -0,0 +1,119 @@
+"""
+Population-Weighted Coverage Engine
+
+Calculates, for each census tract and speed tier, the share of the tract's
+population that lives in blocks with broadband service:
+
+  Population Coverage % = (population in served blocks) / (tract population) * 100
+
+Inputs are FCC provider-level availability rows (block_geoid + advertised
+speeds) and block populations (from block_population.py or the Snowflake
+POPULATION column). The whole calculation is one block-level groupby, one join
+and one grouped sum; no geometry is involved.
+"""
+
+import logging
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Speed tiers (download Mbps, upload Mbps)
+SPEED_TIERS: Dict[str, Tuple[int, int]] = {
+    "25_3": (25, 3),  # FCC broadband
+    "100_20": (100, 20),
+    "1000_100": (1000, 100),
+}
+
+
+def _block_population_frame(
+    block_population: Union[Mapping[str, int], pd.Series, pd.DataFrame]
+) -> pd.DataFrame:
+    """Normalize block populations to a block_geoid/population DataFrame"""
+    if isinstance(block_population, pd.DataFrame):
+        frame = block_population[["block_geoid", "population"]]
+    elif isinstance(block_population, pd.Series):
+        frame = pd.DataFrame(
+            {"block_geoid": block_population.index, "population": block_population.values}
+        )
+    else:
+        frame = pd.DataFrame(
+            {
+                "block_geoid": list(block_population.keys()),
+                "population": list(block_population.values()),
+            }
+        )
+
+    frame = frame.assign(
+        block_geoid=frame["block_geoid"].astype(str),
+        population=pd.to_numeric(frame["population"], errors="coerce").fillna(0),
+    )
+    return frame.drop_duplicates("block_geoid")
+
+
+def calculate_population_weighted_coverage(
+    fcc_df: pd.DataFrame,
+    block_population: Union[Mapping[str, int], pd.Series, pd.DataFrame],
+    speed_tiers: Optional[Dict[str, Tuple[int, int]]] = None,
+) -> pd.DataFrame:
+    """
+    Calculate population-weighted coverage for each tract and speed tier
+
+    Args:
+        fcc_df: FCC provider-level data with block_geoid,
+                max_advertised_download_speed and max_advertised_upload_speed
+        block_population: Block GEOID -> population, as a dict, Series indexed
+                          by block GEOID, or DataFrame with block_geoid/population
+        speed_tiers: Mapping of tier name -> (min download, min upload) Mbps
+
+    Returns:
+        DataFrame with one row per tract:
+        - tract_geoid
+        - total_population
+        - served_population_{tier}
+        - pop_coverage_percent_{tier}
+    """
+    tiers = speed_tiers or SPEED_TIERS
+    logger.info("Calculating population-weighted coverage...")
+
+    # Step 1: Which blocks are served at each tier (by ANY provider)
+    availability = fcc_df[fcc_df["block_geoid"].notna()]
+    download = availability["max_advertised_download_speed"]
+    upload = availability["max_advertised_upload_speed"]
+    served_flags = pd.DataFrame(
+        {
+            tier_name: (download >= min_down) & (upload >= min_up)
+            for tier_name, (min_down, min_up) in tiers.items()
+        }
+    )
+    served_blocks = served_flags.groupby(availability["block_geoid"].astype(str)).any()
+
+    # Step 2: Join block populations to served flags
+    blocks = _block_population_frame(block_population)
+    blocks = blocks.join(served_blocks, on="block_geoid")
+    blocks[list(tiers)] = blocks[list(tiers)].fillna(False).astype(bool)
+    blocks["tract_geoid"] = blocks["block_geoid"].str[:11]
+
+    # Step 3: One grouped sum of served population per tract
+    weighted = pd.DataFrame(
+        {"tract_geoid": blocks["tract_geoid"], "total_population": blocks["population"]}
+    )
+    for tier_name in tiers:
+        weighted[f"served_population_{tier_name}"] = blocks["population"].where(blocks[tier_name], 0)
+
+    result = weighted.groupby("tract_geoid", as_index=False).sum()
+
+    total = result["total_population"]
+    for tier_name in tiers:
+        result[f"pop_coverage_percent_{tier_name}"] = (
+            (result[f"served_population_{tier_name}"] / total.where(total > 0) * 100)
+            .fillna(0)
+            .clip(0, 100)
+        )
+
+    logger.info(
+        f"Calculated population-weighted coverage for {len(result):,} tracts "
+        f"({len(blocks):,} blocks, {int(total.sum()):,} residents)"
+    )
+    return result
@@ -10,14 +10,23 @@ Runs the complete deployment site pipeline for a given city:
 This replaces static file generation with dynamic API responses.
 """
 
-import json
 import logging
 import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional, Literal, List, Tuple
 import pandas as pd
+import requests
+from shapely import STRtree
 from shapely.geometry import shape, Point
 from .fetch_tract_geometry import TractGeometryFetcher
+from .wifi_zone_placement import (
+    WIFI_ZONE_TIME_BUDGET_S,
+    get_block_source,
+    place_wifi_zones_in_tract,
+)
 import math
 
 logging.basicConfig(level=logging.INFO)
@@ -30,6 +39,30 @@ if str(services_dir) not in sys.path:
     sys.path.insert(0, str(services_dir))
 
 from tiger_api import TIGERAPIService
+from geometry_cache import get_geometry_cache
+import fast_json
+from feature_lru import shape_of
+from metrics import PipelineTrace, StageSpan
+
+# Tract geometries used for spatial filtering (relative to the project root)
+TRACT_GEOMETRY_FILE = "app/frontend/public/data/processed/underserved_tracts_geo.json"
+
+# Tract coverage table (relative to the project root)
+COVERAGE_CSV_FILE = "florida_tract_coverage.csv"
+
+# Number of locations whose spatial filter result is kept in memory
+SPATIAL_FILTER_CACHE_SIZE = 64
+
+# Parsed tract geometry file: (path, mtime) -> (features, geometries, STRtree)
+_tract_features_cache: Dict[Tuple[str, float], Tuple[List[Dict[str, Any]], List[Any], STRtree]] = {}
+
+# Parsed coverage table: (path, mtime) -> DataFrame
+_coverage_cache: Dict[Tuple[str, float], pd.DataFrame] = {}
+
+# GEOIDs intersecting each location boundary, most recently used last
+_spatial_filter_cache: 'OrderedDict[Tuple, frozenset]' = OrderedDict()
+
+_cache_lock = threading.Lock()
 
 
 def calculate_wifi_zones_within_tract(
@@ -101,39 +134,74 @@ def calculate_wifi_zones_within_tract(
     return wifi_zones
 
 
-def run_deployment_pipeline_with_location(
+def generate_wifi_zones(
+    geoid: str,
+    tract_geometry,
+    centroid,
+    deadline: float,
+    num_zones: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Generate WiFi zones for a tract, preferring population-aware placement.
+
+    Uses block centroids and populations while the placement time budget lasts,
+    and falls back to centroid offsets when no block data is available.
+
+    Args:
+        geoid: 11-digit tract GEOID
+        tract_geometry: Shapely geometry of the tract polygon
+        centroid: Shapely centroid point of the tract
+        deadline: time.monotonic() value after which placement falls back
+        num_zones: Number of WiFi zones to generate (default 3)
+
+    Returns:
+        List of WiFi zone dictionaries with lng/lat coordinates
+    """
+    block_source = get_block_source()
+
+    if block_source is not None and time.monotonic() < deadline:
+        try:
+            blocks = block_source(geoid).intersecting(tract_geometry)
+            # Reading the blocks may have used up the rest of the budget
+            if time.monotonic() < deadline:
+                wifi_zones = place_wifi_zones_in_tract(blocks, tract_geometry, num_zones=num_zones)
+                if wifi_zones:
+                    return wifi_zones
+        except Exception as e:
+            logger.warning(f"    Population-aware placement failed for {geoid}: {e}")
+
+    return calculate_wifi_zones_within_tract(
+        centroid_lng=centroid.x,
+        centroid_lat=centroid.y,
+        tract_geometry=tract_geometry,
+        num_zones=num_zones,
+        offset_distance_km=0.5
+    )
+
+
+def _load_location_boundary(
     location_name: str,
-    location_type: Literal["state", "city"],
+    location_type: str,
     state_name: Optional[str] = None,
-    slug: Optional[str] = None
+    slug: Optional[str] = None,
+    span: Optional[StageSpan] = None
 ) -> Dict[str, Any]:
     """
-    Run complete deployment pipeline for a state or city with dynamic boundary fetching
+    Load a state or city/county boundary (geometry cache, then TIGER)
 
     Args:
-        location_name: Name of the location (e.g., "Florida", "Atlanta")
-        location_type: Type of location ("state" or "city")
-        state_name: State name (required for cities, e.g., "Georgia")
-        slug: Location slug for caching (e.g., "atlanta")
+        location_name: Name of the location
+        location_type: "state" or "city"
+        state_name: State name (required for cities)
+        slug: Location slug for caching
+        span: Timing span to record the geometry cache hit/miss on
 
     Returns:
-        Dictionary containing:
-        - underserved_tracts: List of filtered tracts
-        - ranked_sites: List of ranked deployment sites
-        - tract_geometries: GeoJSON FeatureCollection of tract polygons
+        Boundary GeoJSON feature
     """
-    logger.info(f"=" * 70)
-    logger.info(f"Running Deployment Pipeline for: {location_name} ({location_type})")
-    logger.info(f"=" * 70)
-
     project_root = Path(__file__).parent.parent.parent.parent
-
-    # Initialize TIGER API service
     tiger_service = TIGERAPIService()
 
-    # Step 1: Fetch boundary dynamically based on location type
-    logger.info(f"\n[1/4] Fetching {location_type} boundary...")
-
     boundary_feature = None
 
     if location_type == "state":
@@ -143,236 +211,445 @@ def run_deployment_pipeline_with_location(
             raise FileNotFoundError(f"State boundary not found for {location_name}")
 
     elif location_type == "city" and state_name:
-        # Fetch county/city boundary using Census TIGER API
-        import requests
-
-        # Check cache first
-        cache_dir = project_root / 'cache' / 'boundaries'
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = cache_dir / f'{slug}.json' if slug else None
-
-        if cache_file and cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    boundary_feature = json.load(f)
+        # Fetch county/city boundary (local TIGER/Line data, then Census TIGER API)
+        # Check cache first (importing a legacy cache/boundaries/{slug}.json on miss)
+        geometry_cache = get_geometry_cache()
+
+        if slug:
+            boundary_feature = geometry_cache.get('boundary', slug) or geometry_cache.import_legacy_file(
+                'boundary', slug, project_root / 'cache' / 'boundaries' / f'{slug}.json'
+            )
+            if boundary_feature:
                 logger.info(f"  ✓ Loaded {location_name} boundary from cache")
-            except Exception:
-                pass
+            if span is not None:
+                span.cache = 'hit' if boundary_feature else 'miss'
 
         if not boundary_feature:
-            # Fetch from Census TIGER API (county layer)
-            county_clean = location_name.replace(' County', '').replace(' county', '').strip()
-            state_fips = tiger_service.STATE_FIPS.get(state_name, '00')
-
-            api_url = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_Current/MapServer/82/query"
-
-            params = {
-                'where': f"GEOID LIKE '{state_fips}%' AND BASENAME LIKE '%{county_clean}%'",
-                'outFields': '*',
-                'outSR': '4326',
-                'f': 'geojson'
-            }
-
             try:
-                response = requests.get(api_url, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+                boundary_feature = tiger_service.fetch_county_boundary(location_name, state_name)
 
-                if not data.get('features') or len(data['features']) == 0:
+                if not boundary_feature:
                     raise FileNotFoundError(f"Boundary not found for {location_name}, {state_name}")
 
-                boundary_feature = data['features'][0]
-
                 # Cache the result
-                if cache_file:
+                if slug:
                     try:
-                        with open(cache_file, 'w') as f:
-                            json.dump(boundary_feature, f, indent=2)
+                        geometry_cache.put('boundary', slug, boundary_feature)
                         logger.info(f"  ✓ Cached {location_name} boundary")
                     except Exception as e:
                         logger.warning(f"Failed to cache: {e}")
 
-                logger.info(f"  ✓ Fetched {location_name} boundary from Census TIGER API")
             except requests.RequestException as e:
                 raise FileNotFoundError(f"Failed to fetch boundary from Census API: {str(e)}")
     else:
         raise ValueError("Invalid location type or missing state_name for city")
 
-    # Convert boundary to shapely geometry
-    location_geom = shape(boundary_feature['geometry'])
-    logger.info(f"  ✓ Loaded boundary geometry ({boundary_feature['geometry']['type']})")
+    return boundary_feature
 
-    # Step 2: Load and filter underserved tracts
-    logger.info(f"\n[2/4] Filtering underserved tracts by {location_type} boundary...")
 
-    # Load coverage data
-    coverage_csv = project_root / "florida_tract_coverage.csv"
-    if not coverage_csv.exists():
-        raise FileNotFoundError(f"Coverage data not found: {coverage_csv}")
+def _load_tract_features(
+    path: Path, span: Optional[StageSpan] = None
+) -> Tuple[List[Dict[str, Any]], List[Any], STRtree]:
+    """
+    Load the tract geometry file, parsed once per file version
 
-    df = pd.read_csv(coverage_csv)
-    initial_count = len(df)
-    logger.info(f"  Loaded {initial_count} tracts from coverage data")
+    Args:
+        path: Tract FeatureCollection file
+        span: Timing span to record the cache hit/miss on
 
-    # Load tract geometries for spatial filtering
-    tract_geo_path = project_root / "app/frontend/public/data/processed/underserved_tracts_geo.json"
+    Returns:
+        (features, shapely geometries, spatial index over the geometries).
+        The features are shared between calls and must not be mutated.
+    """
+    key = (str(path), path.stat().st_mtime)
+
+    with _cache_lock:
+        cached = _tract_features_cache.get(key)
+    if span is not None:
+        span.cache = 'hit' if cached is not None else 'miss'
+    if cached is not None:
+        return cached
+
+    features = [
+        feature for feature in fast_json.load(path).get('features', [])
+        if feature.get('geometry') and feature['properties'].get('GEOID')
+    ]
+    geometries = [shape(feature['geometry']) for feature in features]
+    loaded = (features, geometries, STRtree(geometries))
+
+    with _cache_lock:
+        _tract_features_cache.clear()
+        _tract_features_cache[key] = loaded
+
+    return loaded
 
+
+def _load_coverage(path: Path, span: Optional[StageSpan] = None) -> pd.DataFrame:
+    """
+    Load the tract coverage CSV, parsed once per file version
+
+    Args:
+        path: Coverage CSV file
+        span: Timing span to record the cache hit/miss on
+
+    Returns:
+        Coverage table. The DataFrame is shared between calls and must not be mutated.
+    """
+    key = (str(path), path.stat().st_mtime)
+
+    with _cache_lock:
+        cached = _coverage_cache.get(key)
+    if span is not None:
+        span.cache = 'hit' if cached is not None else 'miss'
+    if cached is not None:
+        return cached
+
+    df = pd.read_csv(path)
+
+    with _cache_lock:
+        _coverage_cache.clear()
+        _coverage_cache[key] = df
+
+    return df
+
+
+def _intersecting_tracts(
+    location_key: Tuple,
+    location_geom,
+    geometries: List[Any],
+    tree: STRtree,
+    span: Optional[StageSpan] = None
+) -> frozenset:
+    """
+    Indexes of the tract geometries intersecting a location boundary (cached per location)
+
+    Args:
+        location_key: Cache key identifying the location and tract file version
+        location_geom: Location boundary geometry
+        geometries: Tract geometries
+        tree: Spatial index over the tract geometries
+        span: Timing span to record the cache hit/miss on
+
+    Returns:
+        Frozen set of indexes into the tract features
+    """
+    with _cache_lock:
+        cached = _spatial_filter_cache.get(location_key)
+        if span is not None:
+            span.cache = 'hit' if cached is not None else 'miss'
+        if cached is not None:
+            _spatial_filter_cache.move_to_end(location_key)
+            return cached
+
+    indexes = frozenset(int(i) for i in tree.query(location_geom, predicate='intersects'))
+
+    with _cache_lock:
+        _spatial_filter_cache[location_key] = indexes
+        while len(_spatial_filter_cache) > SPATIAL_FILTER_CACHE_SIZE:
+            _spatial_filter_cache.popitem(last=False)
+
+    return indexes
+
+
+def _location_key(location_name: str, location_type: str, state_name: Optional[str], tract_geo_path: Path) -> Tuple:
+    """Spatial filter cache key for a location and tract file version"""
+    return (
+        location_type,
+        location_name.strip().lower(),
+        (state_name or '').strip().lower(),
+        str(tract_geo_path),
+        tract_geo_path.stat().st_mtime,
+    )
+
+
+def warm_tract_features() -> int:
+    """
+    Parse the tract geometry file and build its spatial index ahead of a request
+
+    Returns:
+        Number of tract features loaded (0 if the file has not been generated)
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    tract_geo_path = project_root / TRACT_GEOMETRY_FILE
     if not tract_geo_path.exists():
-        raise FileNotFoundError(
-            f"Tract geometry file not found: {tract_geo_path}. "
-            "Run fetch_tract_geometry.py first to generate geometries."
-        )
+        logger.warning(f"Tract geometry file not found: {tract_geo_path}")
+        return 0
 
-    with open(tract_geo_path, 'r') as f:
-        tract_geo_data = json.load(f)
+    features, _, _ = _load_tract_features(tract_geo_path)
+    return len(features)
 
-    tract_features = tract_geo_data.get('features', [])
 
-    # Find tracts that intersect with location boundary
-    intersecting_geoids = set()
-    for feature in tract_features:
-        geoid = feature['properties'].get('GEOID')
-        if not geoid:
-            continue
+def warm_coverage() -> int:
+    """
+    Parse the tract coverage CSV ahead of a request
 
-        tract_geom = shape(feature['geometry'])
-        if location_geom.intersects(tract_geom):
-            intersecting_geoids.add(str(geoid))
+    Returns:
+        Number of tracts loaded (0 if the file has not been generated)
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    coverage_csv = project_root / COVERAGE_CSV_FILE
+    if not coverage_csv.exists():
+        logger.warning(f"Coverage data not found: {coverage_csv}")
+        return 0
 
-    logger.info(f"  Found {len(intersecting_geoids)} tracts within {location_type} boundary")
+    return len(_load_coverage(coverage_csv))
 
-    # Filter df to only include tracts within location
-    df_spatial = df[df['GEOID'].astype(str).isin(intersecting_geoids)].copy()
-    logger.info(f"  After spatial filter: {len(df_spatial)} tracts ({initial_count - len(df_spatial)} removed)")
 
-    # Apply coverage and population filters
-    df_filtered = df_spatial[df_spatial['coverage'] < 100.0].copy()
-    after_coverage = len(df_filtered)
-    logger.info(f"  After coverage < 100% filter: {after_coverage} tracts")
+def warm_deployment_pipeline(
+    location_name: str,
+    location_type: Literal["state", "city"],
+    state_name: Optional[str] = None,
+    slug: Optional[str] = None
+) -> int:
+    """
+    Prepare the expensive pipeline inputs for a location ahead of a request
 
-    df_filtered = df_filtered[df_filtered['population'] > 500].copy()
-    after_population = len(df_filtered)
-    logger.info(f"  After population > 500 filter: {after_population} tracts")
+    Fetches the boundary into the geometry cache, loads the tract geometries
+    and computes the spatial filter, so a following
+    run_deployment_pipeline_with_location call for the same location skips
+    that work.
 
-    # Prepare underserved tracts data
-    underserved_tracts = []
-    for _, row in df_filtered.iterrows():
-        tract = {
-            'geoid': str(row['GEOID']),
-            'coverage_percent': float(row['coverage']),
-            'population': int(row['population']) if pd.notna(row['population']) else 0,
-            'median_income': int(row['median_income']) if pd.notna(row['median_income']) else 0,
-            'poverty_rate': float(row['poverty_rate']) if pd.notna(row['poverty_rate']) else 0,
-        }
+    Args:
+        location_name: Name of the location
+        location_type: "state" or "city"
+        state_name: State name (required for cities)
+        slug: Location slug for caching
 
-        # Add asset counts
-        asset_types = ['schools', 'libraries', 'community_centers', 'transit_stops']
-        for asset_type in asset_types:
-            col_name = f'asset_count_{asset_type}'
-            if col_name in row:
-                tract[asset_type] = int(row[col_name]) if pd.notna(row[col_name]) else 0
+    Returns:
+        Number of tracts intersecting the location
+    """
+    project_root = Path(__file__).parent.parent.parent.parent
+    tract_geo_path = project_root / TRACT_GEOMETRY_FILE
 
-        tract['total_assets'] = sum(tract.get(at, 0) for at in asset_types)
-        underserved_tracts.append(tract)
+    boundary_feature = _load_location_boundary(location_name, location_type, state_name, slug)
+    _, geometries, tree = _load_tract_features(tract_geo_path)
+    indexes = _intersecting_tracts(
+        _location_key(location_name, location_type, state_name, tract_geo_path),
+        shape_of(boundary_feature), geometries, tree
+    )
 
-    logger.info(f"  ✓ Filtered to {len(underserved_tracts)} underserved tracts")
+    logger.info(f"✓ Warmed pipeline inputs for {location_name} ({len(indexes)} tracts)")
+    return len(indexes)
 
-    # Step 3: Rank deployment sites
-    logger.info("\n[3/4] Ranking deployment sites...")
 
-    ranked_sites = []
-    if len(underserved_tracts) > 0:
-        # Calculate impact scores
-        for tract in underserved_tracts:
-            pop = tract['population']
-            poverty = tract['poverty_rate']
-            income = tract['median_income']
+def run_deployment_pipeline_with_location(
+    location_name: str,
+    location_type: Literal["state", "city"],
+    state_name: Optional[str] = None,
+    slug: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run complete deployment pipeline for a state or city with dynamic boundary fetching
 
-            # Normalize scores
-            pop_score = min(100, (pop / 10000) * 100)
+    Args:
+        location_name: Name of the location (e.g., "Florida", "Atlanta")
+        location_type: Type of location ("state" or "city")
+        state_name: State name (required for cities, e.g., "Georgia")
+        slug: Location slug for caching (e.g., "atlanta")
 
-            # Handle missing poverty data (0 often indicates missing data)
-            if poverty <= 0:
-                poverty_score = 0  # No poverty bonus if data is missing
-            else:
-                poverty_score = min(100, poverty)
+    Returns:
+        Dictionary containing:
+        - underserved_tracts: List of filtered tracts
+        - ranked_sites: List of ranked deployment sites
+        - tract_geometries: GeoJSON FeatureCollection of tract polygons
+        - metadata: Per-stage timing spans (wall time, rows in/out, cache hit/miss)
+    """
+    logger.info(f"=" * 70)
+    logger.info(f"Running Deployment Pipeline for: {location_name} ({location_type})")
+    logger.info(f"=" * 70)
 
-            # Handle missing income data (sentinel values like -666666666)
-            if income < 0 or income > 500000:  # Unrealistic values indicate missing data
-                income_score = 0  # Neutral/no income penalty if data is missing
-            else:
-                income_score = 100 - min(100, (income / 100000) * 100)
+    project_root = Path(__file__).parent.parent.parent.parent
+    trace = PipelineTrace('deployment')
 
-            # Calculate composite impact score
-            # When poverty/income data is missing, score is based primarily on population
-            impact_score = (0.4 * pop_score) + (0.4 * poverty_score) + (0.2 * income_score)
-            tract['impact_score'] = round(impact_score, 1)
+    # Step 1: Fetch boundary dynamically based on location type
+    logger.info(f"\n[1/4] Fetching {location_type} boundary...")
+    with trace.stage('boundary') as span:
+        boundary_feature = _load_location_boundary(location_name, location_type, state_name, slug, span)
 
-            # Flag missing data for transparency
-            tract['has_complete_data'] = not (income < 0 or income > 500000 or poverty <= 0)
+        # Convert boundary to shapely geometry (reuses the cached geometry for hot boundaries)
+        location_geom = shape_of(boundary_feature)
+    logger.info(f"  ✓ Loaded boundary geometry ({boundary_feature['geometry']['type']})")
 
-        # Sort by impact score
-        ranked_sites = sorted(underserved_tracts, key=lambda x: x['impact_score'], reverse=True)
+    # Step 2: Load and filter underserved tracts
+    logger.info(f"\n[2/4] Filtering underserved tracts by {location_type} boundary...")
 
-        # Assign ranks and tiers
-        for rank, site in enumerate(ranked_sites, 1):
-            site['deployment_rank'] = rank
+    # Load coverage data (parsed once per file version)
+    coverage_csv = project_root / COVERAGE_CSV_FILE
+    with trace.stage('coverage_csv') as span:
+        if not coverage_csv.exists():
+            raise FileNotFoundError(f"Coverage data not found: {coverage_csv}")
 
-            # Assign tier based on rank
-            if rank <= 10:
-                site['deployment_tier'] = 'tier_1_critical'
-            elif rank <= 25:
-                site['deployment_tier'] = 'tier_2_high'
-            elif rank <= 40:
-                site['deployment_tier'] = 'tier_3_medium'
-            else:
-                site['deployment_tier'] = 'tier_4_low'
+        df = _load_coverage(coverage_csv, span)
+        span.rows_out = initial_count = len(df)
+    logger.info(f"  Loaded {initial_count} tracts from coverage data")
 
-        logger.info(f"  ✓ Ranked {len(ranked_sites)} deployment sites")
-        logger.info(f"  Top site: GEOID {ranked_sites[0]['geoid']} (Impact: {ranked_sites[0]['impact_score']})")
-    else:
-        logger.info("  ⚠ No tracts to rank")
+    # Load tract geometries for spatial filtering (parsed once per file version)
+    tract_geo_path = project_root / TRACT_GEOMETRY_FILE
 
-    # Step 4: Fetch tract geometries and calculate centroids
-    logger.info("\n[4/4] Fetching tract geometries and calculating WiFi zones...")
+    with trace.stage('tract_geometries') as span:
+        if not tract_geo_path.exists():
+            raise FileNotFoundError(
+                f"Tract geometry file not found: {tract_geo_path}. "
+                "Run fetch_tract_geometry.py first to generate geometries."
+            )
 
-    tract_geoids = [t['geoid'] for t in ranked_sites]
-    tract_geo_features = []
-    all_wifi_zones = {}  # Map of geoid -> wifi_zones
+        tract_features, tract_geometries, tract_tree = _load_tract_features(tract_geo_path, span)
+        span.rows_out = len(tract_features)
 
-    # Filter the previously fetched features to only include ranked sites
-    for feature in tract_features:
-        geoid = feature['properties'].get('GEOID')
-        if str(geoid) in tract_geoids:
-            # Merge with ranking data
-            site_data = next((s for s in ranked_sites if s['geoid'] == str(geoid)), None)
-            if site_data:
-                # Calculate centroid from geometry
-                tract_geom = shape(feature['geometry'])
-                centroid = tract_geom.centroid
+    # Find tracts that intersect with location boundary (cached per location)
+    with trace.stage('spatial_filter', rows_in=initial_count) as span:
+        intersecting = _intersecting_tracts(
+            _location_key(location_name, location_type, state_name, tract_geo_path),
+            location_geom, tract_geometries, tract_tree, span
+        )
+        intersecting_geoids = {str(tract_features[i]['properties']['GEOID']) for i in intersecting}
 
-                # Add centroid coordinates to site data
-                site_data['centroid'] = {
-                    'lng': centroid.x,
-                    'lat': centroid.y
-                }
+        # Filter df to only include tracts within location
+        df_spatial = df[df['GEOID'].astype(str).isin(intersecting_geoids)].copy()
+        span.rows_out = len(df_spatial)
 
-                # Calculate 3 WiFi placement zones for EVERY tract
-                wifi_zones = calculate_wifi_zones_within_tract(
-                    centroid_lng=centroid.x,
-                    centroid_lat=centroid.y,
-                    tract_geometry=tract_geom,
-                    num_zones=3,
-                    offset_distance_km=0.5
-                )
-                site_data['wifi_zones'] = wifi_zones
-                all_wifi_zones[str(geoid)] = wifi_zones
+    logger.info(f"  Found {len(intersecting_geoids)} tracts within {location_type} boundary")
+    logger.info(f"  After spatial filter: {len(df_spatial)} tracts ({initial_count - len(df_spatial)} removed)")
 
-                feature['properties'].update(site_data)
-                tract_geo_features.append(feature)
+    with trace.stage('attribute_filter', rows_in=len(df_spatial)) as span:
+        # Apply coverage and population filters
+        df_filtered = df_spatial[df_spatial['coverage'] < 100.0].copy()
+        after_coverage = len(df_filtered)
+        logger.info(f"  After coverage < 100% filter: {after_coverage} tracts")
+
+        df_filtered = df_filtered[df_filtered['population'] > 500].copy()
+        after_population = len(df_filtered)
+        logger.info(f"  After population > 500 filter: {after_population} tracts")
+
+        # Prepare underserved tracts data
+        underserved_tracts = []
+        for _, row in df_filtered.iterrows():
+            tract = {
+                'geoid': str(row['GEOID']),
+                'coverage_percent': float(row['coverage']),
+                'population': int(row['population']) if pd.notna(row['population']) else 0,
+                'median_income': int(row['median_income']) if pd.notna(row['median_income']) else 0,
+                'poverty_rate': float(row['poverty_rate']) if pd.notna(row['poverty_rate']) else 0,
+            }
+
+            # Add asset counts
+            asset_types = ['schools', 'libraries', 'community_centers', 'transit_stops']
+            for asset_type in asset_types:
+                col_name = f'asset_count_{asset_type}'
+                if col_name in row:
+                    tract[asset_type] = int(row[col_name]) if pd.notna(row[col_name]) else 0
+
+            tract['total_assets'] = sum(tract.get(at, 0) for at in asset_types)
+            underserved_tracts.append(tract)
+        span.rows_out = len(underserved_tracts)
+
+    logger.info(f"  ✓ Filtered to {len(underserved_tracts)} underserved tracts")
+
+    # Step 3: Rank deployment sites
+    logger.info("\n[3/4] Ranking deployment sites...")
+
+    with trace.stage('ranking', rows_in=len(underserved_tracts)) as span:
+        ranked_sites = []
+        if len(underserved_tracts) > 0:
+            # Calculate impact scores
+            for tract in underserved_tracts:
+                pop = tract['population']
+                poverty = tract['poverty_rate']
+                income = tract['median_income']
+
+                # Normalize scores
+                pop_score = min(100, (pop / 10000) * 100)
+
+                # Handle missing poverty data (0 often indicates missing data)
+                if poverty <= 0:
+                    poverty_score = 0  # No poverty bonus if data is missing
+                else:
+                    poverty_score = min(100, poverty)
+
+                # Handle missing income data (sentinel values like -666666666)
+                if income < 0 or income > 500000:  # Unrealistic values indicate missing data
+                    income_score = 0  # Neutral/no income penalty if data is missing
+                else:
+                    income_score = 100 - min(100, (income / 100000) * 100)
+
+                # Calculate composite impact score
+                # When poverty/income data is missing, score is based primarily on population
+                impact_score = (0.4 * pop_score) + (0.4 * poverty_score) + (0.2 * income_score)
+                tract['impact_score'] = round(impact_score, 1)
+
+                # Flag missing data for transparency
+                tract['has_complete_data'] = not (income < 0 or income > 500000 or poverty <= 0)
+
+            # Sort by impact score
+            ranked_sites = sorted(underserved_tracts, key=lambda x: x['impact_score'], reverse=True)
+
+            # Assign ranks and tiers
+            for rank, site in enumerate(ranked_sites, 1):
+                site['deployment_rank'] = rank
+
+                # Assign tier based on rank
+                if rank <= 10:
+                    site['deployment_tier'] = 'tier_1_critical'
+                elif rank <= 25:
+                    site['deployment_tier'] = 'tier_2_high'
+                elif rank <= 40:
+                    site['deployment_tier'] = 'tier_3_medium'
+                else:
+                    site['deployment_tier'] = 'tier_4_low'
+
+            logger.info(f"  ✓ Ranked {len(ranked_sites)} deployment sites")
+            logger.info(f"  Top site: GEOID {ranked_sites[0]['geoid']} (Impact: {ranked_sites[0]['impact_score']})")
+        else:
+            logger.info("  ⚠ No tracts to rank")
+        span.rows_out = len(ranked_sites)
+
+    # Step 4: Fetch tract geometries and calculate centroids
+    logger.info("\n[4/4] Fetching tract geometries and calculating WiFi zones...")
+
+    with trace.stage('wifi_zones', rows_in=len(ranked_sites)) as span:
+        sites_by_geoid = {t['geoid']: t for t in ranked_sites}
+        tract_geo_features = []
+        all_wifi_zones = {}  # Map of geoid -> wifi_zones
+        placement_deadline = time.monotonic() + WIFI_ZONE_TIME_BUDGET_S
+
+        # Filter the previously fetched features to only include ranked sites
+        for i in sorted(intersecting):
+            feature = tract_features[i]
+            geoid = feature['properties'].get('GEOID')
+            if str(geoid) in sites_by_geoid:
+                # Merge with ranking data
+                site_data = sites_by_geoid[str(geoid)]
+                if site_data:
+                    # Calculate centroid from geometry (parsed once with the tract file)
+                    tract_geom = tract_geometries[i]
+                    centroid = tract_geom.centroid
+
+                    # Add centroid coordinates to site data
+                    site_data['centroid'] = {
+                        'lng': centroid.x,
+                        'lat': centroid.y
+                    }
+
+                    # Calculate 3 WiFi placement zones for EVERY tract
+                    wifi_zones = generate_wifi_zones(
+                        str(geoid), tract_geom, centroid, placement_deadline, num_zones=3
+                    )
+                    site_data['wifi_zones'] = wifi_zones
+                    all_wifi_zones[str(geoid)] = wifi_zones
+
+                    # Copy: the loaded tract features are shared between runs
+                    tract_geo_features.append({
+                        **feature,
+                        'properties': {**feature['properties'], **site_data},
+                    })
+        span.rows_out = len(tract_geo_features)
 
     logger.info(f"  ✓ Fetched {len(tract_geo_features)} tract geometries with centroids")
-    logger.info(f"  ✓ Generated WiFi zones for {len(all_wifi_zones)} tracts ({len(all_wifi_zones) * 3} total zones)")
+    total_zones = sum(len(zones) for zones in all_wifi_zones.values())
+    logger.info(f"  ✓ Generated WiFi zones for {len(all_wifi_zones)} tracts ({total_zones} total zones)")
+
+    trace.finish()
+    logger.info(f"  Stage timings: {trace.summary()}")
 
     # Return results
     result = {
@@ -388,7 +665,8 @@ def run_deployment_pipeline_with_location(
         'geometries': {
             'type': 'FeatureCollection',
             'features': tract_geo_features
-        }
+        },
+        'metadata': trace.to_dict()
     }
 
     logger.info(f"\n{'=' * 70}")
@@ -433,8 +711,7 @@ def run_deployment_pipeline(city_slug: str) -> Dict[str, Any]:
     initial_count = len(df)
 
     # Load city boundary and filter spatially
-    with open(city_boundary_path, 'r') as f:
-        city_data = json.load(f)
+    city_data = fast_json.load(city_boundary_path)
 
     city_geom = shape(city_data['geometry'])
 
@@ -450,8 +727,7 @@ def run_deployment_pipeline(city_slug: str) -> Dict[str, Any]:
             "Run fetch_tract_geometry.py first to generate geometries."
         )
 
-    with open(tract_geo_path, 'r') as f:
-        tract_geo_data = json.load(f)
+    tract_geo_data = fast_json.load(tract_geo_path)
 
     tract_features = tract_geo_data.get('features', [])
 
@@ -566,6 +842,7 @@ def run_deployment_pipeline(city_slug: str) -> Dict[str, Any]:
     tract_geoids = [t['geoid'] for t in ranked_sites]
     tract_geo_features = []
     all_wifi_zones = {}  # Map of geoid -> wifi_zones
+    placement_deadline = time.monotonic() + WIFI_ZONE_TIME_BUDGET_S
 
     # Filter the previously fetched features to only include ranked sites
     for feature in tract_features:
@@ -585,12 +862,8 @@ def run_deployment_pipeline(city_slug: str) -> Dict[str, Any]:
                 }
 
                 # Calculate 3 WiFi placement zones for EVERY tract
-                wifi_zones = calculate_wifi_zones_within_tract(
-                    centroid_lng=centroid.x,
-                    centroid_lat=centroid.y,
-                    tract_geometry=tract_geom,
-                    num_zones=3,
-                    offset_distance_km=0.5
+                wifi_zones = generate_wifi_zones(
+                    str(geoid), tract_geom, centroid, placement_deadline, num_zones=3
                 )
                 site_data['wifi_zones'] = wifi_zones
                 all_wifi_zones[str(geoid)] = wifi_zones
@@ -599,7 +872,8 @@ def run_deployment_pipeline(city_slug: str) -> Dict[str, Any]:
                 tract_geo_features.append(feature)
 
     logger.info(f"  ✓ Fetched {len(tract_geo_features)} tract geometries with centroids")
-    logger.info(f"  ✓ Generated WiFi zones for {len(all_wifi_zones)} tracts ({len(all_wifi_zones) * 3} total zones)")
+    total_zones = sum(len(zones) for zones in all_wifi_zones.values())
+    logger.info(f"  ✓ Generated WiFi zones for {len(all_wifi_zones)} tracts ({total_zones} total zones)")
 
     # Return results
     result = {
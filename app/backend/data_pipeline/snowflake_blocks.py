@@ -13,15 +13,22 @@ This module provides:
 import logging
 from typing import Dict, List, Optional
 from functools import lru_cache
-from shapely.geometry import shape
-from shapely import wkt
+import numpy as np
+import shapely
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Add services directory to path
+services_dir = Path(__file__).parent.parent / 'services'
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
+
 from config.snowflake_config import get_connection
+from data_pipeline.tract_blocks import TractBlocks
+from metrics import track_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +56,16 @@ class SnowflakeBlockLoader:
             raise
 
     @lru_cache(maxsize=500)
-    def get_blocks_for_tract(self, tract_geoid: str) -> List[Dict]:
+    def get_tract_blocks(self, tract_geoid: str) -> TractBlocks:
         """
-        Get all Census blocks within a tract from Snowflake
+        Get all Census blocks within a tract from Snowflake as arrays
 
         Args:
             tract_geoid: 11-digit tract GEOID
 
         Returns:
-            List of block dictionaries with geometry, population, and attributes
+            TractBlocks with geometry, population and attributes
+            (shared cached instance; do not modify)
         """
         logger.info(f"Querying Snowflake for blocks in tract {tract_geoid}")
 
@@ -78,50 +86,56 @@ class SnowflakeBlockLoader:
                 WHERE TRACT_GEOID = %s
             """
 
-            cursor.execute(query, (tract_geoid,))
-            results = cursor.fetchall()
-
-            blocks = []
-            for row in results:
-                block_geoid, tract_geoid, geometry_wkt, land_area_m2, water_area_m2, population = row
-
-                # Convert WKT to Shapely geometry
-                try:
-                    geom = wkt.loads(geometry_wkt)
-                except Exception as e:
-                    logger.warning(f"Failed to parse geometry for block {block_geoid}: {e}")
-                    continue
-
-                # Calculate centroid
-                centroid = geom.centroid
-
-                block_data = {
-                    'geoid': block_geoid,
-                    'geometry': geom,
-                    'land_area_m2': float(land_area_m2) if land_area_m2 else 0,
-                    'water_area_m2': float(water_area_m2) if water_area_m2 else 0,
-                    'population': int(population) if population else 0,
-                    'centroid': {
-                        'lng': centroid.x,
-                        'lat': centroid.y
-                    }
-                }
-
-                blocks.append(block_data)
-
+            with track_upstream('snowflake', 'tract_blocks'):
+                cursor.execute(query, (tract_geoid,))
+                results = cursor.fetchall()
             cursor.close()
 
+            if not results:
+                logger.info(f"✓ Retrieved 0 blocks for tract {tract_geoid}")
+                return TractBlocks.empty()
+
+            block_geoids, _, geometry_wkts, land_areas, water_areas, populations = zip(*results)
+
+            # Convert WKT to Shapely geometries in one vectorized call
+            geometries = shapely.from_wkt(np.array(geometry_wkts, dtype=object), on_invalid='ignore')
+            valid = ~shapely.is_missing(geometries)
+            if not valid.all():
+                logger.warning(
+                    f"Failed to parse geometry for {int((~valid).sum())} blocks in tract {tract_geoid}"
+                )
+
+            blocks = TractBlocks(
+                block_geoids,
+                geometries,
+                [float(a) if a else 0 for a in land_areas],
+                [float(a) if a else 0 for a in water_areas],
+                [int(p) if p else 0 for p in populations],
+            ).subset(valid)
+
             logger.info(f"✓ Retrieved {len(blocks)} blocks for tract {tract_geoid}")
             return blocks
 
         except Exception as e:
             logger.error(f"Failed to query blocks for tract {tract_geoid}: {e}")
-            return []
+            return TractBlocks.empty()
 
         finally:
             if conn:
                 conn.close()
 
+    def get_blocks_for_tract(self, tract_geoid: str) -> List[Dict]:
+        """
+        Get all Census blocks within a tract from Snowflake
+
+        Args:
+            tract_geoid: 11-digit tract GEOID
+
+        Returns:
+            List of block dictionaries with geometry, population, and attributes
+        """
+        return self.get_tract_blocks(tract_geoid).to_records()
+
     def get_blocks_within_geometry(self, tract_geoid: str, tract_geometry) -> List[Dict]:
         """
         Get blocks within a tract that intersect with tract geometry
@@ -133,23 +147,14 @@ class SnowflakeBlockLoader:
         Returns:
             List of blocks that intersect with the tract boundary
         """
-        blocks = self.get_blocks_for_tract(tract_geoid)
-
-        # Filter by spatial intersection
-        filtered_blocks = []
-        for block in blocks:
-            try:
-                if tract_geometry.intersects(block['geometry']):
-                    filtered_blocks.append(block)
-            except Exception as e:
-                logger.warning(f"Spatial intersection failed for block {block['geoid']}: {e}")
-                continue
+        blocks = self.get_tract_blocks(tract_geoid)
+        filtered_blocks = blocks.intersecting(tract_geometry)
 
         logger.info(
             f"Filtered to {len(filtered_blocks)}/{len(blocks)} blocks within geometry"
         )
 
-        return filtered_blocks
+        return filtered_blocks.to_records()
 
     def get_blocks_with_population_for_tracts(self, tract_geoids: List[str]) -> Dict[str, int]:
         """
@@ -181,8 +186,9 @@ class SnowflakeBlockLoader:
                 WHERE TRACT_GEOID IN ({placeholders})
             """
 
-            cursor.execute(query, tract_geoids)
-            results = cursor.fetchall()
+            with track_upstream('snowflake', 'block_population'):
+                cursor.execute(query, tract_geoids)
+                results = cursor.fetchall()
 
             block_population = {}
             for block_geoid, population in results:
@@ -203,7 +209,7 @@ class SnowflakeBlockLoader:
 
     def clear_cache(self):
         """Clear the LRU cache for fresh queries"""
-        self.get_blocks_for_tract.cache_clear()
+        self.get_tract_blocks.cache_clear()
         logger.info("Cache cleared")
 
 
@@ -0,0 +1,174 @@
+"""
+Per-Tract Census Block Arrays
+
+Holds the blocks of one census tract as parallel arrays (shapely 2 geometry
+array, precomputed centroids, areas and optional population) so that spatial
+filtering against a tract boundary is a single vectorized predicate call.
+
+Shared by CensusBlockLoader and SnowflakeBlockLoader. Instances are cached by
+the loaders and treated as immutable; filtering returns new instances and
+to_records() builds fresh dictionaries on every call.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import shapely
+
+logger = logging.getLogger(__name__)
+
+
+class TractBlocks:
+    """Census blocks of a single tract stored as parallel arrays"""
+
+    def __init__(
+        self,
+        geoids: Sequence[str],
+        geometries: Sequence,
+        land_area_m2: Sequence[float],
+        water_area_m2: Sequence[float],
+        population: Optional[Sequence[int]] = None,
+        centroid_x: Optional[np.ndarray] = None,
+        centroid_y: Optional[np.ndarray] = None,
+    ):
+        """
+        Initialize tract block arrays
+
+        Args:
+            geoids: 15-digit block GEOIDs
+            geometries: Shapely geometries (one per block)
+            land_area_m2: Block land areas
+            water_area_m2: Block water areas
+            population: Optional block populations
+            centroid_x: Optional precomputed centroid longitudes
+            centroid_y: Optional precomputed centroid latitudes
+        """
+        self.geoids = np.asarray(geoids, dtype=object)
+        self.geometries = np.asarray(geometries, dtype=object)
+        self.land_area_m2 = np.asarray(land_area_m2, dtype=np.float64)
+        self.water_area_m2 = np.asarray(water_area_m2, dtype=np.float64)
+        self.population = (
+            np.asarray(population, dtype=np.int64) if population is not None else None
+        )
+
+        if centroid_x is None or centroid_y is None:
+            centroids = shapely.centroid(self.geometries)
+            centroid_x = shapely.get_x(centroids)
+            centroid_y = shapely.get_y(centroids)
+
+        self.centroid_x = np.asarray(centroid_x, dtype=np.float64)
+        self.centroid_y = np.asarray(centroid_y, dtype=np.float64)
+
+    @classmethod
+    def empty(cls) -> 'TractBlocks':
+        """Create an empty block set"""
+        return cls([], [], [], [], centroid_x=np.empty(0), centroid_y=np.empty(0))
+
+    def __len__(self) -> int:
+        return len(self.geoids)
+
+    def subset(self, mask: np.ndarray) -> 'TractBlocks':
+        """
+        Select blocks by boolean mask or index array
+
+        Args:
+            mask: Boolean mask or integer indices
+
+        Returns:
+            New TractBlocks with the selected blocks
+        """
+        return TractBlocks(
+            self.geoids[mask],
+            self.geometries[mask],
+            self.land_area_m2[mask],
+            self.water_area_m2[mask],
+            self.population[mask] if self.population is not None else None,
+            centroid_x=self.centroid_x[mask],
+            centroid_y=self.centroid_y[mask],
+        )
+
+    def with_population(self, population: Sequence[int]) -> 'TractBlocks':
+        """
+        Attach block populations
+
+        Args:
+            population: Block populations aligned with geoids
+
+        Returns:
+            New TractBlocks carrying the given populations
+        """
+        return TractBlocks(
+            self.geoids,
+            self.geometries,
+            self.land_area_m2,
+            self.water_area_m2,
+            population,
+            centroid_x=self.centroid_x,
+            centroid_y=self.centroid_y,
+        )
+
+    def intersecting(self, tract_geometry) -> 'TractBlocks':
+        """
+        Get blocks that intersect a tract geometry
+
+        Blocks that only touch the boundary are included, matching the
+        per-block intersects check this replaced.
+
+        Note: tract_geometry is prepared in place (shapely.prepare), so
+        later predicates on the caller's geometry reuse the spatial index.
+
+        Args:
+            tract_geometry: Shapely geometry for spatial filtering
+
+        Returns:
+            New TractBlocks with the intersecting blocks
+        """
+        if len(self) == 0:
+            return self
+
+        # Preparing builds a spatial index on the tract boundary once,
+        # which every block predicate below then reuses
+        shapely.prepare(tract_geometry)
+
+        try:
+            mask = shapely.intersects(tract_geometry, self.geometries)
+        except shapely.errors.GEOSException as e:
+            logger.warning(f"Spatial intersection failed ({e}); retrying with repaired geometries")
+            mask = shapely.intersects(tract_geometry, shapely.make_valid(self.geometries))
+
+        return self.subset(mask)
+
+    def to_records(self) -> List[Dict]:
+        """
+        Convert to block dictionaries
+
+        Returns:
+            List of new block dictionaries with geometry, attributes and centroid
+        """
+        populations = self.population.tolist() if self.population is not None else None
+        records = []
+
+        for i, (geoid, geom, land, water, lng, lat) in enumerate(zip(
+            self.geoids.tolist(),
+            self.geometries,
+            self.land_area_m2.tolist(),
+            self.water_area_m2.tolist(),
+            self.centroid_x.tolist(),
+            self.centroid_y.tolist(),
+        )):
+            block = {
+                'geoid': geoid,
+                'geometry': geom,
+                'land_area_m2': land,
+                'water_area_m2': water,
+                'centroid': {
+                    'lng': lng,
+                    'lat': lat
+                }
+            }
+            if populations is not None:
+                block['population'] = populations[i]
+            records.append(block)
+
+        return records
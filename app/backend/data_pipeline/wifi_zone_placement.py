@@ -0,0 +1,231 @@
+"""
+Population-Aware WiFi Zone Placement
+
+Chooses WiFi zone sites inside a census tract so that as many residents as
+possible live within the zone radius of a site.
+
+Every block centroid inside the tract is a candidate site and every populated
+block is a demand point weighted by its population. Candidate/demand pairs
+within the radius are found with one STRtree query, then sites are picked
+greedily (maximum covered population not yet covered by an earlier site),
+each round being a single weighted bincount over the pairs.
+
+Blocks come from Snowflake when it is configured, otherwise from the local
+Census block store with populations from the Decennial Census county cache.
+The local source never loads the full shapefile or calls the Census API, so
+it is only used once the store and population cache have been built offline.
+When no source is available, a tract's populations are not cached, or the
+per-request time budget runs out, the pipeline falls back to the
+centroid-offset placement.
+"""
+
+import logging
+import math
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import shapely
+
+from .tract_blocks import TractBlocks
+
+logger = logging.getLogger(__name__)
+
+# Coverage radius of a single WiFi zone
+WIFI_ZONE_RADIUS_KM = 0.5
+
+# Time allowed for population-aware placement across all tracts of one pipeline run
+WIFI_ZONE_TIME_BUDGET_S = float(os.getenv("WIFI_ZONE_TIME_BUDGET_S", "5.0"))
+
+# Approximate km per degree of latitude (matches calculate_wifi_zones_within_tract)
+KM_PER_DEGREE = 111.0
+
+
+def solve_max_coverage(
+    x_km: np.ndarray,
+    y_km: np.ndarray,
+    weights: np.ndarray,
+    candidate_mask: np.ndarray,
+    num_sites: int,
+    radius_km: float,
+) -> List[Dict[str, Any]]:
+    """
+    Greedy weighted maximum-coverage site selection
+
+    Args:
+        x_km: Point x coordinates in a local planar frame (km)
+        y_km: Point y coordinates in a local planar frame (km)
+        weights: Demand weight of each point (e.g. population)
+        candidate_mask: Which points may be chosen as sites
+        num_sites: Maximum number of sites to choose
+        radius_km: Coverage radius of a site
+
+    Returns:
+        List of {'index', 'covered_weight'} in selection order
+    """
+    candidates = np.flatnonzero(candidate_mask)
+    demand = np.flatnonzero(weights > 0)
+    if len(candidates) == 0 or len(demand) == 0:
+        return []
+
+    points = shapely.points(x_km, y_km)
+    tree = shapely.STRtree(points[demand])
+
+    # All (candidate, demand) pairs within the radius, in one query
+    cand_pos, demand_pos = tree.query(
+        points[candidates], predicate='dwithin', distance=radius_km
+    )
+    demand_idx = demand[demand_pos]
+
+    remaining = weights.astype(np.float64).copy()
+    selected = []
+
+    for _ in range(num_sites):
+        gain = np.bincount(
+            cand_pos, weights=remaining[demand_idx], minlength=len(candidates)
+        )
+        best = int(np.argmax(gain))
+        if gain[best] <= 0:
+            break
+
+        selected.append({
+            'index': int(candidates[best]),
+            'covered_weight': float(gain[best]),
+        })
+        remaining[demand_idx[cand_pos == best]] = 0
+
+    return selected
+
+
+def place_wifi_zones_in_tract(
+    blocks: TractBlocks,
+    tract_geometry,
+    num_zones: int = 3,
+    radius_km: float = WIFI_ZONE_RADIUS_KM
+) -> List[Dict[str, Any]]:
+    """
+    Place WiFi zones at block centroids maximizing covered population
+
+    Args:
+        blocks: Blocks of the tract (with population)
+        tract_geometry: Shapely geometry of the tract polygon
+        num_zones: Number of WiFi zones to generate (default 3)
+        radius_km: Coverage radius of each zone in km
+
+    Returns:
+        List of WiFi zone dictionaries with lng/lat coordinates,
+        or an empty list if the blocks carry no population
+    """
+    if len(blocks) == 0 or blocks.population is None or blocks.population.sum() <= 0:
+        return []
+
+    # Project to a local planar frame in km around the tract
+    lat0 = float(np.mean(blocks.centroid_y))
+    lng0 = float(np.mean(blocks.centroid_x))
+    x_km = (blocks.centroid_x - lng0) * KM_PER_DEGREE * math.cos(math.radians(lat0))
+    y_km = (blocks.centroid_y - lat0) * KM_PER_DEGREE
+
+    # Only centroids that fall inside the tract may host a zone
+    candidate_mask = shapely.contains_xy(tract_geometry, blocks.centroid_x, blocks.centroid_y)
+
+    sites = solve_max_coverage(
+        x_km, y_km, blocks.population, candidate_mask, num_zones, radius_km
+    )
+
+    total_population = int(blocks.population.sum())
+    wifi_zones = []
+    for zone_id, site in enumerate(sites, 1):
+        i = site['index']
+        wifi_zones.append({
+            'zone_id': zone_id,
+            'lng': float(blocks.centroid_x[i]),
+            'lat': float(blocks.centroid_y[i]),
+            'block_geoid': blocks.geoids[i],
+            'covered_population': int(site['covered_weight']),
+            'coverage_radius_km': radius_km,
+            'within_bounds': True,
+            'placement': 'population',
+        })
+
+    if wifi_zones:
+        covered = sum(z['covered_population'] for z in wifi_zones)
+        logger.info(
+            f"    Placed {len(wifi_zones)} zones covering {covered:,}/{total_population:,} residents"
+        )
+
+    return wifi_zones
+
+
+def _snowflake_block_source() -> Optional[Callable[[str], TractBlocks]]:
+    """Block source backed by Snowflake (blocks already carry population)"""
+    if not os.getenv("SNOWFLAKE_ACCOUNT"):
+        return None
+
+    try:
+        from .snowflake_blocks import get_snowflake_block_loader
+        loader = get_snowflake_block_loader()
+    except Exception as e:
+        logger.warning(f"Snowflake block source unavailable: {e}")
+        return None
+
+    return loader.get_tract_blocks
+
+
+def _local_block_source() -> Optional[Callable[[str], TractBlocks]]:
+    """Block source backed by the local block store and cached Census populations"""
+    from .block_population import cached_county_block_population, has_cached_block_population
+    from .block_store import BlockStore, default_store_dir
+    from .census_blocks import DEFAULT_SHAPEFILE_PATH, get_block_loader
+
+    if not BlockStore.exists(default_store_dir(DEFAULT_SHAPEFILE_PATH)):
+        logger.info("Local block source unavailable: no block store built")
+        return None
+    if not has_cached_block_population():
+        logger.info("Local block source unavailable: no cached block populations")
+        return None
+
+    loader = get_block_loader()
+
+    def get_blocks(tract_geoid: str) -> TractBlocks:
+        blocks = loader.get_tract_blocks(tract_geoid)
+        if len(blocks) == 0:
+            return blocks
+
+        frame = cached_county_block_population(tract_geoid[:2], tract_geoid[2:5])
+        if frame is None:
+            # Not cached: blocks without population fall back to centroid offsets
+            return blocks
+
+        tract_frame = frame[frame['tract_geoid'] == tract_geoid]
+        populations = dict(zip(tract_frame['block_geoid'], tract_frame['population']))
+        return blocks.with_population([populations.get(g, 0) for g in blocks.geoids.tolist()])
+
+    return get_blocks
+
+
+# Global block source (resolved once per process)
+_block_source: Optional[Callable[[str], TractBlocks]] = None
+_block_source_resolved = False
+_block_source_lock = threading.Lock()
+
+
+def get_block_source() -> Optional[Callable[[str], TractBlocks]]:
+    """
+    Get the block source used for zone placement
+
+    Returns:
+        Callable mapping tract GEOID -> TractBlocks with population,
+        or None if no block data is available
+    """
+    global _block_source, _block_source_resolved
+
+    if not _block_source_resolved:
+        with _block_source_lock:
+            if not _block_source_resolved:
+                _block_source = _snowflake_block_source() or _local_block_source()
+                _block_source_resolved = True
+                if _block_source is None:
+                    logger.info("No block data available; WiFi zones will use centroid offsets")
+
+    return _block_source
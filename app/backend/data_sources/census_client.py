@@ -1,12 +1,61 @@
 """
 Census ACS Data Client
 Fetches demographic data from US Census Bureau API
+
+All tract variables are requested in a single statewide ACS call, run off
+the event loop and cached per state, so the poverty, internet access,
+student and combined views share one download.
 """
+import asyncio
+import sys
+from pathlib import Path
 import httpx
+import pandas as pd
 from typing import Dict, List, Optional
 from census import Census
 from us import states
 
+# Add services directory to path
+services_dir = Path(__file__).parent.parent / 'services'
+if str(services_dir) not in sys.path:
+    sys.path.insert(0, str(services_dir))
+
+from metrics import track_upstream
+
+# ACS 5-Year release used for all tract variables
+ACS_YEAR = 2022
+
+# B17001_002E: Below poverty level
+# B17001_001E: Total population for poverty determination
+# B28002_013E: No internet access
+# B28002_001E: Total households
+# B14001_002E: Enrolled in school (Total)
+# B01001_001E: Total population
+ACS_FIELDS = (
+    'NAME',
+    'B17001_002E', 'B17001_001E',
+    'B28002_013E', 'B28002_001E',
+    'B14001_002E', 'B01001_001E',
+)
+
+_GEO_COLUMNS = ['state', 'county', 'tract', 'name']
+
+
+def _count(df: pd.DataFrame, field: str) -> pd.Series:
+    """Numeric ACS count column (missing values as 0)"""
+    return pd.to_numeric(df[field], errors='coerce').fillna(0)
+
+
+def _total(df: pd.DataFrame, field: str) -> pd.Series:
+    """Numeric ACS universe column (missing or zero values as 1)"""
+    return pd.to_numeric(df[field], errors='coerce').fillna(1).replace(0, 1)
+
+
+def _percent(part: pd.Series, total: pd.Series) -> pd.Series:
+    """part / total as a percentage rounded to 2 places (0 where total <= 0)"""
+    return (part / total * 100).where(total > 0, 0.0).round(2)
+
+
 class CensusDataClient:
     """Client for fetching Census ACS (American Community Survey) data"""
 
@@ -15,53 +64,100 @@ class CensusDataClient:
         self.census = Census(api_key)
         self.base_url = "https://api.census.gov/data"
 
-    async def get_poverty_data(self, state_fips: str = "13") -> List[Dict]:
+        # Statewide tract tables by state FIPS (ACS estimates change yearly)
+        self._statewide: Dict[str, pd.DataFrame] = {}
+        self._statewide_locks: Dict[str, asyncio.Lock] = {}
+
+    def _fetch_statewide(self, state_fips: str) -> pd.DataFrame:
         """
-        Fetch poverty rate data for census tracts in a state
+        Download all tract variables for a state in one ACS request (blocking)
 
         Args:
-            state_fips: State FIPS code (default: "13" for Georgia)
+            state_fips: State FIPS code
 
         Returns:
-            List of dicts with tract poverty data
+            DataFrame with geography columns and derived tract metrics
         """
-        try:
-            # ACS 5-Year estimates for poverty
-            # B17001_002E: Below poverty level
-            # B17001_001E: Total population for poverty determination
+        with track_upstream('census', 'acs5_tracts'):
             data = self.census.acs5.state_county_tract(
-                fields=('NAME', 'B17001_002E', 'B17001_001E'),
+                fields=ACS_FIELDS,
                 state_fips=state_fips,
                 county_fips=Census.ALL,
                 tract=Census.ALL,
-                year=2022
+                year=ACS_YEAR
             )
 
-            results = []
-            for tract in data:
-                try:
-                    below_poverty = float(tract.get('B17001_002E', 0) or 0)
-                    total_pop = float(tract.get('B17001_001E', 1) or 1)
-                    poverty_rate = (below_poverty / total_pop) * 100 if total_pop > 0 else 0
-
-                    results.append({
-                        'state': tract.get('state'),
-                        'county': tract.get('county'),
-                        'tract': tract.get('tract'),
-                        'name': tract.get('NAME'),
-                        'poverty_rate': round(poverty_rate, 2),
-                        'below_poverty_count': int(below_poverty),
-                        'total_population': int(total_pop)
-                    })
-                except (ValueError, TypeError):
-                    continue
-
-            return results
+        df = pd.DataFrame(data, columns=[*ACS_FIELDS, 'state', 'county', 'tract'])
+        df = df.rename(columns={'NAME': 'name'})
+
+        below_poverty = _count(df, 'B17001_002E')
+        poverty_universe = _total(df, 'B17001_001E')
+        no_internet = _count(df, 'B28002_013E')
+        households = _total(df, 'B28002_001E')
+        enrolled = _count(df, 'B14001_002E')
+        population = _total(df, 'B01001_001E')
+
+        return pd.DataFrame({
+            **{column: df[column] for column in _GEO_COLUMNS},
+            'poverty_rate': _percent(below_poverty, poverty_universe),
+            'below_poverty_count': below_poverty.astype(int),
+            'total_population': poverty_universe.astype(int),
+            'no_internet_pct': _percent(no_internet, households),
+            'no_internet_count': no_internet.astype(int),
+            'total_households': households.astype(int),
+            'student_pct': _percent(enrolled, population),
+            'enrolled_count': enrolled.astype(int),
+            'population': population.astype(int),
+        })
+
+    async def get_statewide_data(self, state_fips: str = "13") -> pd.DataFrame:
+        """
+        Get the cached statewide tract table, downloading it on first use
+
+        Concurrent callers for the same state share one download.
+
+        Args:
+            state_fips: State FIPS code (default: "13" for Georgia)
 
+        Returns:
+            DataFrame with one row per tract
+        """
+        if state_fips in self._statewide:
+            return self._statewide[state_fips]
+
+        lock = self._statewide_locks.setdefault(state_fips, asyncio.Lock())
+        async with lock:
+            if state_fips not in self._statewide:
+                self._statewide[state_fips] = await asyncio.to_thread(
+                    self._fetch_statewide, state_fips
+                )
+
+        return self._statewide[state_fips]
+
+    async def _records(self, state_fips: str, columns: List[str], label: str) -> List[Dict]:
+        """Selected columns of the statewide table as a list of dicts"""
+        try:
+            df = await self.get_statewide_data(state_fips)
         except Exception as e:
-            print(f"Error fetching poverty data: {e}")
+            print(f"Error fetching {label} data: {e}")
             return []
 
+        return df[_GEO_COLUMNS + columns].to_dict('records')
+
+    async def get_poverty_data(self, state_fips: str = "13") -> List[Dict]:
+        """
+        Fetch poverty rate data for census tracts in a state
+
+        Args:
+            state_fips: State FIPS code (default: "13" for Georgia)
+
+        Returns:
+            List of dicts with tract poverty data
+        """
+        return await self._records(
+            state_fips, ['poverty_rate', 'below_poverty_count', 'total_population'], 'poverty'
+        )
+
     async def get_internet_access_data(self, state_fips: str = "13") -> List[Dict]:
         """
         Fetch internet access data for census tracts
@@ -72,42 +168,9 @@ class CensusDataClient:
         Returns:
             List of dicts with tract internet access data
         """
-        try:
-            # ACS 5-Year estimates for internet access
-            # B28002_013E: No internet access
-            # B28002_001E: Total households
-            data = self.census.acs5.state_county_tract(
-                fields=('NAME', 'B28002_013E', 'B28002_001E'),
-                state_fips=state_fips,
-                county_fips=Census.ALL,
-                tract=Census.ALL,
-                year=2022
-            )
-
-            results = []
-            for tract in data:
-                try:
-                    no_internet = float(tract.get('B28002_013E', 0) or 0)
-                    total_households = float(tract.get('B28002_001E', 1) or 1)
-                    no_internet_pct = (no_internet / total_households) * 100 if total_households > 0 else 0
-
-                    results.append({
-                        'state': tract.get('state'),
-                        'county': tract.get('county'),
-                        'tract': tract.get('tract'),
-                        'name': tract.get('NAME'),
-                        'no_internet_pct': round(no_internet_pct, 2),
-                        'no_internet_count': int(no_internet),
-                        'total_households': int(total_households)
-                    })
-                except (ValueError, TypeError):
-                    continue
-
-            return results
-
-        except Exception as e:
-            print(f"Error fetching internet access data: {e}")
-            return []
+        return await self._records(
+            state_fips, ['no_internet_pct', 'no_internet_count', 'total_households'], 'internet access'
+        )
 
     async def get_student_population_data(self, state_fips: str = "13") -> List[Dict]:
         """
@@ -119,42 +182,12 @@ class CensusDataClient:
         Returns:
             List of dicts with student population data
         """
-        try:
-            # ACS 5-Year estimates for school enrollment
-            # B14001_002E: Enrolled in school (Total)
-            # B01001_001E: Total population
-            data = self.census.acs5.state_county_tract(
-                fields=('NAME', 'B14001_002E', 'B01001_001E'),
-                state_fips=state_fips,
-                county_fips=Census.ALL,
-                tract=Census.ALL,
-                year=2022
-            )
-
-            results = []
-            for tract in data:
-                try:
-                    enrolled = float(tract.get('B14001_002E', 0) or 0)
-                    total_pop = float(tract.get('B01001_001E', 1) or 1)
-                    student_pct = (enrolled / total_pop) * 100 if total_pop > 0 else 0
-
-                    results.append({
-                        'state': tract.get('state'),
-                        'county': tract.get('county'),
-                        'tract': tract.get('tract'),
-                        'name': tract.get('NAME'),
-                        'student_pct': round(student_pct, 2),
-                        'enrolled_count': int(enrolled),
-                        'total_population': int(total_pop)
-                    })
-                except (ValueError, TypeError):
-                    continue
-
-            return results
-
-        except Exception as e:
-            print(f"Error fetching student population data: {e}")
-            return []
+        records = await self._records(
+            state_fips, ['student_pct', 'enrolled_count', 'population'], 'student population'
+        )
+        for record in records:
+            record['total_population'] = record.pop('population')
+        return records
 
     async def get_combined_data(self, state_fips: str = "13") -> List[Dict]:
         """
@@ -166,27 +199,12 @@ class CensusDataClient:
         Returns:
             List of dicts with combined tract data
         """
-        poverty_data = await self.get_poverty_data(state_fips)
-        internet_data = await self.get_internet_access_data(state_fips)
-        student_data = await self.get_student_population_data(state_fips)
-
-        # Merge data by tract ID
-        combined = {}
-
-        for tract in poverty_data:
-            tract_id = f"{tract['state']}{tract['county']}{tract['tract']}"
-            combined[tract_id] = tract
-
-        for tract in internet_data:
-            tract_id = f"{tract['state']}{tract['county']}{tract['tract']}"
-            if tract_id in combined:
-                combined[tract_id]['no_internet_pct'] = tract['no_internet_pct']
-                combined[tract_id]['no_internet_count'] = tract['no_internet_count']
-
-        for tract in student_data:
-            tract_id = f"{tract['state']}{tract['county']}{tract['tract']}"
-            if tract_id in combined:
-                combined[tract_id]['student_pct'] = tract['student_pct']
-                combined[tract_id]['enrolled_count'] = tract['enrolled_count']
-
-        return list(combined.values())
+        return await self._records(
+            state_fips,
+            [
+                'poverty_rate', 'below_poverty_count', 'total_population',
+                'no_internet_pct', 'no_internet_count',
+                'student_pct', 'enrolled_count',
+            ],
+            'combined'
+        )
@@ -1,7 +1,8 @@
+import asyncio
 import os
 import sys
-import json
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
@@ -10,10 +11,96 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# Add services directory to path
+services_dir = os.path.join(current_dir, 'services')
+if services_dir not in sys.path:
+    sys.path.insert(0, services_dir)
+
+from fast_json import FastJSONResponse, dumps, loads
+from fastapi.responses import PlainTextResponse
+from metrics import cache_samples, get_metrics_registry, lru_cache_stats, register_cache
+from warmup import STARTUP_WARMUP, WarmupState, warm_up
+
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 
-app = FastAPI(title="CivicConnect WiFi Assistant API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warmup = WarmupState()
+    warmup.start()
+    app.state.warmup = warmup
+
+    # Create the chat orchestrator once (Gemini model + coverage table) and share it
+    from agents.orchestrator import GeminiOrchestrator
+    app.state.orchestrator = await asyncio.to_thread(
+        warmup.run_step,
+        "orchestrator",
+        GeminiOrchestrator,
+        gemini_api_key=os.getenv("GEMINI_API_KEY"),
+        census_api_key=os.getenv("CENSUS_API_KEY")
+    )
+    if app.state.orchestrator is not None:
+        print(f"✓ Chat LLM backend: {app.state.orchestrator.backend.name}")
+    else:
+        print(f"Warning: chat disabled: {warmup.steps['orchestrator']['error']}")
+
+    register_metrics_collectors(app.state.orchestrator, warmup)
+
+    # Preload datasets and indexes; /health reports 503 until this finishes
+    warmup_task = None
+    if STARTUP_WARMUP == "blocking":
+        await warm_up(warmup)
+    elif STARTUP_WARMUP == "off":
+        warmup.finish()
+    else:
+        warmup_task = asyncio.create_task(warm_up(warmup))
+
+    yield
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+    # Close the shared TIGER HTTP client
+    from tiger_api import get_async_tiger_service
+    await get_async_tiger_service().aclose()
+
+def register_metrics_collectors(orchestrator=None, warmup=None):
+    """Report cache, upstream and chat counters on every /metrics scrape"""
+    from feature_lru import get_feature_lru
+    from geometry_cache import get_geometry_cache
+    from response_cache import get_response_cache
+    from tiger_api import get_async_tiger_service
+
+    registry = get_metrics_registry()
+    register_cache("feature_lru", get_feature_lru().stats)
+    register_cache("http_response", get_response_cache().stats)
+    register_cache("geometry_cache", lambda: get_geometry_cache().stats())
+    registry.register_collector("geometry_cache", lambda: [
+        ("geometry_cache_entries", "gauge", "Geometries stored in the SQLite cache by kind", {"kind": kind}, count)
+        for kind, count in get_geometry_cache().entries_by_kind().items()
+    ])
+    registry.register_collector("tiger_async", lambda: get_async_tiger_service().metrics_samples())
+
+    # Snowflake block queries (only reported once the loader has been imported)
+    def snowflake_blocks():
+        module = sys.modules.get("data_pipeline.snowflake_blocks")
+        if module is None:
+            return []
+        return cache_samples(
+            "snowflake_tract_blocks", lru_cache_stats(module.SnowflakeBlockLoader.get_tract_blocks)
+        )
+    registry.register_collector("cache:snowflake_tract_blocks", snowflake_blocks)
+
+    if orchestrator is not None:
+        registry.register_collector("chat", orchestrator.metrics_samples)
+    if warmup is not None:
+        registry.register_collector("warmup", warmup.metrics_samples)
+
+app = FastAPI(
+    title="CivicConnect WiFi Assistant API",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
+)
 
 # Configure CORS for Next.js frontend
 app.add_middleware(
@@ -41,34 +128,47 @@ async def root():
     return {"message": "CivicConnect WiFi Assistant API", "status": "running"}
 
 @app.get("/health")
-async def health():
-    return {"status": "healthy"}
+async def health(request: Request):
+    """Readiness: 503 until the startup warm-up has finished"""
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is None:
+        return {"status": "healthy"}
+    if not warmup.ready:
+        return FastJSONResponse({"status": "starting", "warmup": warmup.to_dict()}, status_code=503)
+    return {"status": "healthy", "warmup": warmup.to_dict()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Pipeline, cache, upstream and chat metrics in the Prometheus text format"""
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
 
 @app.websocket("/ws/chat")
 async def websocket_chat_endpoint(websocket: WebSocket):
     await websocket.accept()
 
+    from agents.session import ChatSession
+    session = ChatSession()
+
     try:
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = loads(data)
 
             user_message = message_data.get("message", "")
             city = message_data.get("city", "Atlanta")
 
-            # Import orchestrator here to avoid circular imports
-            from agents.orchestrator import AgentOrchestrator
-
-            # Create orchestrator instance
-            orchestrator = AgentOrchestrator(
-                gemini_api_key=os.getenv("GEMINI_API_KEY"),
-                census_api_key=os.getenv("CENSUS_API_KEY")
-            )
+            # Shared orchestrator created at startup
+            orchestrator = websocket.app.state.orchestrator
+            if orchestrator is None:
+                raise RuntimeError("Gemini API key is required")
 
             # Process query and stream responses
-            async for step_data in orchestrator.process_query(user_message, city):
-                await websocket.send_json(step_data)
+            async for step_data in orchestrator.process_query(user_message, city, session):
+                await websocket.send_text(dumps(step_data).decode('utf-8'))
 
     except WebSocketDisconnect:
         print("Client disconnected")
@@ -2,9 +2,13 @@
 Boundary API Router
 
 Endpoints for fetching state, county, and census tract boundaries
+
+Successful responses are cached as serialized (and compressed) bytes with
+ETag/Last-Modified validators; see services/response_cache.py.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import Optional
 import sys
 import os
@@ -16,7 +20,10 @@ services_dir = current_dir / 'services'
 if str(services_dir) not in sys.path:
     sys.path.insert(0, str(services_dir))
 
-from tiger_api import TIGERAPIService
+from tiger_api import get_async_tiger_service
+from geometry_cache import get_geometry_cache
+from response_cache import get_response_cache
+from fast_json import load
 
 router = APIRouter(
     prefix="/api/boundaries",
@@ -24,12 +31,15 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# Initialize TIGER API service
-tiger_service = TIGERAPIService()
+# Shared async TIGER service (pooled HTTP client, coalesced upstream requests)
+tiger_service = get_async_tiger_service()
+
+# Serialized response cache
+response_cache = get_response_cache()
 
 
 @router.get("/state/{state_name}")
-async def get_state_boundary(state_name: str):
+async def get_state_boundary(state_name: str, request: Request):
     """
     Fetch state boundary from Census TIGER API
 
@@ -39,23 +49,26 @@ async def get_state_boundary(state_name: str):
     Returns:
         GeoJSON feature with state boundary
     """
-    boundary = tiger_service.fetch_state_boundary(state_name)
+    async def build():
+        boundary = await tiger_service.fetch_state_boundary(state_name)
 
-    if not boundary:
-        raise HTTPException(
-            status_code=404,
-            detail=f"State boundary not found for {state_name}"
-        )
+        if not boundary:
+            raise HTTPException(
+                status_code=404,
+                detail=f"State boundary not found for {state_name}"
+            )
 
-    return {
-        "status": "success",
-        "state": state_name,
-        "boundary": boundary
-    }
+        return {
+            "status": "success",
+            "state": state_name,
+            "boundary": boundary
+        }
+
+    return await response_cache.respond(request, ("state", state_name), build)
 
 
 @router.get("/tract/{geoid}")
-async def get_tract_boundary(geoid: str):
+async def get_tract_boundary(geoid: str, request: Request):
     """
     Fetch census tract boundary by GEOID
 
@@ -71,24 +84,28 @@ async def get_tract_boundary(geoid: str):
             detail=f"Invalid GEOID format. Expected 11 digits, got {len(geoid)}"
         )
 
-    boundary = tiger_service.fetch_tract_boundary(geoid)
+    async def build():
+        boundary = await tiger_service.fetch_tract_boundary(geoid)
 
-    if not boundary:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Census tract boundary not found for GEOID {geoid}"
-        )
+        if not boundary:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Census tract boundary not found for GEOID {geoid}"
+            )
+
+        return {
+            "status": "success",
+            "geoid": geoid,
+            "boundary": boundary
+        }
 
-    return {
-        "status": "success",
-        "geoid": geoid,
-        "boundary": boundary
-    }
+    return await response_cache.respond(request, ("tract", geoid), build)
 
 
 @router.get("/tracts/state/{state_name}")
 async def list_tracts_in_state(
     state_name: str,
+    request: Request,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of tracts to return")
 ):
     """
@@ -101,24 +118,28 @@ async def list_tracts_in_state(
     Returns:
         List of census tract metadata
     """
-    tracts = tiger_service.fetch_tracts_in_state(state_name, limit=limit)
+    async def build():
+        tracts = await tiger_service.fetch_tracts_in_state(state_name, limit=limit)
 
-    if not tracts:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No census tracts found for {state_name}"
-        )
+        if not tracts:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No census tracts found for {state_name}"
+            )
 
-    return {
-        "status": "success",
-        "state": state_name,
-        "count": len(tracts),
-        "tracts": tracts
-    }
+        return {
+            "status": "success",
+            "state": state_name,
+            "count": len(tracts),
+            "tracts": tracts
+        }
+
+    return await response_cache.respond(request, ("tracts", state_name, limit), build)
 
 
 @router.get("/county")
 async def get_county_boundary(
+    request: Request,
     county_name: str = Query(..., description="County name (e.g., 'Madison County')"),
     state_name: str = Query(..., description="State name (e.g., 'Florida')"),
     city_slug: str = Query(..., description="City slug for caching (e.g., 'madison-county-fl')")
@@ -134,100 +155,79 @@ async def get_county_boundary(
     Returns:
         GeoJSON feature with county boundary
     """
-    import requests
-    import json
-
-    # State FIPS codes
-    state_fips_map = tiger_service.STATE_FIPS
-
-    # Cache directory
-    cache_dir = Path(current_dir).parent.parent / 'cache' / 'boundaries'
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / f'{city_slug}.json'
-
-    # Check cache first
-    if cache_file.exists():
+    def put_cached(boundary):
         try:
-            with open(cache_file, 'r') as f:
-                boundary = json.load(f)
-            return {
-                "status": "success",
-                "city_slug": city_slug,
-                "boundary": boundary,
-                "source": "cache"
-            }
+            get_geometry_cache().put('boundary', city_slug, boundary)
         except Exception:
             pass
 
-    # Try to load from static file (if exists)
-    static_file = current_dir.parent / 'frontend' / 'public' / 'data' / 'cities' / f'{city_slug}.json'
+    def load_cached():
+        """Geometry cache, legacy cache file, then static file (blocking I/O)"""
+        # Check cache first (importing a legacy cache/boundaries/{slug}.json on miss)
+        geometry_cache = get_geometry_cache()
+        legacy_cache_file = Path(current_dir).parent.parent / 'cache' / 'boundaries' / f'{city_slug}.json'
 
-    if static_file.exists():
-        try:
-            with open(static_file, 'r') as f:
-                boundary = json.load(f)
+        boundary = geometry_cache.get('boundary', city_slug) or geometry_cache.import_legacy_file(
+            'boundary', city_slug, legacy_cache_file
+        )
+        if boundary:
+            return boundary, "cache"
 
-            # Cache it
+        # Try to load from static file (if exists)
+        static_file = current_dir.parent / 'frontend' / 'public' / 'data' / 'cities' / f'{city_slug}.json'
+
+        if static_file.exists():
             try:
-                with open(cache_file, 'w') as f:
-                    json.dump(boundary, f, indent=2)
-            except Exception:
-                pass
+                boundary = load(static_file)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to load static file: {str(e)}"
+                )
+
+            # Cache it
+            put_cached(boundary)
+            return boundary, "static_file"
 
+        return None, None
+
+    async def build():
+        import httpx
+
+        # Cache and file reads run off the event loop
+        boundary, source = await asyncio.to_thread(load_cached)
+        if boundary:
             return {
                 "status": "success",
                 "city_slug": city_slug,
                 "boundary": boundary,
-                "source": "static_file"
+                "source": source
             }
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to load static file: {str(e)}"
-            )
 
-    # Fallback: Try Census TIGER API
-    county_clean = county_name.replace(' County', '').replace(' county', '').strip()
-    state_fips = state_fips_map.get(state_name, '00')
+        # Fallback: Local TIGER/Line data, then Census TIGER API
+        try:
+            boundary = await tiger_service.fetch_county_boundary(county_name, state_name)
 
-    try:
-        api_url = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_Current/MapServer/82/query"
+            if not boundary:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Boundary not found for {county_name}, {state_name}"
+                )
 
-        params = {
-            'where': f"GEOID LIKE '{state_fips}%' AND BASENAME LIKE '%{county_clean}%'",
-            'outFields': '*',
-            'outSR': '4326',
-            'f': 'geojson'
-        }
+            # Cache the result
+            await asyncio.to_thread(put_cached, boundary)
 
-        response = requests.get(api_url, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+            return {
+                "status": "success",
+                "city_slug": city_slug,
+                "boundary": boundary,
+                "source": boundary['properties'].get('source', 'census_tiger')
+            }
 
-        if not data.get('features') or len(data['features']) == 0:
+        except httpx.HTTPError as e:
             raise HTTPException(
-                status_code=404,
-                detail=f"Boundary not found for {county_name}, {state_name}"
+                status_code=500,
+                detail=f"Failed to fetch boundary from Census API: {str(e)}"
             )
 
-        boundary = data['features'][0]
-
-        # Cache the result
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(boundary, f, indent=2)
-        except Exception:
-            pass
-
-        return {
-            "status": "success",
-            "city_slug": city_slug,
-            "boundary": boundary,
-            "source": "census_tiger"
-        }
-
-    except requests.RequestException as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to fetch boundary from Census API: {str(e)}"
-        )
+    return await response_cache.respond(request, ("county", city_slug), build)
@@ -38,17 +38,17 @@ async def run_deployment_pipeline_for_location(location: LocationInput):
         JSON containing ranked deployment sites and geometries
     """
     try:
-        # Add data_pipeline and services directories to path
+        # Add backend and services directories to path
         current_dir = Path(__file__).parent.parent
-        pipeline_dir = current_dir / 'data_pipeline'
         services_dir = current_dir / 'services'
 
-        if str(pipeline_dir) not in sys.path:
-            sys.path.insert(0, str(pipeline_dir))
+        if str(current_dir) not in sys.path:
+            sys.path.insert(0, str(current_dir))
         if str(services_dir) not in sys.path:
             sys.path.insert(0, str(services_dir))
 
-        from run_pipeline import run_deployment_pipeline_with_location
+        # Same module the chat orchestrator and startup warm-up use, so its caches are shared
+        from data_pipeline.run_pipeline import run_deployment_pipeline_with_location
 
         # Run the pipeline with location information
         result = run_deployment_pipeline_with_location(
@@ -0,0 +1,90 @@
+"""
+Census Block Store Builder
+
+Converts a Census block shapefile into the memory-mapped block store used by
+CensusBlockLoader, so blocks can be read per tract without loading the whole
+shapefile.
+
+This script only needs to run once per state (or whenever the shapefile changes).
+
+Usage:
+    python scripts/build_census_block_store.py [--state STATE] [--shapefile PATH] [--output DIR]
+
+Arguments:
+    --state: State FIPS code (default: 12 for Florida)
+    --shapefile: Path to shapefile (overrides default path)
+    --output: Store directory (default: next to the shapefile)
+"""
+
+import sys
+import argparse
+import logging
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.block_store import BlockStore, build_block_store
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main build script"""
+    parser = argparse.ArgumentParser(
+        description='Build a memory-mapped Census block store from a shapefile'
+    )
+    parser.add_argument(
+        '--state',
+        default='12',
+        help='State FIPS code (default: 12 for Florida)'
+    )
+    parser.add_argument(
+        '--shapefile',
+        help='Path to shapefile (overrides default path)'
+    )
+    parser.add_argument(
+        '--output',
+        help='Store directory (default: next to the shapefile)'
+    )
+
+    args = parser.parse_args()
+
+    # Determine shapefile path
+    if args.shapefile:
+        shapefile_path = args.shapefile
+    else:
+        project_root = Path(__file__).parent.parent.parent.parent
+        shapefile_path = str(
+            project_root / f"data/tl_2024_{args.state}_tabblock20/tl_2024_{args.state}_tabblock20.shp"
+        )
+
+    logger.info("=" * 80)
+    logger.info("Census Block Store Build")
+    logger.info("=" * 80)
+    logger.info(f"Shapefile: {shapefile_path}")
+
+    start = time.perf_counter()
+    store_dir = build_block_store(shapefile_path, args.output)
+    elapsed = time.perf_counter() - start
+
+    # Verify the store opens and can serve a tract
+    store = BlockStore(store_dir)
+    tract_geoids = store.tract_geoids()
+    if tract_geoids:
+        sample = store.read_tract(tract_geoids[0])
+        logger.info(f"  Sample tract {tract_geoids[0]}: {len(sample['geoids'])} blocks")
+
+    logger.info("=" * 80)
+    logger.info(f"✓ Block store ready at {store_dir} ({elapsed:.1f}s)")
+    logger.info("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
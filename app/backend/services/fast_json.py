@@ -0,0 +1,150 @@
+"""
+Fast JSON Serialization
+
+Single place for JSON encoding/decoding of API responses and cache files.
+Uses orjson when it is installed (several times faster than the stdlib on
+large GeoJSON, and it writes numpy scalars/arrays directly) and falls back to
+the stdlib `json` module otherwise. Set JSON_BACKEND=json to force the
+stdlib implementation, e.g. when comparing outputs.
+
+Output is always compact UTF-8 (no indentation). NaN and Infinity are
+written as null by both backends, so responses stay valid JSON.
+"""
+
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any, Union
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Active backend ('orjson' or 'json')
+JSON_BACKEND = 'orjson' if orjson is not None and os.getenv('JSON_BACKEND', 'orjson') != 'json' else 'json'
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types neither backend handles natively"""
+    if hasattr(obj, 'isoformat'):  # datetime, date, pandas Timestamp
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):  # numpy scalars and arrays (stdlib backend)
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Replace NaN/Infinity with None (stdlib backend only)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(v) for v in obj]
+    return obj
+
+
+if JSON_BACKEND == 'orjson':
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize to compact UTF-8 JSON
+
+        Args:
+            obj: JSON-compatible object (numpy values, datetimes and sets allowed)
+
+        Returns:
+            Encoded JSON bytes
+        """
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Parse JSON
+
+        Args:
+            data: JSON text or bytes
+
+        Returns:
+            Decoded object
+        """
+        return orjson.loads(data)
+
+else:
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize to compact UTF-8 JSON
+
+        Args:
+            obj: JSON-compatible object (numpy values, datetimes and sets allowed)
+
+        Returns:
+            Encoded JSON bytes
+        """
+        try:
+            text = json.dumps(obj, default=_default, separators=(',', ':'), ensure_ascii=False, allow_nan=False)
+        except ValueError:
+            text = json.dumps(
+                _replace_non_finite(obj), default=_default, separators=(',', ':'), ensure_ascii=False
+            )
+        return text.encode('utf-8')
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Parse JSON
+
+        Args:
+            data: JSON text or bytes
+
+        Returns:
+            Decoded object
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+def dump(obj: Any, path: Union[str, Path]):
+    """
+    Write compact JSON to a file (atomically, via a temporary file)
+
+    Args:
+        obj: JSON-compatible object
+        path: Output file path
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(dumps(obj))
+    tmp_path.replace(path)
+
+
+def load(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Decoded object
+    """
+    return loads(Path(path).read_bytes())
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the fast JSON backend"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,234 @@
+"""
+In-Memory Feature LRU
+
+Byte-bounded LRU of parsed GeoJSON features and their shapely geometries,
+sitting in front of the SQLite geometry stores (GeometryCache). Hot boundaries
+such as the multi-megabyte Florida state outline are served without touching
+SQLite, decoding WKB or rebuilding GeoJSON.
+
+Entries are sized from their WKB and properties JSON (parsed GeoJSON takes
+several times the WKB size in Python objects), so the bound is approximate
+but proportional to real memory use.
+
+Callers receive a new feature dict with a copied properties dict on every
+hit, so they may add properties freely; the geometry mapping is shared and
+must be treated as read-only. shape_of() returns the cached shapely geometry
+for a feature that came from the cache, avoiding another shape() parse.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from shapely.geometry import shape
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for cached features
+GEOMETRY_MEMORY_CACHE_MB = float(os.getenv('GEOMETRY_MEMORY_CACHE_MB', '256'))
+
+# Approximate Python object bytes per WKB byte (GeoJSON tuples + shapely geometry)
+_BYTES_PER_WKB_BYTE = 8
+
+# Fixed per-entry overhead (dicts, entry bookkeeping)
+_ENTRY_OVERHEAD = 512
+
+
+def estimate_size(wkb: Optional[bytes], properties_json: str) -> int:
+    """
+    Estimate the memory held by a cached feature
+
+    Args:
+        wkb: Geometry WKB (or None)
+        properties_json: Properties serialized as JSON
+
+    Returns:
+        Approximate size in bytes
+    """
+    wkb_size = len(wkb) if wkb else 0
+    return wkb_size * _BYTES_PER_WKB_BYTE + len(properties_json) * 2 + _ENTRY_OVERHEAD
+
+
+def copy_feature(feature: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached feature for a caller
+
+    Args:
+        feature: Cached GeoJSON feature
+
+    Returns:
+        New feature dict with copied properties and the shared geometry mapping
+    """
+    return {
+        'type': 'Feature',
+        'properties': dict(feature['properties']),
+        'geometry': feature['geometry'],
+    }
+
+
+class _Entry:
+    """Cached feature with its shapely geometry"""
+
+    __slots__ = ('feature', 'geometry', 'size', 'fetched_at')
+
+    def __init__(self, feature: Dict[str, Any], geometry, size: int, fetched_at: float):
+        self.feature = feature
+        self.geometry = geometry
+        self.size = size
+        self.fetched_at = fetched_at
+
+
+class FeatureLRU:
+    """Byte-bounded LRU of parsed features"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize feature LRU
+
+        Args:
+            max_bytes: Memory budget; least recently used entries are evicted beyond it
+        """
+        self.max_bytes = max_bytes
+
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._shapes: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, min_fetched_at: float = float('-inf')) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached feature
+
+        Args:
+            key: Cache key
+            min_fetched_at: Entries fetched before this time count as misses
+
+        Returns:
+            New feature dict (shared geometry, copied properties), or None on miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.fetched_at < min_fetched_at:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy_feature(entry.feature)
+
+    def put(self, key: Hashable, feature: Dict[str, Any], geometry, size: int, fetched_at: float):
+        """
+        Add a feature
+
+        Args:
+            key: Cache key
+            feature: Parsed GeoJSON feature (kept as-is; do not mutate afterwards)
+            geometry: Shapely geometry of the feature (or None)
+            size: Estimated size in bytes (see estimate_size)
+            fetched_at: Fetch time of the stored feature
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(feature, geometry, size, fetched_at)
+            if feature.get('geometry') is not None and geometry is not None:
+                self._shapes[id(feature['geometry'])] = geometry
+            self.bytes += size
+
+            while self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """Drop an entry (lock held)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+            if entry.feature.get('geometry') is not None:
+                self._shapes.pop(id(entry.feature['geometry']), None)
+
+    def invalidate(self, key: Hashable):
+        """Remove a feature if cached"""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        """Remove all features"""
+        with self._lock:
+            self._entries.clear()
+            self._shapes.clear()
+            self.bytes = 0
+
+    def shape_of(self, feature: Dict[str, Any]):
+        """
+        Get the shapely geometry of a feature
+
+        Args:
+            feature: GeoJSON feature
+
+        Returns:
+            Cached shapely geometry if the feature came from this cache,
+            otherwise a newly parsed one (None if the feature has no geometry)
+        """
+        geometry = feature.get('geometry')
+        if geometry is None:
+            return None
+
+        with self._lock:
+            cached = self._shapes.get(id(geometry))
+        return cached if cached is not None else shape(geometry)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Global feature LRU (shared by all geometry stores)
+_feature_lru: Optional[FeatureLRU] = None
+
+
+def get_feature_lru() -> FeatureLRU:
+    """
+    Get or create the global feature LRU
+
+    Returns:
+        FeatureLRU instance
+    """
+    global _feature_lru
+
+    if _feature_lru is None:
+        _feature_lru = FeatureLRU(int(GEOMETRY_MEMORY_CACHE_MB * 1024 * 1024))
+
+    return _feature_lru
+
+
+def shape_of(feature: Dict[str, Any]):
+    """
+    Get the shapely geometry of a feature, reusing the cached one when possible
+
+    Args:
+        feature: GeoJSON feature
+
+    Returns:
+        Shapely geometry (None if the feature has no geometry)
+    """
+    return get_feature_lru().shape_of(feature)
@@ -0,0 +1,336 @@
+"""
+Geometry Cache Store
+
+Single SQLite-backed cache for boundary and tract geometries, shared by
+TIGERAPIService, TractGeometryFetcher and the deployment pipeline.
+
+Each entry is keyed by (kind, key) - e.g. ('tract', '12079110200'),
+('state', 'florida') or ('boundary', 'madison-county-fl') - and stores the
+geometry as WKB, the feature properties as compact JSON and the fetch time.
+Entries older than the TTL are treated as misses. Bulk reads are a single
+indexed query per chunk of keys instead of one file open and JSON parse per
+feature.
+
+Decoded features are kept in the shared in-memory FeatureLRU (see
+feature_lru.py), so repeated reads of hot boundaries skip SQLite entirely.
+
+Older per-feature JSON cache files are imported on first miss, so existing
+caches keep working without a migration step.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import shapely
+from shapely.geometry import mapping, shape
+
+from fast_json import dumps, load, loads
+from feature_lru import FeatureLRU, copy_feature, estimate_size, get_feature_lru
+
+logger = logging.getLogger(__name__)
+
+# Default database location (project_root/cache/geometry_cache.sqlite)
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent.parent / 'cache' / 'geometry_cache.sqlite'
+
+# Entries older than this are refetched (boundaries change at most yearly)
+DEFAULT_TTL_S = float(os.getenv('GEOMETRY_CACHE_TTL_S', str(90 * 24 * 3600)))
+
+# SQLite limits the number of bound parameters per statement
+_MAX_KEYS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geometries (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    geometry BLOB,
+    properties TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID
+"""
+
+
+class GeometryCache:
+    """SQLite store of GeoJSON features keyed by kind and GEOID/slug"""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_S,
+        memory: Optional[FeatureLRU] = None
+    ):
+        """
+        Initialize geometry cache
+
+        Args:
+            db_path: SQLite database path (default project_root/cache/geometry_cache.sqlite)
+            ttl_seconds: Maximum entry age, or None to never expire
+            memory: In-memory tier (default: shared global FeatureLRU)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.memory = memory or get_feature_lru()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+        # Lookup counters (per key) and entry counts by kind, kept up to date
+        # by get/put/delete so stats() never queries SQLite
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._entries: Dict[str, int] = dict(self._conn.execute(
+            "SELECT kind, COUNT(*) FROM geometries GROUP BY kind"
+        ).fetchall())
+
+    @staticmethod
+    def _encode(feature: Dict[str, Any]):
+        """Split a GeoJSON feature into (WKB, properties JSON)"""
+        geometry = feature.get('geometry')
+        wkb = shapely.to_wkb(shape(geometry)) if geometry else None
+        properties = dumps(feature.get('properties') or {}).decode('utf-8')
+        return wkb, properties
+
+    @staticmethod
+    def _decode(wkb: Optional[bytes], properties: str):
+        """Rebuild a GeoJSON feature and its shapely geometry from stored WKB and properties"""
+        geometry = shapely.from_wkb(wkb) if wkb is not None else None
+        feature = {
+            'type': 'Feature',
+            'properties': loads(properties),
+            'geometry': mapping(geometry) if geometry is not None else None,
+        }
+        return feature, geometry
+
+    def _memory_key(self, kind: str, key: str):
+        """Key of an entry in the in-memory tier"""
+        return (str(self.db_path), kind, key)
+
+    def _min_fetched_at(self) -> float:
+        """Oldest fetch time still considered fresh"""
+        if self.ttl_seconds is None:
+            return float('-inf')
+        return time.time() - self.ttl_seconds
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached feature
+
+        Args:
+            kind: Entry kind (e.g. 'tract', 'state', 'boundary')
+            key: GEOID or slug
+
+        Returns:
+            GeoJSON feature, or None if missing or expired
+        """
+        return self.get_many(kind, [key]).get(key)
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several cached features
+
+        Args:
+            kind: Entry kind
+            keys: GEOIDs or slugs
+
+        Returns:
+            Dictionary mapping key to GeoJSON feature (fresh hits only)
+        """
+        min_fetched_at = self._min_fetched_at()
+        results = {}
+        missing = []
+        requested = dict.fromkeys(str(k) for k in keys)
+
+        # In-memory tier first
+        for key in requested:
+            feature = self.memory.get(self._memory_key(kind, key), min_fetched_at)
+            if feature is not None:
+                results[key] = feature
+            else:
+                missing.append(key)
+
+        rows = []
+        with self._lock:
+            for i in range(0, len(missing), _MAX_KEYS_PER_QUERY):
+                chunk = missing[i:i + _MAX_KEYS_PER_QUERY]
+                placeholders = ','.join('?' * len(chunk))
+                rows.extend(self._conn.execute(
+                    f"SELECT key, geometry, properties, fetched_at FROM geometries "
+                    f"WHERE kind = ? AND key IN ({placeholders})",
+                    [kind, *chunk]
+                ).fetchall())
+
+        # Entries past the TTL are misses (and counted as expired)
+        fresh = [row for row in rows if row[3] >= min_fetched_at]
+        with self._lock:
+            self.hits += len(results) + len(fresh)
+            self.misses += len(requested) - len(results) - len(fresh)
+            self.expired += len(rows) - len(fresh)
+
+        for key, wkb, properties, fetched_at in fresh:
+            feature, geometry = self._decode(wkb, properties)
+            self.memory.put(
+                self._memory_key(kind, key), feature, geometry,
+                estimate_size(wkb, properties), fetched_at
+            )
+            results[key] = copy_feature(feature)
+
+        return results
+
+    def get_properties(self, kind: str, key_prefix: str = '') -> Dict[str, Dict[str, Any]]:
+        """
+        Get feature properties (without geometry) for keys starting with a prefix
+
+        Args:
+            kind: Entry kind
+            key_prefix: Key prefix (e.g. a state FIPS code), or '' for all keys
+
+        Returns:
+            Dictionary mapping key to properties (fresh entries only)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, properties FROM geometries "
+                "WHERE kind = ? AND key GLOB ? AND fetched_at >= ? ORDER BY key",
+                (kind, f"{key_prefix}*", self._min_fetched_at())
+            ).fetchall()
+
+        return {key: loads(properties) for key, properties in rows}
+
+    def put(self, kind: str, key: str, feature: Dict[str, Any]):
+        """
+        Store a feature
+
+        Args:
+            kind: Entry kind
+            key: GEOID or slug
+            feature: GeoJSON feature
+        """
+        self.put_many(kind, {key: feature})
+
+    def put_many(self, kind: str, features: Dict[str, Dict[str, Any]]):
+        """
+        Store several features in one transaction
+
+        Args:
+            kind: Entry kind
+            features: Dictionary mapping key to GeoJSON feature
+        """
+        if not features:
+            return
+
+        fetched_at = time.time()
+        rows = [
+            (kind, str(key), *self._encode(feature), fetched_at)
+            for key, feature in features.items()
+        ]
+
+        keys = [row[1] for row in rows]
+        with self._lock, self._conn:
+            existing = 0
+            for i in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[i:i + _MAX_KEYS_PER_QUERY]
+                placeholders = ','.join('?' * len(chunk))
+                existing += self._conn.execute(
+                    f"SELECT COUNT(*) FROM geometries WHERE kind = ? AND key IN ({placeholders})",
+                    [kind, *chunk]
+                ).fetchone()[0]
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO geometries (kind, key, geometry, properties, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._entries[kind] = self._entries.get(kind, 0) + len(rows) - existing
+
+        for key in features:
+            self.memory.invalidate(self._memory_key(kind, str(key)))
+
+    def delete(self, kind: str, key: str):
+        """Remove a cached feature"""
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM geometries WHERE kind = ? AND key = ?", (kind, key)
+            ).rowcount
+            self._entries[kind] = self._entries.get(kind, 0) - deleted
+        self.memory.invalidate(self._memory_key(kind, key))
+
+    def import_legacy_file(self, kind: str, key: str, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Import a feature from an old per-feature JSON cache file
+
+        Args:
+            kind: Entry kind
+            key: GEOID or slug
+            path: Legacy JSON file
+
+        Returns:
+            The imported GeoJSON feature, or None if the file is missing or unreadable
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        try:
+            feature = load(path)
+            self.put(kind, key, feature)
+        except Exception as e:
+            logger.warning(f"Could not import legacy cache file {path}: {e}")
+            return None
+
+        logger.info(f"✓ Imported {kind} {key} from {path.name} into geometry cache")
+        return feature
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters and current size (no database query)
+
+        Expired entries are reported as evictions: they are served as misses
+        and replaced on the next fetch.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.expired,
+                'entries': sum(self._entries.values()),
+            }
+
+    def entries_by_kind(self) -> Dict[str, int]:
+        """Stored entries by kind, including expired ones (no database query)"""
+        with self._lock:
+            return {kind: count for kind, count in self._entries.items() if count}
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Global cache instance (initialized once)
+_geometry_cache: Optional[GeometryCache] = None
+
+
+def get_geometry_cache() -> GeometryCache:
+    """
+    Get or create the global geometry cache
+
+    Returns:
+        GeometryCache instance
+    """
+    global _geometry_cache
+
+    if _geometry_cache is None:
+        _geometry_cache = GeometryCache()
+
+    return _geometry_cache
@@ -0,0 +1,510 @@
+"""
+Backend Metrics
+
+Per-stage timing spans for the deployment pipeline, cache and upstream
+instrumentation, and a small in-process metrics registry exported in the
+Prometheus text format (GET /metrics).
+
+A PipelineTrace records one span per stage (wall time, rows in/out, cache
+hit/miss). The spans are returned with the pipeline result and, when the
+trace finishes, folded into the global registry as:
+
+- pipeline_runs_total{pipeline, status}
+- pipeline_duration_seconds{pipeline} (histogram)
+- pipeline_stage_duration_seconds{pipeline, stage} (histogram)
+- pipeline_stage_rows_total{pipeline, stage, direction}
+- pipeline_stage_cache_total{pipeline, stage, result}
+
+Caches are reported per cache name, either read from their stats() at scrape
+time (register_cache) or counted as they are used (record_cache_lookup):
+
+- cache_hits_total / cache_misses_total / cache_evictions_total{cache}
+- cache_entries / cache_bytes / cache_max_bytes{cache}
+
+Calls to upstream services (TIGERweb, Census, Overpass, Snowflake, the LLM)
+are wrapped in track_upstream:
+
+- upstream_requests_total{upstream, operation, status}
+- upstream_request_duration_seconds{upstream, operation} (histogram)
+- upstream_in_flight{upstream} (calls currently running; pool/thread usage)
+
+The registry is written by hand instead of depending on prometheus_client:
+counters, gauges and histograms with labels are all the backend needs.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets in seconds (stages range from sub-millisecond cache hits to TIGER downloads)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Scrape-time sample: (name, type ('counter' or 'gauge'), help, labels, value)
+Sample = Tuple[str, str, str, Dict[str, Any], float]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    """Sorted (name, value) pairs identifying a labelled series"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Render labels as {a="1",b="2"}"""
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (
+        f'{name}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value (integers without a decimal point)"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Histogram:
+    """Cumulative bucket counts, sum and count of one labelled series"""
+
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and histograms rendered in the Prometheus text format
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty registry.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._values: Dict[str, Dict[LabelKey, float]] = {}  # Counters and gauges
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+
+    def _declare(self, name: str, metric_type: str, help_text: str):
+        if name not in self._help:
+            self._help[name] = (metric_type, help_text)
+
+    def inc(self, name: str, value: float = 1.0, help_text: str = "", **labels: Any):
+        """
+        Increment a counter.
+
+        Args:
+            name: Metric name (should end in _total)
+            value: Amount to add
+            help_text: HELP line for the metric
+            **labels: Label values
+        """
+        self._add(name, 'counter', value, help_text, labels)
+
+    def gauge_add(self, name: str, delta: float, help_text: str = "", **labels: Any):
+        """
+        Move a gauge up or down.
+
+        Args:
+            name: Metric name
+            delta: Amount to add (negative to decrease)
+            help_text: HELP line for the metric
+            **labels: Label values
+        """
+        self._add(name, 'gauge', delta, help_text, labels)
+
+    def _add(self, name: str, metric_type: str, value: float, help_text: str, labels: Dict[str, Any]):
+        key = _label_key(labels)
+        with self._lock:
+            self._declare(name, metric_type, help_text)
+            series = self._values.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, help_text: str = "", **labels: Any):
+        """
+        Record a histogram observation.
+
+        Args:
+            name: Metric name (e.g. *_seconds)
+            value: Observed value
+            help_text: HELP line for the metric
+            **labels: Label values
+        """
+        key = _label_key(labels)
+        with self._lock:
+            self._declare(name, 'histogram', help_text)
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram.counts[i] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[Sample]]):
+        """
+        Register a function producing samples at scrape time.
+
+        Registering again under the same name replaces the collector.
+
+        Args:
+            name: Collector name
+            collect: Returns (name, type, help, labels, value) samples
+        """
+        with self._lock:
+            self._collectors[name] = collect
+
+    def unregister_collector(self, name: str):
+        """Remove a collector (no-op if unknown)"""
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def _collect(self) -> Tuple[Dict[str, Tuple[str, str]], Dict[str, Dict[LabelKey, float]]]:
+        """Run the collectors; a failing collector is logged and skipped"""
+        with self._lock:
+            collectors = list(self._collectors.items())
+
+        declared: Dict[str, Tuple[str, str]] = {}
+        values: Dict[str, Dict[LabelKey, float]] = {}
+        for collector_name, collect in collectors:
+            try:
+                samples = list(collect())
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector_name} failed: {e}")
+                continue
+            for name, metric_type, help_text, labels, value in samples:
+                declared.setdefault(name, (metric_type, help_text))
+                series = values.setdefault(name, {})
+                key = _label_key(labels)
+                series[key] = series.get(key, 0.0) + float(value)
+        return declared, values
+
+    def record_trace(self, trace: 'PipelineTrace'):
+        """
+        Fold a finished pipeline trace into the pipeline metrics.
+
+        Args:
+            trace: Finished PipelineTrace
+        """
+        pipeline = trace.pipeline
+        self.inc('pipeline_runs_total', help_text='Pipeline runs by outcome',
+                 pipeline=pipeline, status=trace.status)
+        self.observe('pipeline_duration_seconds', trace.total_ms / 1000,
+                     help_text='Total pipeline wall time', pipeline=pipeline)
+
+        for span in trace.spans:
+            self.observe('pipeline_stage_duration_seconds', span.wall_ms / 1000,
+                         help_text='Pipeline stage wall time', pipeline=pipeline, stage=span.stage)
+            for direction, rows in (('in', span.rows_in), ('out', span.rows_out)):
+                if rows is not None:
+                    self.inc('pipeline_stage_rows_total', rows,
+                             help_text='Rows entering/leaving each pipeline stage',
+                             pipeline=pipeline, stage=span.stage, direction=direction)
+            if span.cache is not None:
+                self.inc('pipeline_stage_cache_total',
+                         help_text='Pipeline stage cache lookups by result',
+                         pipeline=pipeline, stage=span.stage, result=span.cache)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format (0.0.4).
+
+        Returns:
+            Metrics text
+        """
+        lines: List[str] = []
+        collected_help, collected = self._collect()
+
+        with self._lock:
+            declared = {**collected_help, **self._help}
+            for name in sorted(declared):
+                metric_type, help_text = declared[name]
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+
+                if metric_type != 'histogram':
+                    series = dict(collected.get(name, {}))
+                    for key, value in self._values.get(name, {}).items():
+                        series[key] = series.get(key, 0.0) + value
+                    for key, value in sorted(series.items()):
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+                    continue
+
+                for key, histogram in sorted(self._histograms.get(name, {}).items()):
+                    for bound, count in zip(self.buckets, histogram.counts):
+                        lines.append(
+                            f"{name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {count}"
+                        )
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Remove all recorded metrics (collectors stay registered)"""
+        with self._lock:
+            self._help.clear()
+            self._values.clear()
+            self._histograms.clear()
+
+
+class StageSpan:
+    """Timing and row/cache details of one pipeline stage"""
+
+    __slots__ = ('stage', 'wall_ms', 'rows_in', 'rows_out', 'cache', 'error')
+
+    def __init__(self, stage: str, rows_in: Optional[int] = None):
+        self.stage = stage
+        self.wall_ms = 0.0
+        self.rows_in = rows_in
+        self.rows_out: Optional[int] = None
+        self.cache: Optional[str] = None  # 'hit' / 'miss' when the stage is cached
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        span = {'stage': self.stage, 'wall_ms': round(self.wall_ms, 2)}
+        for field in ('rows_in', 'rows_out', 'cache', 'error'):
+            value = getattr(self, field)
+            if value is not None:
+                span[field] = value
+        return span
+
+
+class PipelineTrace:
+    """
+    Stage spans of one pipeline run.
+
+    Usage:
+        trace = PipelineTrace('deployment')
+        with trace.stage('spatial_filter', rows_in=len(df)) as span:
+            ...
+            span.rows_out = len(filtered)
+        trace.finish()
+    """
+
+    def __init__(self, pipeline: str, registry: Optional[MetricsRegistry] = None):
+        """
+        Start a trace.
+
+        Args:
+            pipeline: Pipeline name (metric label)
+            registry: Registry to record into on finish (default: global registry)
+        """
+        self.pipeline = pipeline
+        self.registry = registry
+        self.spans: List[StageSpan] = []
+        self.status = 'running'
+        self._started = time.perf_counter()
+        self.total_ms = 0.0
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[StageSpan]:
+        """
+        Time a stage; a failing stage finishes the trace with status 'error'.
+
+        Args:
+            name: Stage name
+            rows_in: Rows entering the stage
+
+        Yields:
+            StageSpan to set rows_out/cache on
+        """
+        span = StageSpan(name, rows_in)
+        self.spans.append(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.wall_ms = (time.perf_counter() - start) * 1000
+            if span.error:
+                self.finish('error')
+
+    def finish(self, status: str = 'success'):
+        """
+        End the trace and record it in the registry (only the first call counts).
+
+        Args:
+            status: Run outcome label
+        """
+        if self.status != 'running':
+            return
+        self.status = status
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+        (self.registry or get_metrics_registry()).record_trace(self)
+
+    def summary(self) -> str:
+        """One-line stage timing summary for logs"""
+        return ", ".join(
+            f"{span.stage} {span.wall_ms:.0f}ms" + (f" ({span.cache})" if span.cache else "")
+            for span in self.spans
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Trace as result metadata"""
+        return {
+            'pipeline': self.pipeline,
+            'status': self.status,
+            'total_ms': round(self.total_ms, 2),
+            'stages': [span.to_dict() for span in self.spans],
+        }
+
+
+def cache_samples(cache: str, stats: Dict[str, Any]) -> List[Sample]:
+    """
+    Convert a cache's stats() dict to samples.
+
+    Args:
+        cache: Cache name (label)
+        stats: Counters/sizes with any of hits, misses, evictions, entries, bytes, max_bytes
+
+    Returns:
+        Samples for the keys present
+    """
+    fields = (
+        ('hits', 'cache_hits_total', 'counter', 'Cache hits'),
+        ('misses', 'cache_misses_total', 'counter', 'Cache misses'),
+        ('evictions', 'cache_evictions_total', 'counter', 'Entries evicted to stay within the cache bound'),
+        ('entries', 'cache_entries', 'gauge', 'Entries currently cached'),
+        ('bytes', 'cache_bytes', 'gauge', 'Approximate bytes currently cached'),
+        ('max_bytes', 'cache_max_bytes', 'gauge', 'Cache memory budget in bytes'),
+        ('max_entries', 'cache_max_entries', 'gauge', 'Maximum number of cached entries'),
+    )
+    return [
+        (name, metric_type, help_text, {'cache': cache}, stats[field])
+        for field, name, metric_type, help_text in fields
+        if stats.get(field) is not None
+    ]
+
+
+def lru_cache_stats(func: Any) -> Dict[str, Any]:
+    """
+    Stats of a functools.lru_cache wrapped function.
+
+    lru_cache does not count evictions; every miss inserts an entry, so
+    evictions are misses minus current size (exact until cache_clear()).
+
+    Args:
+        func: Function decorated with lru_cache
+
+    Returns:
+        Dict with hits, misses, evictions, entries and max_entries
+    """
+    info = func.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'evictions': max(0, info.misses - info.currsize) if info.maxsize else 0,
+        'entries': info.currsize,
+        'max_entries': info.maxsize,
+    }
+
+
+def register_cache(
+    cache: str, stats: Callable[[], Dict[str, Any]], registry: Optional['MetricsRegistry'] = None
+):
+    """
+    Report a cache's stats() on every scrape.
+
+    Args:
+        cache: Cache name (label)
+        stats: Returns the cache's counters (see cache_samples)
+        registry: Registry to register with (default: global registry)
+    """
+    (registry or get_metrics_registry()).register_collector(
+        f"cache:{cache}", lambda: cache_samples(cache, stats())
+    )
+
+
+def record_cache_lookup(cache: str, hit: bool, registry: Optional['MetricsRegistry'] = None):
+    """
+    Count a lookup in a cache without a stats() method.
+
+    Args:
+        cache: Cache name (label)
+        hit: Whether the lookup was served from the cache
+        registry: Registry to record into (default: global registry)
+    """
+    (registry or get_metrics_registry()).inc(
+        'cache_hits_total' if hit else 'cache_misses_total',
+        help_text='Cache hits' if hit else 'Cache misses',
+        cache=cache,
+    )
+
+
+@contextmanager
+def track_upstream(
+    upstream: str, operation: str = 'request', registry: Optional['MetricsRegistry'] = None
+) -> Iterator[None]:
+    """
+    Time a call to an upstream service and count it by outcome.
+
+    Works around blocking calls and, in async code, around awaits.
+
+    Args:
+        upstream: Service name (e.g. 'tigerweb', 'census', 'snowflake', 'gemini')
+        operation: Kind of call (e.g. 'county_boundary', 'query', 'generate')
+        registry: Registry to record into (default: global registry)
+    """
+    registry = registry or get_metrics_registry()
+    registry.gauge_add('upstream_in_flight', 1, help_text='Upstream calls currently running',
+                       upstream=upstream)
+    status = 'ok'
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        status = 'error'
+        raise
+    finally:
+        registry.observe('upstream_request_duration_seconds', time.perf_counter() - start,
+                         help_text='Upstream call latency', upstream=upstream, operation=operation)
+        registry.inc('upstream_requests_total', help_text='Upstream calls by outcome',
+                     upstream=upstream, operation=operation, status=status)
+        registry.gauge_add('upstream_in_flight', -1, upstream=upstream)
+
+
+# Global metrics registry (initialized once)
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get or create the global metrics registry
+
+    Returns:
+        MetricsRegistry instance
+    """
+    global _metrics_registry
+
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+
+    return _metrics_registry
@@ -0,0 +1,278 @@
+"""
+Serialized Response Cache
+
+Caches the final bytes of JSON API responses (plus gzip and, when the optional
+`brotli` package is installed, brotli encodings) together with ETag and
+Last-Modified metadata. Repeated requests are answered with a byte copy of
+the best encoding the client accepts, and conditional requests
+(If-None-Match / If-Modified-Since) get a bodiless 304.
+
+Used by the boundary endpoints, whose payloads (state outlines in particular)
+are large, rarely change and are requested over and over by the map.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from fast_json import dumps
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for cached responses (all encodings)
+RESPONSE_CACHE_MB = float(os.getenv('RESPONSE_CACHE_MB', '128'))
+
+# Cached responses are rebuilt after this long (unchanged content keeps its ETag)
+RESPONSE_CACHE_TTL_S = float(os.getenv('RESPONSE_CACHE_TTL_S', '3600'))
+
+# Browser caching policy for boundary responses
+CACHE_CONTROL = 'public, max-age=300'
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    """Whether an Accept-Encoding header allows a content coding (q > 0)"""
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        if name.strip().lower() not in (coding, '*'):
+            continue
+        params = params.strip().replace(' ', '')
+        if params.startswith('q='):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class CachedResponse:
+    """Serialized response body with its encodings and validators"""
+
+    def __init__(self, body: bytes, last_modified: Optional[float] = None):
+        """
+        Initialize cached response
+
+        Args:
+            body: Serialized JSON body
+            last_modified: Last-Modified time (default: now)
+        """
+        self.body = body
+        self.etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        self.last_modified = int(last_modified if last_modified is not None else time.time())
+        self.created_at = time.time()
+
+        self.gzip = None
+        self.br = None
+        if len(body) >= MIN_COMPRESS_BYTES:
+            self.gzip = gzip.compress(body, compresslevel=6)
+            if brotli is not None:
+                self.br = brotli.compress(body, quality=5)
+
+    @property
+    def size(self) -> int:
+        """Bytes held by all encodings"""
+        return len(self.body) + len(self.gzip or b'') + len(self.br or b'')
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            'ETag': self.etag,
+            'Last-Modified': formatdate(self.last_modified, usegmt=True),
+            'Cache-Control': CACHE_CONTROL,
+            'Vary': 'Accept-Encoding',
+        }
+
+    def _not_modified(self, request: Request) -> bool:
+        """Evaluate If-None-Match / If-Modified-Since"""
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+            return '*' in tags or self.etag.removeprefix('W/') in tags
+
+        if_modified_since = request.headers.get('if-modified-since')
+        if if_modified_since:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+
+        return False
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Build the HTTP response for a request
+
+        Args:
+            request: Incoming request (conditional and Accept-Encoding headers)
+
+        Returns:
+            304 if the client copy is current, otherwise the body in the best accepted encoding
+        """
+        headers = self._headers()
+
+        if self._not_modified(request):
+            return Response(status_code=304, headers=headers)
+
+        accept_encoding = request.headers.get('accept-encoding', '')
+        if self.br is not None and _accepts(accept_encoding, 'br'):
+            headers['Content-Encoding'] = 'br'
+            body = self.br
+        elif self.gzip is not None and _accepts(accept_encoding, 'gzip'):
+            headers['Content-Encoding'] = 'gzip'
+            body = self.gzip
+        else:
+            body = self.body
+
+        return Response(content=body, media_type='application/json', headers=headers)
+
+
+class ResponseCache:
+    """Byte-bounded LRU of serialized responses"""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = RESPONSE_CACHE_TTL_S):
+        """
+        Initialize response cache
+
+        Args:
+            max_bytes: Memory budget across all cached encodings
+            ttl_seconds: Age after which a response is rebuilt
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: 'OrderedDict[Hashable, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Get a fresh cached response"""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or time.time() - cached.created_at > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def put(self, key: Hashable, payload: Any) -> CachedResponse:
+        """
+        Serialize, compress and cache a payload
+
+        Args:
+            key: Cache key
+            payload: JSON-serializable response payload
+
+        Returns:
+            The cached response
+        """
+        body = dumps(payload)
+
+        with self._lock:
+            previous = self._entries.get(key)
+
+        # Unchanged content keeps its Last-Modified so conditional requests still match
+        cached = CachedResponse(body)
+        if previous is not None and previous.etag == cached.etag:
+            cached.last_modified = previous.last_modified
+
+        if cached.size > self.max_bytes:
+            return cached
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.size
+            self._entries[key] = cached
+            self.bytes += cached.size
+
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+
+        return cached
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    async def respond(
+        self,
+        request: Request,
+        key: Hashable,
+        build: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """
+        Serve a cached response, building and caching it on miss
+
+        Args:
+            request: Incoming request
+            key: Cache key
+            build: Coroutine function returning the payload (may raise HTTPException)
+
+        Returns:
+            HTTP response (200 with cached bytes, or 304)
+        """
+        cached = self.get(key)
+        if cached is None:
+            payload = await build()
+            # Serialization and compression of large boundaries stay off the event loop
+            cached = await asyncio.to_thread(self.put, key, payload)
+        return cached.to_response(request)
+
+
+# Global response cache (initialized once)
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get or create the global response cache
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = ResponseCache(int(RESPONSE_CACHE_MB * 1024 * 1024))
+
+    return _response_cache
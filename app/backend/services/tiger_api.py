@@ -1,18 +1,33 @@
 """
 Census TIGER API Functions
 
-Fetch state and census tract boundaries from US Census Bureau TIGER/Line API
+Fetch state, county and census tract boundaries from US Census Bureau TIGER/Line
+data. Local TIGER/Line shapefiles (see tiger_local.py) are used when present;
+the live TIGERweb API is the fallback and can be disabled with TIGER_LIVE_API=false.
+
+TIGERAPIService is blocking (scripts and the pipeline). AsyncTIGERAPIService
+serves the FastAPI routers: it shares one pooled httpx.AsyncClient and
+coalesces simultaneous requests for the same boundary into one upstream call.
 """
 
+import asyncio
+import os
 import requests
+import httpx
 import logging
-from typing import Optional, Dict, Any
-import json
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Tuple
 from pathlib import Path
 
+from geometry_cache import GeometryCache, get_geometry_cache
+from metrics import Sample, track_upstream
+from tiger_local import LocalTIGERSource, get_local_tiger_source
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whether to query TIGERweb when a boundary is not available locally
+TIGER_LIVE_API = os.getenv('TIGER_LIVE_API', 'true').lower() not in ('0', 'false', 'no')
+
 
 class TIGERAPIService:
     """Service for fetching boundaries from Census TIGER API"""
@@ -37,18 +52,92 @@ class TIGERAPIService:
     # TIGER API endpoints
     STATE_LAYER_URL = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/State_County/MapServer/0/query"
     TRACT_LAYER_URL = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_Current/MapServer/8/query"
-
-    def __init__(self, cache_dir: Optional[Path] = None):
+    COUNTY_LAYER_URL = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_Current/MapServer/82/query"
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        cache: Optional[GeometryCache] = None,
+        local_source: Optional[LocalTIGERSource] = None,
+        use_live_api: bool = TIGER_LIVE_API
+    ):
         """
         Initialize TIGER API service
 
         Args:
-            cache_dir: Optional cache directory path
+            cache_dir: Legacy JSON cache directory, imported into the geometry cache on miss
+            cache: Geometry cache (default: shared global cache)
+            local_source: Local TIGER/Line source (default: global source, if shapefiles exist)
+            use_live_api: Whether to fall back to TIGERweb for boundaries not available locally
         """
         if cache_dir is None:
             cache_dir = Path(__file__).parent.parent.parent.parent / 'cache' / 'tiger'
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = cache or get_geometry_cache()
+        self.local = local_source or get_local_tiger_source()
+        self.use_live_api = use_live_api
+
+    def _load_cached(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """Load a feature from the geometry cache, importing a legacy JSON file on miss"""
+        feature = self.cache.get(kind, key)
+        if feature is None:
+            feature = self.cache.import_legacy_file(kind, key, self.cache_dir / f"{kind}_{key}.json")
+        return feature
+
+    def _live_api_allowed(self, description: str) -> bool:
+        """Whether a boundary missing locally may be fetched from TIGERweb"""
+        if not self.use_live_api:
+            logger.warning(f"No local boundary for {description} and live TIGERweb API is disabled")
+        return self.use_live_api
+
+    def _get_json(self, url: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Blocking GET returning the decoded JSON body"""
+        with track_upstream('tigerweb', 'query'):
+            response = requests.get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+
+    # --- State boundaries -------------------------------------------------
+
+    def _lookup_state(self, state_name: str, state_fips: str) -> Optional[Dict[str, Any]]:
+        """State boundary from local TIGER/Line data or the cache"""
+        if self.local:
+            boundary = self.local.get_state(state_fips)
+            if boundary:
+                return boundary
+
+        cached = self._load_cached('state', state_name.lower().replace(' ', '_'))
+        if cached:
+            logger.info(f"✓ Loaded {state_name} boundary from cache")
+        return cached
+
+    def _state_query(self, state_fips: str) -> Tuple[str, Dict[str, Any], float]:
+        """TIGERweb request (url, params, timeout) for a state boundary"""
+        params = {
+            'where': f"STATE='{state_fips}'",
+            'outFields': '*',
+            'outSR': '4326',  # WGS84 lat/lon
+            'f': 'geojson'
+        }
+        return self.STATE_LAYER_URL, params, 60
+
+    def _store_state(self, state_name: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract and cache the state boundary from a TIGERweb response"""
+        if not data.get('features') or len(data['features']) == 0:
+            logger.warning(f"No boundary found for {state_name}")
+            return None
+
+        boundary = data['features'][0]
+
+        # Cache the result
+        try:
+            self.cache.put('state', state_name.lower().replace(' ', '_'), boundary)
+            logger.info(f"✓ Cached {state_name} boundary")
+        except Exception as e:
+            logger.warning(f"Failed to cache: {e}")
+
+        logger.info(f"✓ Fetched {state_name} boundary ({boundary['geometry']['type']})")
+        return boundary
 
     def fetch_state_boundary(self, state_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -60,56 +149,66 @@ class TIGERAPIService:
         Returns:
             GeoJSON feature with state boundary, or None if not found
         """
-        # Check cache first
-        cache_file = self.cache_dir / f"state_{state_name.lower().replace(' ', '_')}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    logger.info(f"✓ Loaded {state_name} boundary from cache")
-                    return json.load(f)
-            except Exception:
-                pass
-
-        # Get state FIPS code
         state_fips = self.STATE_FIPS.get(state_name)
         if not state_fips:
             logger.error(f"Unknown state: {state_name}")
             return None
 
+        boundary = self._lookup_state(state_name, state_fips)
+        if boundary or not self._live_api_allowed(state_name):
+            return boundary
+
         logger.info(f"Fetching {state_name} boundary from Census TIGER API...")
 
         try:
-            params = {
-                'where': f"STATE='{state_fips}'",
-                'outFields': '*',
-                'outSR': '4326',  # WGS84 lat/lon
-                'f': 'geojson'
-            }
-
-            response = requests.get(self.STATE_LAYER_URL, params=params, timeout=60)
-            response.raise_for_status()
-            data = response.json()
-
-            if not data.get('features') or len(data['features']) == 0:
-                logger.warning(f"No boundary found for {state_name}")
-                return None
+            data = self._get_json(*self._state_query(state_fips))
+        except requests.RequestException as e:
+            logger.error(f"Error fetching state boundary: {e}")
+            return None
 
-            boundary = data['features'][0]
+        return self._store_state(state_name, data)
+
+    # --- Tract boundaries -------------------------------------------------
+
+    def _lookup_tract(self, geoid: str) -> Optional[Dict[str, Any]]:
+        """Tract boundary from local TIGER/Line data or the cache"""
+        if self.local:
+            boundary = self.local.get_tract(geoid)
+            if boundary:
+                return boundary
+
+        cached = self._load_cached('tract', geoid)
+        if cached:
+            logger.info(f"✓ Loaded tract {geoid} from cache")
+        return cached
+
+    def _tract_query(self, geoid: str) -> Tuple[str, Dict[str, Any], float]:
+        """TIGERweb request (url, params, timeout) for a tract boundary"""
+        params = {
+            'where': f"GEOID='{geoid}'",
+            'outFields': '*',
+            'outSR': '4326',  # WGS84 lat/lon
+            'f': 'geojson'
+        }
+        return self.TRACT_LAYER_URL, params, 30
+
+    def _store_tract(self, geoid: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract and cache the tract boundary from a TIGERweb response"""
+        if not data.get('features') or len(data['features']) == 0:
+            logger.warning(f"No boundary found for tract {geoid}")
+            return None
 
-            # Cache the result
-            try:
-                with open(cache_file, 'w') as f:
-                    json.dump(boundary, f, indent=2)
-                logger.info(f"✓ Cached {state_name} boundary")
-            except Exception as e:
-                logger.warning(f"Failed to cache: {e}")
+        boundary = data['features'][0]
 
-            logger.info(f"✓ Fetched {state_name} boundary ({boundary['geometry']['type']})")
-            return boundary
+        # Cache the result
+        try:
+            self.cache.put('tract', geoid, boundary)
+            logger.info(f"✓ Cached tract {geoid} boundary")
+        except Exception as e:
+            logger.warning(f"Failed to cache: {e}")
 
-        except requests.RequestException as e:
-            logger.error(f"Error fetching state boundary: {e}")
-            return None
+        logger.info(f"✓ Fetched tract {geoid} boundary ({boundary['geometry']['type']})")
+        return boundary
 
     def fetch_tract_boundary(self, geoid: str) -> Optional[Dict[str, Any]]:
         """
@@ -121,51 +220,111 @@ class TIGERAPIService:
         Returns:
             GeoJSON feature with tract boundary, or None if not found
         """
-        # Check cache first
-        cache_file = self.cache_dir / f"tract_{geoid}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    logger.info(f"✓ Loaded tract {geoid} from cache")
-                    return json.load(f)
-            except Exception:
-                pass
+        boundary = self._lookup_tract(geoid)
+        if boundary or not self._live_api_allowed(f"tract {geoid}"):
+            return boundary
 
         logger.info(f"Fetching census tract {geoid} from Census TIGER API...")
 
         try:
-            params = {
-                'where': f"GEOID='{geoid}'",
-                'outFields': '*',
-                'outSR': '4326',  # WGS84 lat/lon
-                'f': 'geojson'
-            }
-
-            response = requests.get(self.TRACT_LAYER_URL, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(*self._tract_query(geoid))
+        except requests.RequestException as e:
+            logger.error(f"Error fetching tract boundary: {e}")
+            return None
 
-            if not data.get('features') or len(data['features']) == 0:
-                logger.warning(f"No boundary found for tract {geoid}")
-                return None
+        return self._store_tract(geoid, data)
+
+    # --- County boundaries ------------------------------------------------
+
+    def _lookup_county(self, county_name: str, state_name: str) -> Optional[Dict[str, Any]]:
+        """County boundary from local TIGER/Line data"""
+        if self.local:
+            boundary = self.local.get_county(county_name, self.STATE_FIPS.get(state_name, '00'))
+            if boundary:
+                logger.info(f"✓ Loaded {county_name}, {state_name} boundary from TIGER/Line")
+                return boundary
+        return None
+
+    def _county_query(self, county_name: str, state_name: str) -> Tuple[str, Dict[str, Any], float]:
+        """TIGERweb request (url, params, timeout) for a county boundary by name"""
+        county_clean = county_name.replace(' County', '').replace(' county', '').strip()
+        state_fips = self.STATE_FIPS.get(state_name, '00')
+
+        params = {
+            'where': f"GEOID LIKE '{state_fips}%' AND BASENAME LIKE '%{county_clean}%'",
+            'outFields': '*',
+            'outSR': '4326',
+            'f': 'geojson'
+        }
+        return self.COUNTY_LAYER_URL, params, 30
+
+    def _parse_county(self, county_name: str, state_name: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract the county boundary from a TIGERweb response"""
+        if not data.get('features') or len(data['features']) == 0:
+            logger.warning(f"No boundary found for {county_name}, {state_name}")
+            return None
 
-            boundary = data['features'][0]
+        boundary = data['features'][0]
+        logger.info(f"✓ Fetched {county_name}, {state_name} boundary ({boundary['geometry']['type']})")
+        return boundary
 
-            # Cache the result
-            try:
-                with open(cache_file, 'w') as f:
-                    json.dump(boundary, f, indent=2)
-                logger.info(f"✓ Cached tract {geoid} boundary")
-            except Exception as e:
-                logger.warning(f"Failed to cache: {e}")
+    def fetch_county_boundary(self, county_name: str, state_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch county boundary by name
+
+        Matches the county base name like TIGERweb `BASENAME LIKE '%name%'`.
 
-            logger.info(f"✓ Fetched tract {geoid} boundary ({boundary['geometry']['type']})")
+        Args:
+            county_name: County name (e.g., "Madison County" or "Madison")
+            state_name: Full state name (e.g., "Florida")
+
+        Returns:
+            GeoJSON feature with county boundary, or None if not found
+
+        Raises:
+            requests.RequestException: If the live TIGERweb query fails
+        """
+        boundary = self._lookup_county(county_name, state_name)
+        if boundary or not self._live_api_allowed(f"{county_name}, {state_name}"):
             return boundary
 
-        except requests.RequestException as e:
-            logger.error(f"Error fetching tract boundary: {e}")
+        logger.info(f"Fetching {county_name}, {state_name} boundary from Census TIGER API...")
+        data = self._get_json(*self._county_query(county_name, state_name))
+        return self._parse_county(county_name, state_name, data)
+
+    # --- Tract listings ---------------------------------------------------
+
+    def _lookup_tract_list(self, state_fips: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Tract metadata from local TIGER/Line data (same ArcGIS JSON layout as the live query)"""
+        if self.local:
+            tracts = self.local.list_tracts(state_fips, limit=limit)
+            if tracts:
+                fields = ('GEOID', 'NAME', 'BASENAME', 'CENTLAT', 'CENTLON')
+                return [{'attributes': {f: t.get(f) for f in fields}} for t in tracts]
+        return None
+
+    def _tract_list_query(self, state_fips: str, limit: int) -> Tuple[str, Dict[str, Any], float]:
+        """TIGERweb request (url, params, timeout) for tract metadata in a state"""
+        params = {
+            'where': f"STATE='{state_fips}'",
+            'outFields': 'GEOID,NAME,BASENAME,CENTLAT,CENTLON',
+            'outSR': '4326',
+            'returnGeometry': 'false',  # Just get metadata first
+            'resultRecordCount': limit,
+            'f': 'json'
+        }
+        return self.TRACT_LAYER_URL, params, 30
+
+    def _parse_tract_list(self, state_name: str, data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Extract tract metadata from a TIGERweb response"""
+        if not data.get('features'):
+            logger.warning(f"No tracts found in {state_name}")
             return None
 
+        features = data['features']
+        logger.info(f"✓ Found {len(features)} tracts in {state_name}")
+        return features
+
     def fetch_tracts_in_state(self, state_name: str, limit: int = 100) -> Optional[list]:
         """
         Fetch all census tracts in a state
@@ -182,35 +341,248 @@ class TIGERAPIService:
             logger.error(f"Unknown state: {state_name}")
             return None
 
+        tracts = self._lookup_tract_list(state_fips, limit)
+        if tracts or not self._live_api_allowed(f"tracts in {state_name}"):
+            return tracts
+
         logger.info(f"Fetching census tracts in {state_name}...")
 
         try:
-            params = {
-                'where': f"STATE='{state_fips}'",
-                'outFields': 'GEOID,NAME,BASENAME,CENTLAT,CENTLON',
-                'outSR': '4326',
-                'returnGeometry': 'false',  # Just get metadata first
-                'resultRecordCount': limit,
-                'f': 'json'
-            }
-
-            response = requests.get(self.TRACT_LAYER_URL, params=params, timeout=30)
+            data = self._get_json(*self._tract_list_query(state_fips, limit))
+        except requests.RequestException as e:
+            logger.error(f"Error fetching tracts: {e}")
+            return None
+
+        return self._parse_tract_list(state_name, data)
+
+
+class AsyncTIGERAPIService:
+    """
+    Non-blocking TIGER boundary service for async request handlers
+
+    Local and cached lookups run in a worker thread; TIGERweb requests share
+    one pooled httpx.AsyncClient. Concurrent calls for the same boundary are
+    coalesced: the first caller starts the lookup and the others await its
+    result, so a burst of requests for one state triggers a single upstream call.
+    """
+
+    # Connection pool limits for the shared client
+    MAX_CONNECTIONS = 20
+    MAX_KEEPALIVE_CONNECTIONS = 10
+
+    STATE_FIPS = TIGERAPIService.STATE_FIPS
+
+    def __init__(self, service: Optional[TIGERAPIService] = None, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize async TIGER service
+
+        Args:
+            service: Blocking service providing the local/cache lookups (default: new TIGERAPIService)
+            client: Shared HTTP client (default: created on first upstream request)
+        """
+        self.service = service or TIGERAPIService()
+        self._client = client
+        self._inflight: Dict[Tuple[str, ...], asyncio.Future] = {}
+
+        # Counters
+        self.upstream_requests = 0
+        self.coalesced_requests = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_json(self, url: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Non-blocking GET returning the decoded JSON body"""
+        self.upstream_requests += 1
+        with track_upstream('tigerweb', 'query'):
+            response = await self.client.get(url, params=params, timeout=timeout)
             response.raise_for_status()
-            data = response.json()
+            return response.json()
+
+    def metrics_samples(self) -> List[Sample]:
+        """Upstream/coalescing counters for the /metrics endpoint"""
+        return [
+            ('tiger_async_upstream_requests_total', 'counter', 'TIGERweb requests made by the async service',
+             {}, self.upstream_requests),
+            ('tiger_async_coalesced_requests_total', 'counter', 'Boundary lookups served by an in-flight request',
+             {}, self.coalesced_requests),
+            ('tiger_async_inflight_lookups', 'gauge', 'Distinct boundary lookups in flight',
+             {}, len(self._inflight)),
+        ]
+
+    async def _coalesce(self, key: Tuple[str, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch() once for all concurrent callers with the same key
+
+        Args:
+            key: Identity of the requested boundary
+            fetch: Coroutine function performing the lookup
+
+        Returns:
+            Result of the shared fetch
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced_requests += 1
+
+        # Shield so a disconnecting caller does not cancel the lookup for the others
+        return await asyncio.shield(task)
+
+    async def fetch_state_boundary(self, state_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch state boundary
 
-            if not data.get('features'):
-                logger.warning(f"No tracts found in {state_name}")
+        Args:
+            state_name: Full state name (e.g., "Florida", "Georgia")
+
+        Returns:
+            GeoJSON feature with state boundary, or None if not found
+        """
+        service = self.service
+        state_fips = self.STATE_FIPS.get(state_name)
+        if not state_fips:
+            logger.error(f"Unknown state: {state_name}")
+            return None
+
+        async def fetch():
+            boundary = await asyncio.to_thread(service._lookup_state, state_name, state_fips)
+            if boundary or not service._live_api_allowed(state_name):
+                return boundary
+
+            logger.info(f"Fetching {state_name} boundary from Census TIGER API...")
+            try:
+                data = await self._get_json(*service._state_query(state_fips))
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching state boundary: {e}")
                 return None
+            return await asyncio.to_thread(service._store_state, state_name, data)
 
-            features = data['features']
-            logger.info(f"✓ Found {len(features)} tracts in {state_name}")
+        return await self._coalesce(('state', state_fips), fetch)
 
-            return features
+    async def fetch_tract_boundary(self, geoid: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch census tract boundary
 
-        except requests.RequestException as e:
-            logger.error(f"Error fetching tracts: {e}")
+        Args:
+            geoid: 11-digit census tract GEOID (e.g., "12079110200")
+
+        Returns:
+            GeoJSON feature with tract boundary, or None if not found
+        """
+        service = self.service
+
+        async def fetch():
+            boundary = await asyncio.to_thread(service._lookup_tract, geoid)
+            if boundary or not service._live_api_allowed(f"tract {geoid}"):
+                return boundary
+
+            logger.info(f"Fetching census tract {geoid} from Census TIGER API...")
+            try:
+                data = await self._get_json(*service._tract_query(geoid))
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching tract boundary: {e}")
+                return None
+            return await asyncio.to_thread(service._store_tract, geoid, data)
+
+        return await self._coalesce(('tract', geoid), fetch)
+
+    async def fetch_county_boundary(self, county_name: str, state_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch county boundary by name
+
+        Args:
+            county_name: County name (e.g., "Madison County" or "Madison")
+            state_name: Full state name (e.g., "Florida")
+
+        Returns:
+            GeoJSON feature with county boundary, or None if not found
+
+        Raises:
+            httpx.HTTPError: If the live TIGERweb query fails
+        """
+        service = self.service
+
+        async def fetch():
+            boundary = await asyncio.to_thread(service._lookup_county, county_name, state_name)
+            if boundary or not service._live_api_allowed(f"{county_name}, {state_name}"):
+                return boundary
+
+            logger.info(f"Fetching {county_name}, {state_name} boundary from Census TIGER API...")
+            data = await self._get_json(*service._county_query(county_name, state_name))
+            return service._parse_county(county_name, state_name, data)
+
+        return await self._coalesce(('county', state_name, county_name.lower()), fetch)
+
+    async def fetch_tracts_in_state(self, state_name: str, limit: int = 100) -> Optional[list]:
+        """
+        Fetch census tract metadata in a state
+
+        Args:
+            state_name: Full state name (e.g., "Florida")
+            limit: Maximum number of tracts to return (default 100)
+
+        Returns:
+            List of tract features (attributes only)
+        """
+        service = self.service
+        state_fips = self.STATE_FIPS.get(state_name)
+        if not state_fips:
+            logger.error(f"Unknown state: {state_name}")
             return None
 
+        async def fetch():
+            tracts = await asyncio.to_thread(service._lookup_tract_list, state_fips, limit)
+            if tracts or not service._live_api_allowed(f"tracts in {state_name}"):
+                return tracts
+
+            logger.info(f"Fetching census tracts in {state_name}...")
+            try:
+                data = await self._get_json(*service._tract_list_query(state_fips, limit))
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching tracts: {e}")
+                return None
+            return service._parse_tract_list(state_name, data)
+
+        return await self._coalesce(('tracts', state_fips, str(limit)), fetch)
+
+
+# Global async service instance (initialized once)
+_async_tiger_service: Optional[AsyncTIGERAPIService] = None
+
+
+def get_async_tiger_service() -> AsyncTIGERAPIService:
+    """
+    Get or create the global async TIGER service
+
+    Returns:
+        AsyncTIGERAPIService instance
+    """
+    global _async_tiger_service
+
+    if _async_tiger_service is None:
+        _async_tiger_service = AsyncTIGERAPIService()
+
+    return _async_tiger_service
+
 
 if __name__ == "__main__":
     # Test the service
@@ -0,0 +1,284 @@
+"""
+Local TIGER/Line Boundary Source
+
+Answers state, county and census tract boundary lookups from the official
+Census TIGER/Line shapefiles instead of live TIGERweb queries.
+
+Shapefiles are found under TIGER_LINE_DIR (default project_root/data/tiger),
+in any subdirectory, by their standard names:
+
+    tl_<year>_us_state.shp       - all states
+    tl_<year>_us_county.shp      - all counties
+    tl_<year>_<ss>_tract.shp     - tracts of state <ss> (one file per state)
+
+Each shapefile is loaded once into a SQLite store (project_root/cache/
+tiger_line.sqlite) keyed by GEOID, and reloaded only when the shapefile
+changes. State and county files are loaded on first use; a state's tract file
+is loaded the first time a tract of that state is requested. County names are
+kept in memory so the fuzzy county lookup needs no query at all.
+
+Feature properties follow the TIGERweb layout (NAME is the full name,
+BASENAME the short name, CENTLAT/CENTLON the internal point), so callers can
+use local and live features interchangeably. TIGER/Line coordinates are NAD83,
+which differs from WGS84 by well under a meter.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from geometry_cache import GeometryCache
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+# Directory holding the TIGER/Line shapefiles
+TIGER_LINE_DIR = Path(os.getenv('TIGER_LINE_DIR', str(PROJECT_ROOT / 'data' / 'tiger')))
+
+# Indexed store built from the shapefiles
+TIGER_LINE_DB_PATH = PROJECT_ROOT / 'cache' / 'tiger_line.sqlite'
+
+
+def _tigerweb_properties(kind: str, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Map TIGER/Line attribute names onto the TIGERweb ones"""
+    properties = dict(record)
+    properties['BASENAME'] = record.get('NAME')
+    properties['NAME'] = record.get('NAMELSAD', record.get('NAME'))
+    properties['STATE'] = record.get('STATEFP')
+    properties['CENTLAT'] = record.get('INTPTLAT')
+    properties['CENTLON'] = record.get('INTPTLON')
+    if kind in ('county', 'tract'):
+        properties['COUNTY'] = record.get('COUNTYFP')
+    if kind == 'tract':
+        properties['TRACT'] = record.get('TRACTCE')
+    properties['source'] = 'tiger_line'
+    return properties
+
+
+class LocalTIGERSource:
+    """State, county and tract boundaries from local TIGER/Line shapefiles"""
+
+    def __init__(self, shapefile_dir: Optional[Path] = None, store: Optional[GeometryCache] = None):
+        """
+        Initialize local TIGER/Line source
+
+        Args:
+            shapefile_dir: Directory searched for TIGER/Line shapefiles
+            store: Indexed store for loaded features (default cache/tiger_line.sqlite)
+        """
+        self.shapefile_dir = Path(shapefile_dir) if shapefile_dir else TIGER_LINE_DIR
+        self._store = store
+
+        self._lock = threading.Lock()
+        self._loaded: set = set()
+        self._missing: set = set()
+        self._counties: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def store(self) -> GeometryCache:
+        """Indexed feature store (opened on first use)"""
+        if self._store is None:
+            self._store = GeometryCache(TIGER_LINE_DB_PATH, ttl_seconds=None)
+        return self._store
+
+    def _find_shapefile(self, suffix: str) -> Optional[Path]:
+        """Find the newest TIGER/Line shapefile named tl_<year>_<suffix>.shp"""
+        matches = sorted(self.shapefile_dir.rglob(f"tl_*_{suffix}.shp"))
+        return matches[-1] if matches else None
+
+    def has_data(self) -> bool:
+        """Whether any TIGER/Line shapefile is available"""
+        return self.shapefile_dir.exists() and any(self.shapefile_dir.rglob("tl_*.shp"))
+
+    def _ensure_loaded(self, kind: str, suffix: str) -> bool:
+        """
+        Load a shapefile into the store unless it is already there and unchanged
+
+        Args:
+            kind: Store kind for the features ('state', 'county' or 'tract')
+            suffix: Shapefile name suffix (e.g. 'us_county', '12_tract')
+
+        Returns:
+            True if features of this shapefile are available
+        """
+        if suffix in self._loaded:
+            return True
+        if suffix in self._missing:
+            return False
+
+        with self._lock:
+            if suffix in self._loaded:
+                return True
+
+            path = self._find_shapefile(suffix)
+            if path is None:
+                self._missing.add(suffix)
+                return False
+
+            version = {'file': path.name, 'mtime': path.stat().st_mtime}
+            source = self.store.get('source', suffix)
+            if source is None or source['properties'] != version:
+                self._load_shapefile(kind, path)
+                self.store.put('source', suffix, {'properties': version, 'geometry': None})
+
+            self._loaded.add(suffix)
+            return True
+
+    def _load_shapefile(self, kind: str, path: Path):
+        """Read every feature of a shapefile into the store"""
+        import shapefile  # pyshp
+
+        logger.info(f"Loading TIGER/Line {kind} boundaries from {path.name}...")
+
+        features = {}
+        with shapefile.Reader(str(path)) as reader:
+            for shape_record in reader.iterShapeRecords():
+                record = shape_record.record.as_dict()
+                features[str(record['GEOID'])] = {
+                    'type': 'Feature',
+                    'properties': _tigerweb_properties(kind, record),
+                    'geometry': shape_record.shape.__geo_interface__,
+                }
+
+        self.store.put_many(kind, features)
+        logger.info(f"✓ Loaded {len(features):,} {kind} boundaries from {path.name}")
+
+    def get_state(self, state_fips: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a state boundary
+
+        Args:
+            state_fips: 2-digit state FIPS code
+
+        Returns:
+            GeoJSON feature, or None if not available locally
+        """
+        if not self._ensure_loaded('state', 'us_state'):
+            return None
+        return self.store.get('state', state_fips)
+
+    def get_tracts(self, geoids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get tract boundaries
+
+        Args:
+            geoids: 11-digit tract GEOIDs
+
+        Returns:
+            Dictionary mapping GEOID to GeoJSON feature (locally available tracts only)
+        """
+        geoids = [str(g) for g in geoids]
+        states = {geoid[:2] for geoid in geoids}
+        loaded = {s for s in states if self._ensure_loaded('tract', f"{s}_tract")}
+        return self.store.get_many('tract', [g for g in geoids if g[:2] in loaded])
+
+    def get_tract(self, geoid: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a tract boundary
+
+        Args:
+            geoid: 11-digit tract GEOID
+
+        Returns:
+            GeoJSON feature, or None if not available locally
+        """
+        return self.get_tracts([geoid]).get(geoid)
+
+    def list_tracts(self, state_fips: str, limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        List tract attributes in a state (no geometry)
+
+        Args:
+            state_fips: 2-digit state FIPS code
+            limit: Maximum number of tracts to return
+
+        Returns:
+            List of tract properties ordered by GEOID, or None if not available locally
+        """
+        if not self._ensure_loaded('tract', f"{state_fips}_tract"):
+            return None
+        tracts = list(self.store.get_properties('tract', state_fips).values())
+        return tracts[:limit] if limit else tracts
+
+    def _county_index(self) -> List[Dict[str, Any]]:
+        """In-memory list of county names and GEOIDs"""
+        if self._counties is None:
+            self._counties = [
+                {
+                    'geoid': geoid,
+                    'state_fips': geoid[:2],
+                    'basename': (properties.get('BASENAME') or '').lower(),
+                }
+                for geoid, properties in self.store.get_properties('county').items()
+            ]
+        return self._counties
+
+    def find_county_geoid(self, county_name: str, state_fips: str) -> Optional[str]:
+        """
+        Find a county GEOID by name (same matching as TIGERweb `BASENAME LIKE '%name%'`)
+
+        An exact base-name match is preferred over a partial one.
+
+        Args:
+            county_name: County name with or without the " County" suffix
+            state_fips: 2-digit state FIPS code
+
+        Returns:
+            5-digit county GEOID, or None if no county matches
+        """
+        if not self._ensure_loaded('county', 'us_county'):
+            return None
+
+        name = county_name.replace(' County', '').replace(' county', '').strip().lower()
+        candidates = [c for c in self._county_index() if c['state_fips'] == state_fips]
+
+        for county in candidates:
+            if county['basename'] == name:
+                return county['geoid']
+        for county in candidates:
+            if name in county['basename']:
+                return county['geoid']
+        return None
+
+    def get_county(self, county_name: str, state_fips: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a county boundary by name
+
+        Args:
+            county_name: County name (e.g. "Madison County" or "Madison")
+            state_fips: 2-digit state FIPS code
+
+        Returns:
+            GeoJSON feature, or None if not available locally
+        """
+        geoid = self.find_county_geoid(county_name, state_fips)
+        return self.store.get('county', geoid) if geoid else None
+
+
+# Global local source (resolved once per process)
+_local_source: Optional[LocalTIGERSource] = None
+_local_source_resolved = False
+
+
+def get_local_tiger_source() -> Optional[LocalTIGERSource]:
+    """
+    Get the local TIGER/Line source
+
+    Returns:
+        LocalTIGERSource, or None if no TIGER/Line shapefiles are present
+    """
+    global _local_source, _local_source_resolved
+
+    if not _local_source_resolved:
+        source = LocalTIGERSource()
+        if source.has_data():
+            _local_source = source
+            logger.info(f"✓ Using local TIGER/Line boundaries from {source.shapefile_dir}")
+        else:
+            logger.info(f"No TIGER/Line shapefiles in {source.shapefile_dir}; using TIGERweb")
+        _local_source_resolved = True
+
+    return _local_source
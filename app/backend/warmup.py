@@ -0,0 +1,269 @@
+"""
+Startup Warm-up
+
+Does the work the first requests after boot would otherwise pay for - lazy
+imports inside handlers, opening the SQLite caches, parsing the coverage CSV
+and the tract geometry file (and building its spatial index), and (optionally) loading
+boundaries and spatial filters for frequently used locations - in the
+FastAPI lifespan hook.
+
+WarmupState times each step and tells /health whether the app is ready;
+/metrics reports the same timings.
+
+Configuration (environment):
+    STARTUP_WARMUP    'background' (default): serve while warming, /health
+                      returns 503 until done; 'blocking': finish warming
+                      before accepting requests; 'off': skip warm-up.
+                      Unknown values are logged and treated as 'background'.
+    WARMUP_LOCATIONS  Locations to prepare, separated by ';'. A city is
+                      'name,state,slug' (e.g. 'Madison County,Florida,madison-county-fl');
+                      a state is just its name (e.g. 'Florida').
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from metrics import Sample
+
+logger = logging.getLogger(__name__)
+
+STARTUP_WARMUP_MODES = ('background', 'blocking', 'off')
+
+
+def parse_warmup_mode(value: str) -> str:
+    """
+    Parse a STARTUP_WARMUP value.
+
+    Args:
+        value: Mode name (case and surrounding whitespace are ignored)
+
+    Returns:
+        One of STARTUP_WARMUP_MODES ('background' for unknown values)
+    """
+    mode = value.strip().lower()
+    if mode not in STARTUP_WARMUP_MODES:
+        logger.warning(
+            f"Unknown STARTUP_WARMUP value {value!r} (expected one of "
+            f"{', '.join(STARTUP_WARMUP_MODES)}); using 'background'"
+        )
+        return 'background'
+    return mode
+
+
+# 'background', 'blocking' or 'off'
+STARTUP_WARMUP = parse_warmup_mode(os.getenv('STARTUP_WARMUP', 'background'))
+
+# Locations whose pipeline inputs are prepared at startup
+WARMUP_LOCATIONS = os.getenv('WARMUP_LOCATIONS', '')
+
+# Modules request handlers import lazily
+WARMUP_MODULES = (
+    'httpx',
+    'agents.session',
+    'data_pipeline.run_pipeline',
+)
+
+# (location_name, location_type, state_name, slug)
+Location = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def parse_locations(value: str) -> List[Location]:
+    """
+    Parse a WARMUP_LOCATIONS value.
+
+    Args:
+        value: ';'-separated locations ('name,state,slug' for cities, 'name' for states)
+
+    Returns:
+        (location_name, location_type, state_name, slug) tuples
+    """
+    locations = []
+    for entry in value.split(';'):
+        parts = [part.strip() for part in entry.split(',')]
+        if not parts[0]:
+            continue
+        if len(parts) == 1:
+            locations.append((parts[0], 'state', None, None))
+        elif len(parts) == 3:
+            locations.append((parts[0], 'city', parts[1], parts[2]))
+        else:
+            raise ValueError(f"Invalid warm-up location (expected 'name' or 'name,state,slug'): {entry!r}")
+    return locations
+
+
+class WarmupState:
+    """Progress and timings of the startup warm-up"""
+
+    def __init__(self):
+        self.status = 'pending'  # pending -> warming -> ready
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up has finished (failed steps do not block readiness)"""
+        return self.status == 'ready'
+
+    @property
+    def duration_s(self) -> Optional[float]:
+        """Total warm-up time (so far, while warming)"""
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def start(self):
+        """Mark warm-up as started"""
+        self.status = 'warming'
+        self.started_at = time.perf_counter()
+
+    def finish(self):
+        """Mark warm-up as finished and the app as ready"""
+        if self.started_at is None:
+            self.start()
+        self.finished_at = time.perf_counter()
+        self.status = 'ready'
+
+    def run_step(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run and time one warm-up step.
+
+        Errors are recorded on the step rather than raised: a failed step
+        only means the first matching request does the work itself.
+
+        Args:
+            name: Step name
+            func: Callable doing the work
+            *args, **kwargs: Passed to func
+
+        Returns:
+            func's result, or None if it raised
+        """
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            step = {'status': 'ok'}
+        except Exception as e:
+            result = None
+            step = {'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+            logger.warning(f"Warm-up step {name} failed: {e}")
+
+        step['seconds'] = time.perf_counter() - start
+        if isinstance(result, (int, float)) and not isinstance(result, bool):
+            step['items'] = result
+        with self._lock:
+            self.steps[name] = step
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status summary for /health"""
+        with self._lock:
+            steps = {name: dict(step) for name, step in self.steps.items()}
+        duration = self.duration_s
+        return {
+            'status': self.status,
+            'ready': self.ready,
+            'seconds': round(duration, 3) if duration is not None else None,
+            'steps': {
+                name: {**step, 'seconds': round(step['seconds'], 3)} for name, step in steps.items()
+            },
+        }
+
+    def metrics_samples(self) -> List[Sample]:
+        """Readiness and warm-up timings as /metrics samples"""
+        samples: List[Sample] = [
+            ("startup_ready", "gauge", "Whether startup warm-up has finished", {}, int(self.ready)),
+        ]
+        if self.duration_s is not None:
+            samples.append((
+                "startup_warmup_seconds", "gauge", "Total startup warm-up time", {}, self.duration_s
+            ))
+        with self._lock:
+            for name, step in self.steps.items():
+                samples.append((
+                    "startup_warmup_step_seconds", "gauge", "Time spent in each startup warm-up step",
+                    {"step": name, "status": step['status']}, step['seconds']
+                ))
+        return samples
+
+
+def _import_modules() -> int:
+    """Import the modules handlers would otherwise import on first use"""
+    for module in WARMUP_MODULES:
+        importlib.import_module(module)
+    return len(WARMUP_MODULES)
+
+
+def _open_caches() -> int:
+    """Create the shared cache singletons (opens the SQLite geometry cache)"""
+    from feature_lru import get_feature_lru
+    from geometry_cache import get_geometry_cache
+    from response_cache import get_response_cache
+
+    get_feature_lru()
+    get_response_cache()
+    return get_geometry_cache().stats()['entries']
+
+
+def _warm_tract_geometries() -> int:
+    """Parse the tract geometry file and build its spatial index"""
+    from data_pipeline.run_pipeline import warm_tract_features
+
+    return warm_tract_features()
+
+
+def _warm_coverage() -> int:
+    """Parse the tract coverage CSV used by the deployment pipeline"""
+    from data_pipeline.run_pipeline import warm_coverage
+
+    return warm_coverage()
+
+
+def _warm_locations(locations: Optional[List[Location]] = None) -> int:
+    """Load boundaries and spatial filters for the given (default: configured) locations"""
+    from data_pipeline.run_pipeline import warm_deployment_pipeline
+
+    if locations is None:
+        locations = parse_locations(WARMUP_LOCATIONS)
+
+    tracts = 0
+    for location_name, location_type, state_name, slug in locations:
+        tracts += warm_deployment_pipeline(location_name, location_type, state_name, slug)
+    return tracts
+
+
+async def warm_up(state: WarmupState, locations: Optional[List[Location]] = None):
+    """
+    Run the warm-up steps in a worker thread and mark the app ready.
+
+    Args:
+        state: Warm-up state to record progress on (started if it is not yet)
+        locations: Locations to prepare (default: WARMUP_LOCATIONS)
+    """
+    if state.started_at is None:
+        state.start()
+
+    steps = [
+        ('imports', _import_modules),
+        ('caches', _open_caches),
+        ('coverage', _warm_coverage),
+        ('tract_geometries', _warm_tract_geometries),
+    ]
+    if locations or (locations is None and WARMUP_LOCATIONS.strip()):
+        steps.append(('locations', lambda: _warm_locations(locations)))
+
+    for name, func in steps:
+        await asyncio.to_thread(state.run_step, name, func)
+
+    state.finish()
+    failed = [name for name, step in state.steps.items() if step['status'] != 'ok']
+    logger.info(
+        f"✓ Warm-up finished in {state.duration_s:.2f}s"
+        + (f" (failed: {', '.join(failed)})" if failed else "")
+    )
@@ -165,6 +165,13 @@ export default function ChatSidebar({
           action: agentStep.action,
           status: agentStep.status
         });
+      } else if (data.type === 'explanation_delta') {
+        // Append streamed explanation text to the processing message
+        setMessages(prev => prev.map(msg =>
+          msg.id === processingMessageId
+            ? { ...msg, streamingText: (msg.streamingText || '') + (data.delta || '') }
+            : msg
+        ));
       } else if (data.type === 'final_response') {
         // Clear typing indicator
         setTypingStep(null);
@@ -174,9 +181,10 @@ export default function ChatSidebar({
           msg.id === processingMessageId
             ? {
                 ...msg,
-                content: data.explanation || 'Analysis complete.',
+                content: data.explanation || msg.streamingText || 'Analysis complete.',
                 type: 'final_response',
-                deploymentPlan: data.deployment_plan
+                deploymentPlan: data.deployment_plan,
+                streamingText: undefined
               }
             : msg
         ));
@@ -416,6 +424,11 @@ export default function ChatSidebar({
                           </motion.div>
                         ))}
                       </AnimatePresence>
+                      {message.streamingText && (
+                        <p className="text-sm leading-relaxed whitespace-pre-wrap text-foreground pt-2">
+                          {message.streamingText}
+                        </p>
+                      )}
                     </div>
                   )}
 
@@ -16,6 +16,7 @@ export interface ChatMessage {
   type?: MessageType;
   agentSteps?: AgentStep[];
   deploymentPlan?: DeploymentPlan;
+  streamingText?: string;  // Explanation received so far (while processing)
 }
 
 export interface AgentStep {
@@ -119,12 +120,13 @@ export interface AssetsSummary {
 }
 
 export interface WebSocketMessage {
-  type: 'agent_step' | 'final_response' | 'error';
+  type: 'agent_step' | 'explanation_delta' | 'final_response' | 'error';
   agent?: string;
   action?: string;
   status?: AgentStepStatus;
   data?: Record<string, any>;
   explanation?: string;
+  delta?: string;  // Partial explanation text (explanation_delta)
   data_synthesis?: string;
   deployment_plan?: DeploymentPlan;
   tract_geometries?: any;
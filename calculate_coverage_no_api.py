@@ -146,7 +146,7 @@ def aggregate_hexagon_coverage(hexagons_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFra
         max_up = group['max_advertised_upload_speed'].max()
 
         result = {
-            hex_id_col: group[hex_id_col].iloc[0],
+            hex_id_col: group.name,
             'max_down': max_down,
             'max_up': max_up,
             'geometry': group.geometry.iloc[0]
@@ -181,7 +181,7 @@ def aggregate_hexagon_coverage(hexagons_gdf: gpd.GeoDataFrame) -> gpd.GeoDataFra
 
         # Determine which speed tiers are met
         result = {
-            hex_id_col: group[hex_id_col].iloc[0],
+            hex_id_col: group.name,
             'max_down_speed': max_down,
             'max_up_speed': max_up,
             'provider_count': group['provider_id'].nunique() if 'provider_id' in group.columns else len(group),
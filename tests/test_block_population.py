@@ -0,0 +1,97 @@
+"""
+Unit tests for block_population.py
+
+Tests the per-county memory/Parquet cache in front of the Census block API.
+requests.get is stubbed, so no network access is needed.
+"""
+
+import pytest
+import requests
+
+import sys
+import os
+
+# Add backend directory to path to import the data_pipeline package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from data_pipeline import block_population
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in"""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+COUNTY_PAYLOAD = [
+    ["P1_001N", "state", "county", "tract", "block"],
+    ["250", "12", "079", "110100", "1001"],
+    ["0", "12", "079", "110100", "1002"],
+    ["75", "12", "079", "110200", "1001"],
+]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Empty Parquet cache directory and in-process cache"""
+    monkeypatch.setattr(block_population, "BLOCK_POPULATION_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(block_population, "_county_frames", {})
+    return tmp_path
+
+
+@pytest.fixture
+def census_api(monkeypatch):
+    """Stub requests.get; returns the list of request params made"""
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params)
+        return FakeResponse(COUNTY_PAYLOAD)
+
+    monkeypatch.setattr(block_population.requests, "get", fake_get)
+    return calls
+
+
+class TestCountyBlockPopulationCache:
+    """Tests for load_county_block_population and the tract lookups"""
+
+    def test_miss_fetches_and_writes_parquet(self, cache_dir, census_api):
+        frame = block_population.load_county_block_population("12", "079")
+
+        assert len(census_api) == 1
+        assert census_api[0]["in"] == "state:12+county:079+tract:*"
+        assert list(frame["block_geoid"]) == ["120791101001001", "120791101001002", "120791102001001"]
+        assert (cache_dir / "blocks_12079.parquet").exists()
+
+    def test_hit_served_from_parquet_then_memory(self, cache_dir, census_api):
+        block_population.load_county_block_population("12", "079")
+
+        # New process: memory cache empty, Parquet file present
+        block_population._county_frames.clear()
+        populations = block_population.fetch_block_population_for_tract("12079110100")
+        again = block_population.fetch_block_population_for_tracts(["12079110100", "12079110200"])
+
+        assert len(census_api) == 1
+        assert populations == {"120791101001001": 250, "120791101001002": 0}
+        assert again["120791102001001"] == 75
+
+    def test_api_failure_returns_empty_and_is_not_cached(self, cache_dir, monkeypatch):
+        def failing_get(url, params=None, timeout=None):
+            raise requests.ConnectionError("census down")
+
+        monkeypatch.setattr(block_population.requests, "get", failing_get)
+
+        assert block_population.fetch_block_population_for_tract("12079110100") == {}
+        assert not (cache_dir / "blocks_12079.parquet").exists()
+        assert ("12", "079") not in block_population._county_frames
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Unit tests for block_store.py
+
+Round-trips a small block shapefile through build_block_store and reads it
+back per tract with CensusBlockLoader.
+"""
+
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the data_pipeline package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+import geopandas as gpd
+from shapely.geometry import box
+
+from data_pipeline.block_store import BlockStore, build_block_store
+from data_pipeline.census_blocks import CensusBlockLoader
+
+
+@pytest.fixture
+def block_shapefile(tmp_path):
+    """tabblock20-style shapefile with blocks of two tracts, out of GEOID order"""
+    blocks = gpd.GeoDataFrame(
+        {
+            "GEOID20": ["120791102001001", "120791101001002", "120791101001001", "12079110"],
+            "ALAND20": [300, 200, 100, 0],
+            "AWATER20": [3, 2, 1, 0],
+        },
+        geometry=[box(2, 0, 3, 1), box(1, 0, 2, 1), box(0, 0, 1, 1), box(5, 5, 6, 6)],
+        crs="EPSG:4269",
+    )
+    path = tmp_path / "tl_2024_12_tabblock20.shp"
+    blocks.to_file(path, driver="ESRI Shapefile")
+    return path
+
+
+class TestBlockStore:
+    """Tests for building and reading the block store"""
+
+    def test_round_trip(self, block_shapefile, tmp_path):
+        store_dir = build_block_store(str(block_shapefile), str(tmp_path / "store"))
+        assert BlockStore.exists(store_dir)
+
+        # Invalid GEOIDs are dropped; tracts are indexed in GEOID order
+        assert BlockStore(store_dir).tract_geoids() == ["12079110100", "12079110200"]
+
+        loader = CensusBlockLoader(str(block_shapefile), str(store_dir))
+        blocks = loader.get_tract_blocks("12079110100")
+
+        assert list(blocks.geoids) == ["120791101001001", "120791101001002"]
+        assert list(blocks.land_area_m2) == [100, 200]
+        assert list(blocks.water_area_m2) == [1, 2]
+        assert blocks.geometries[0].equals(box(0, 0, 1, 1))
+        assert list(blocks.centroid_x) == [0.5, 1.5]
+
+        # Reads are cached per tract
+        assert loader.get_tract_blocks("12079110100") is blocks
+
+    def test_missing_tract(self, block_shapefile, tmp_path):
+        store_dir = build_block_store(str(block_shapefile), str(tmp_path / "store"))
+        loader = CensusBlockLoader(str(block_shapefile), str(store_dir))
+
+        assert len(loader.get_tract_blocks("12079999999")) == 0
+        assert loader.get_blocks_for_tract("12079999999") == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
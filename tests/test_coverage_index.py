@@ -0,0 +1,127 @@
+"""
+Unit tests for agents/coverage_index.py
+
+Tests GEOID normalization and the GEOID/county/state lookups used by chat.
+"""
+
+import pandas as pd
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the agents package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from agents.coverage_index import (
+    TractCoverageIndex,
+    county_fips_for_name,
+    county_name_for_geoid,
+    extract_geoids,
+    normalize_geoid,
+)
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Index built from a small coverage CSV"""
+    csv_path = tmp_path / "coverage.csv"
+    pd.DataFrame({
+        "GEOID": [12079110200, 12079110100, 12086000100, 1001020100],
+        "coverage": [35.5, 80.0, 99.0, None],
+        "population": [4200.0, 3100.0, None, 1500.0],
+        "median_income": [31000, 52000, 75000, 40000],
+        "poverty_rate": [28.1, 12.0, 5.5, 18.0],
+        "asset_count_schools": [2, 1, 0, 1],
+        "asset_count_libraries": [1, 0, 0, 0],
+    }).to_csv(csv_path, index=False)
+    return TractCoverageIndex.from_csv(csv_path)
+
+
+class TestNormalizeGeoid:
+    """Tests for GEOID parsing"""
+
+    @pytest.mark.parametrize("value,expected", [
+        (12079110200, "12079110200"),
+        ("12079110200", "12079110200"),
+        (12079110200.0, "12079110200"),
+        (1001020100, "01001020100"),
+        ("1400000US12079110200", "12079110200"),
+        ("1207911020", "01207911020"),
+        ("120791", None),
+        (None, None),
+        (float("nan"), None),
+    ])
+    def test_normalize(self, value, expected):
+        assert normalize_geoid(value) == expected
+
+    def test_extract_from_text(self):
+        text = "Compare 12079110200 with tract 12086000100 and 12079110200 again (zip 32340)"
+        assert extract_geoids(text) == ["12079110200", "12086000100"]
+
+    def test_extract_ignores_ten_digit_numbers(self):
+        assert extract_geoids("call me at 8505551234 about 12079110200") == ["12079110200"]
+
+
+class TestTractCoverageIndex:
+    """Tests for the indexed lookups"""
+
+    def test_get_normalizes_and_maps_fields(self, index):
+        tract = index.get(12079110200)
+
+        assert tract["geoid"] == "12079110200"
+        assert tract["coverage_percent"] == 35.5
+        assert tract["population"] == 4200
+        assert tract["schools"] == 2
+        assert tract["total_assets"] == 3
+        assert tract["transit_stops"] == 0
+
+    def test_missing_values_become_zero(self, index):
+        assert index.get("12086000100")["population"] == 0
+        assert index.get("01001020100")["coverage_percent"] == 0.0
+
+    def test_get_returns_copy(self, index):
+        index.get("12079110200")["population"] = -1
+        assert index.get("12079110200")["population"] == 4200
+
+    def test_unknown_tract(self, index):
+        assert index.get("12999999999") is None
+        assert "12999999999" not in index
+        assert "12079110200" in index
+
+    def test_get_many_keeps_order_and_skips_unknown(self, index):
+        tracts = index.get_many(["12086000100", "bogus", "12079110200"])
+        assert [t["geoid"] for t in tracts] == ["12086000100", "12079110200"]
+
+    def test_prefix_indexes(self, index):
+        assert [t["geoid"] for t in index.tracts_in_county("12079")] == ["12079110100", "12079110200"]
+        assert len(index.tracts_in_state("12")) == 3
+        assert len(index.tracts_in_state("1")) == 1
+        assert index.tracts_in_county("12001") == []
+
+    def test_empty_index(self):
+        index = TractCoverageIndex(None)
+        assert len(index) == 0
+        assert index.get("12079110200") is None
+
+
+class TestCountyNames:
+    """Tests for the Florida county table helpers"""
+
+    def test_county_name_for_geoid(self):
+        assert county_name_for_geoid("12086000100") == "Miami-Dade"
+        assert county_name_for_geoid("13121000100") == "County 121"
+        assert county_name_for_geoid("") == "Unknown County"
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Madison County", "12079"),
+        ("miami-dade", "12086"),
+        ("Saint Johns County", "12109"),
+        ("Atlantis", None),
+    ])
+    def test_county_fips_for_name(self, name, expected):
+        assert county_fips_for_name(name) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
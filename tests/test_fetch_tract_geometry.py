@@ -0,0 +1,136 @@
+"""
+Unit tests for fetch_tract_geometry.py
+
+Tests batched TIGERweb queries against a stubbed HTTP session: following
+pages, retrying failed pages and leaving failed batches missing.
+"""
+
+import pytest
+import requests
+
+import sys
+import os
+
+# Add backend directory to path to import the data_pipeline package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from data_pipeline.fetch_tract_geometry import TractGeometryFetcher
+from geometry_cache import GeometryCache
+
+
+class FakeLocalSource:
+    """Local TIGER/Line source with no data"""
+
+    def get_tract(self, geoid):
+        return None
+
+    def get_tracts(self, geoids):
+        return {}
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in"""
+
+    def __init__(self, data=None, status_code=200):
+        self.data = data
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self):
+        if self.data is None:
+            raise ValueError("Expecting value")
+        return self.data
+
+
+class FakeSession:
+    """Session returning queued responses and recording request offsets"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.offsets = []
+
+    def get(self, url, params=None, timeout=None):
+        self.offsets.append(params["resultOffset"])
+        return self.responses.pop(0)
+
+
+def feature(geoid):
+    return {
+        "type": "Feature",
+        "properties": {"GEOID": geoid},
+        "geometry": {"type": "Point", "coordinates": [-84.0, 30.0]},
+    }
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    fetcher = TractGeometryFetcher(
+        cache_dir=tmp_path / "legacy",
+        cache=GeometryCache(tmp_path / "geometry.sqlite"),
+        local_source=FakeLocalSource(),
+    )
+    fetcher.RETRY_WAIT_S = 0
+    return fetcher
+
+
+class TestFetchBatch:
+    """Tests for TractGeometryFetcher._fetch_batch"""
+
+    def test_follows_pages(self, fetcher):
+        fetcher.session = FakeSession([
+            FakeResponse({"features": [feature("1"), feature("2")], "exceededTransferLimit": True}),
+            FakeResponse({"features": [feature("3")], "properties": {"exceededTransferLimit": True}}),
+            FakeResponse({"features": [feature("4")]}),
+        ])
+
+        features = fetcher._fetch_batch(["1", "2", "3", "4"])
+
+        assert [f["properties"]["GEOID"] for f in features] == ["1", "2", "3", "4"]
+        assert fetcher.session.offsets == [0, 2, 3]
+
+    def test_retries_failed_page(self, fetcher):
+        fetcher.session = FakeSession([
+            FakeResponse({"features": [feature("1")], "exceededTransferLimit": True}),
+            FakeResponse(status_code=503),
+            FakeResponse(None),
+            FakeResponse({"features": [feature("2")]}),
+        ])
+
+        features = fetcher._fetch_batch(["1", "2"])
+
+        assert [f["properties"]["GEOID"] for f in features] == ["1", "2"]
+        assert fetcher.session.offsets == [0, 1, 1, 1]
+
+    def test_raises_after_last_attempt(self, fetcher):
+        fetcher.session = FakeSession(
+            [FakeResponse({"features": [feature("1")], "exceededTransferLimit": True})]
+            + [FakeResponse(status_code=503)] * fetcher.PAGE_ATTEMPTS
+        )
+
+        with pytest.raises(requests.HTTPError):
+            fetcher._fetch_batch(["1", "2"])
+
+
+class TestFetchGeometriesBulk:
+    """Tests for TractGeometryFetcher.fetch_geometries_bulk"""
+
+    def test_failed_batch_left_missing(self, fetcher):
+        # First batch has a complete first page, then its second page keeps failing
+        fetcher.session = FakeSession(
+            [FakeResponse({"features": [feature("1")], "exceededTransferLimit": True})]
+            + [FakeResponse(None)] * fetcher.PAGE_ATTEMPTS
+            + [FakeResponse({"features": [feature("3")]})]
+        )
+
+        results = fetcher.fetch_geometries_bulk(["1", "2", "3"], batch_size=2, max_workers=1)
+
+        # Partial pages of the failed batch are discarded, not cached
+        assert list(results) == ["3"]
+        assert fetcher.cache.get_many("tract", ["1", "3"]).keys() == {"3"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,168 @@
+"""
+Unit tests for geometry_cache.py
+
+Tests the SQLite geometry cache store and its in-memory LRU tier.
+"""
+
+import json
+import time
+
+import pytest
+
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend", "services")))
+
+from feature_lru import FeatureLRU
+from geometry_cache import GeometryCache
+
+
+def make_feature(geoid, x=0.0):
+    """Small square tract feature"""
+    return {
+        "type": "Feature",
+        "properties": {"GEOID": geoid, "NAME": f"Tract {geoid}"},
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[x, 0.0], [x + 1, 0.0], [x + 1, 1.0], [x, 1.0], [x, 0.0]]],
+        },
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Geometry cache in a temporary database"""
+    store = GeometryCache(tmp_path / "geometry.sqlite", memory=FeatureLRU(10 ** 6))
+    yield store
+    store.close()
+
+
+class TestGeometryCache:
+    """Test GeometryCache store"""
+
+    def test_put_many_get_many_round_trip(self, cache):
+        """Test features come back with the same properties and coordinates"""
+        features = {"12001000100": make_feature("12001000100"), "12001000200": make_feature("12001000200", 2.0)}
+        cache.put_many("tract", features)
+
+        result = cache.get_many("tract", ["12001000100", "12001000200", "12001000300"])
+
+        assert set(result) == {"12001000100", "12001000200"}
+        feature = result["12001000200"]
+        assert feature["properties"] == features["12001000200"]["properties"]
+        assert feature["geometry"]["type"] == "Polygon"
+        assert json.loads(json.dumps(feature["geometry"]["coordinates"])) == (
+            features["12001000200"]["geometry"]["coordinates"]
+        )
+
+    def test_kinds_are_separate(self, cache):
+        """Test the same key under different kinds does not collide"""
+        cache.put("boundary", "atlanta", make_feature("13121"))
+
+        assert cache.get("tract", "atlanta") is None
+        assert cache.get("boundary", "atlanta")["properties"]["GEOID"] == "13121"
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test entries older than the TTL are not returned"""
+        store = GeometryCache(tmp_path / "geometry.sqlite", ttl_seconds=60, memory=FeatureLRU(10 ** 6))
+        store.put("tract", "12001000100", make_feature("12001000100"))
+        assert store.get("tract", "12001000100") is not None
+
+        store.ttl_seconds = 0
+        time.sleep(0.01)
+        assert store.get("tract", "12001000100") is None
+        store.close()
+
+    def test_import_legacy_file(self, cache, tmp_path):
+        """Test a legacy per-GEOID JSON file is imported on first miss"""
+        legacy_file = tmp_path / "12001000100.json"
+        legacy_file.write_text(json.dumps(make_feature("12001000100")))
+
+        assert cache.import_legacy_file("tract", "12001000100", legacy_file) is not None
+        assert cache.get("tract", "12001000100") is not None
+        assert cache.import_legacy_file("tract", "missing", tmp_path / "missing.json") is None
+
+    def test_stats_count_lookups(self, tmp_path):
+        """Test hits, misses and expired entries are counted per key"""
+        store = GeometryCache(tmp_path / "geometry.sqlite", ttl_seconds=60, memory=FeatureLRU(10 ** 6))
+        store.put_many("tract", {"1": make_feature("1"), "2": make_feature("2", 2.0)})
+
+        store.get_many("tract", ["1", "2", "3"])  # two from SQLite, one miss
+        store.get("tract", "1")  # from memory
+        assert store.stats() == {"hits": 3, "misses": 1, "evictions": 0, "entries": 2}
+
+        store.ttl_seconds = 0
+        time.sleep(0.01)
+        store.get("tract", "2")
+        assert store.stats()["misses"] == 2
+        assert store.stats()["evictions"] == 1
+        store.close()
+
+    def test_entry_counts_without_query(self, cache, tmp_path):
+        """Test entry counts follow puts, replacements and deletes, and survive reopening"""
+        cache.put_many("tract", {"1": make_feature("1"), "2": make_feature("2")})
+        cache.put("tract", "1", make_feature("1", 5.0))
+        cache.put("boundary", "atlanta", make_feature("13121"))
+        cache.delete("tract", "2")
+        cache.delete("tract", "missing")
+
+        assert cache.entries_by_kind() == {"tract": 1, "boundary": 1}
+        assert cache.stats()["entries"] == 2
+
+        reopened = GeometryCache(cache.db_path, memory=FeatureLRU(10 ** 6))
+        assert reopened.entries_by_kind() == {"tract": 1, "boundary": 1}
+        reopened.close()
+
+
+
+class TestFeatureLRU:
+    """Test the in-memory tier in front of GeometryCache"""
+
+    def test_repeat_reads_hit_memory(self, cache):
+        """Test a second read is served from memory with the cached shapely geometry"""
+        cache.put("tract", "12001000100", make_feature("12001000100"))
+
+        first = cache.get("tract", "12001000100")
+        second = cache.get("tract", "12001000100")
+
+        assert cache.memory.stats()["hits"] == 1
+        assert second["geometry"] is first["geometry"]
+        assert cache.memory.shape_of(second).area == pytest.approx(1.0)
+
+    def test_callers_get_independent_properties(self, cache):
+        """Test mutating a returned feature does not change the cached one"""
+        cache.put("tract", "12001000100", make_feature("12001000100"))
+        cache.get("tract", "12001000100")["properties"]["geoid"] = "changed"
+
+        assert "geoid" not in cache.get("tract", "12001000100")["properties"]
+
+    def test_evicts_least_recently_used_by_bytes(self, tmp_path):
+        """Test entries beyond the byte budget are evicted oldest first"""
+        memory = FeatureLRU(max_bytes=2000)
+        store = GeometryCache(tmp_path / "geometry.sqlite", memory=memory)
+        store.put_many("tract", {str(i): make_feature(str(i), float(i)) for i in range(5)})
+
+        store.get_many("tract", [str(i) for i in range(5)])
+
+        stats = memory.stats()
+        assert stats["bytes"] <= 2000
+        assert stats["evictions"] == 5 - stats["entries"]
+        assert memory.get((str(store.db_path), "tract", "4")) is not None
+        assert memory.get((str(store.db_path), "tract", "0")) is None
+        store.close()
+
+    def test_put_invalidates_memory(self, cache):
+        """Test replacing a feature is visible on the next read"""
+        cache.put("boundary", "atlanta", make_feature("13121"))
+        cache.get("boundary", "atlanta")
+        cache.put("boundary", "atlanta", make_feature("13089"))
+
+        assert cache.get("boundary", "atlanta")["properties"]["GEOID"] == "13089"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
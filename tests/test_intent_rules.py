@@ -0,0 +1,110 @@
+"""
+Unit tests for agents/intent_rules.py
+
+Tests the rule-based fast path in front of Gemini intent classification.
+"""
+
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the agents package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from agents.intent_rules import FastIntentClassifier
+
+
+@pytest.fixture
+def classifier():
+    return FastIntentClassifier()
+
+
+class TestFastIntentClassifier:
+    """Tests for intent rules"""
+
+    @pytest.mark.parametrize("message", ["hello", "Hi there!", "I'm ready", "thanks"])
+    def test_greetings(self, classifier, message):
+        assert classifier.classify(message)["type"] == "general"
+
+    def test_geoids(self, classifier):
+        assert classifier.classify("Tell me about tract 12079110200")["tract_id"] == "12079110200"
+        assert classifier.classify("compare 12079110200 and 12086000100")["tract_id"] == [
+            "12079110200", "12086000100"
+        ]
+
+    @pytest.mark.parametrize("message", [
+        "How are scores calculated?",
+        "what does tier 1 mean",
+        "What is your methodology?",
+    ])
+    def test_methodology(self, classifier, message):
+        assert classifier.classify(message)["type"] == "methodology"
+
+    @pytest.mark.parametrize("message,location_name", [
+        ("Where should we deploy WiFi in Madison County?", "Madison County"),
+        ("Recommend sites in Miami-Dade County, Florida", "Miami-Dade County"),
+        ("deploy wifi in St. Johns County", "St. Johns County"),
+        ("Which WiFi sites should Palm Beach County prioritize?", "Palm Beach County"),
+    ])
+    def test_county_deployment(self, classifier, message, location_name):
+        intent = classifier.classify(message)
+
+        assert intent["type"] == "deployment_recommendation"
+        assert intent["location_name"] == location_name
+        assert intent["location_type"] == "city"
+        assert intent["state_name"] == "Florida"
+
+    def test_state_deployment(self, classifier):
+        intent = classifier.classify("Where should we deploy wifi in Georgia?")
+
+        assert intent["location_type"] == "state"
+        assert intent["location_name"] == "Georgia"
+
+    def test_county_tracts(self, classifier):
+        intent = classifier.classify("Which tracts in Leon County are worst?")
+
+        assert intent["type"] == "tract_details"
+        assert intent["location_name"] == "Leon County"
+
+    def test_coverage_question_is_not_deployment(self, classifier):
+        intent = classifier.classify("How many tracts in Madison County have low broadband coverage?")
+
+        assert intent["type"] == "tract_details"
+        assert intent["location_name"] == "Madison County"
+
+    @pytest.mark.parametrize("message", [
+        "What is internet access like in Leon County?",
+        "How does WiFi help Madison County?",
+        "Is broadband a priority in Georgia?",
+    ])
+    def test_topic_words_are_not_deployment(self, classifier, message):
+        assert classifier.classify(message) is None
+
+    def test_phone_number_is_not_geoid(self, classifier):
+        assert classifier.classify("call me at 8505551234") is None
+
+    @pytest.mark.parametrize("message", [
+        "deploy wifi in Fulton County, Georgia",
+        "deploy in Lake County and Orange County",
+        "what about Leon County?",
+        "how does this work",
+        "yes",
+    ])
+    def test_ambiguous_falls_back(self, classifier, message):
+        assert classifier.classify(message) is None
+
+    def test_stats(self, classifier):
+        classifier.classify("hello")
+        classifier.classify("How are scores calculated?")
+        classifier.classify("yes")
+
+        stats = classifier.stats()
+        assert stats["fast_path_hits"] == 2
+        assert stats["fallbacks"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["intents"] == {"general": 1, "methodology": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,79 @@
+"""
+Unit tests for agents/llm_backend.py
+
+Tests the deterministic stub backend and backend selection.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the agents package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from agents.llm_backend import GeminiBackend, LLMBackend, StubBackend, create_backend
+
+
+@pytest.fixture
+def stub():
+    return StubBackend(latency_ms=0, chunk_ms=0, words=10)
+
+
+class TestStubBackend:
+    """Tests for the load-testing stand-in"""
+
+    def test_deterministic(self, stub):
+        assert stub.generate("prompt a") == stub.generate("prompt a")
+        assert stub.generate("prompt a") != stub.generate("prompt b")
+
+    def test_stream_matches_generate(self, stub):
+        chunks = list(stub.stream("prompt a"))
+        assert len(chunks) == 10
+        assert "".join(chunks) == stub.generate("prompt a")
+
+    def test_classification_prompt_returns_intent(self, stub):
+        text = stub.generate("Analyze this user query and classify its intent.")
+        assert '"type": "general"' in text
+
+    def test_orchestrator_uses_backend(self, stub):
+        from agents.orchestrator import GeminiOrchestrator
+
+        orchestrator = GeminiOrchestrator(gemini_api_key=None, census_api_key=None, backend=stub)
+        orchestrator.llm_cache.clear()
+        deltas = []
+
+        text = asyncio.run(orchestrator._generate_text("prompt c", deltas.append))
+
+        assert text == stub.generate("prompt c")
+        assert "".join(deltas) == text
+
+
+class TestCreateBackend:
+    """Tests for backend selection"""
+
+    def test_stub(self):
+        assert isinstance(create_backend(backend="stub"), StubBackend)
+
+    def test_gemini_requires_key(self):
+        with pytest.raises(ValueError):
+            create_backend(None, backend="gemini")
+        with pytest.raises(ValueError):
+            GeminiBackend("")
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            create_backend(backend="bogus")
+
+    def test_backend_without_stream(self):
+        class Incomplete(LLMBackend):
+            name = 'incomplete'
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
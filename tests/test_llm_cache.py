@@ -0,0 +1,98 @@
+"""
+Unit tests for agents/llm_cache.py
+
+Tests cache keys, LRU eviction, TTL expiry and SQLite persistence of the
+Gemini response cache.
+"""
+
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the agents package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from agents import llm_cache
+from agents.llm_cache import LLMResponseCache, make_key, normalize_question
+
+
+class TestKeys:
+    """Tests for question normalization and key building"""
+
+    def test_normalize_question(self):
+        assert normalize_question("  How are SCORES calculated?! ") == "how are scores calculated"
+
+    def test_equivalent_questions_share_key(self):
+        assert make_key("tract", "Tell me about it?", {"a": 1, "b": 2}) == \
+            make_key("tract", "tell me about  it", {"b": 2, "a": 1})
+
+    def test_data_and_kind_change_key(self):
+        key = make_key("tract", "tell me about it", {"a": 1})
+        assert key != make_key("tract", "tell me about it", {"a": 2})
+        assert key != make_key("general", "tell me about it", {"a": 1})
+
+
+class TestLLMResponseCache:
+    """Tests for the memory and SQLite tiers"""
+
+    def test_get_put_and_stats(self):
+        cache = LLMResponseCache(max_bytes=1024)
+
+        assert cache.get("k") is None
+        cache.put("k", "answer")
+        assert cache.get("k") == "answer"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["bytes"] == len("answer")
+
+    def test_empty_response_not_cached(self):
+        cache = LLMResponseCache(max_bytes=1024)
+        cache.put("k", "")
+        assert cache.get("k") is None
+
+    def test_lru_eviction_by_bytes(self):
+        cache = LLMResponseCache(max_bytes=10)
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        cache.get("a")
+        cache.put("c", "cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "aaaa"
+        assert cache.get("c") == "cccc"
+        assert cache.stats()["evictions"] == 1
+        assert cache.bytes == 8
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now[0])
+        cache = LLMResponseCache(max_bytes=1024, ttl_seconds=60)
+
+        cache.put("short", "x")
+        cache.put("long", "y", ttl_seconds=3600)
+        now[0] += 120
+
+        assert cache.get("short") is None
+        assert cache.get("long") == "y"
+        assert cache.bytes == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        db_path = tmp_path / "llm.sqlite"
+        cache = LLMResponseCache(max_bytes=1024, db_path=db_path)
+        cache.put("k", "persisted")
+        cache.close()
+
+        reopened = LLMResponseCache(max_bytes=1024, db_path=db_path)
+        assert reopened.get("k") == "persisted"
+
+        reopened.clear()
+        assert reopened.get("k") is None
+        reopened.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
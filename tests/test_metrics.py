@@ -0,0 +1,149 @@
+"""
+Unit tests for services/metrics.py
+
+Tests pipeline stage spans, cache/upstream instrumentation and the
+Prometheus text rendering.
+"""
+
+from functools import lru_cache
+
+import pytest
+
+import sys
+import os
+
+# Add services directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend", "services")))
+
+from metrics import (
+    MetricsRegistry,
+    PipelineTrace,
+    lru_cache_stats,
+    record_cache_lookup,
+    register_cache,
+    track_upstream,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(buckets=(0.1, 1.0))
+
+
+class TestPipelineTrace:
+    """Tests for stage spans"""
+
+    def test_spans_and_metadata(self, registry):
+        trace = PipelineTrace("deployment", registry)
+        with trace.stage("spatial_filter", rows_in=100) as span:
+            span.rows_out = 12
+            span.cache = "miss"
+        with trace.stage("ranking", rows_in=12):
+            pass
+        trace.finish()
+
+        metadata = trace.to_dict()
+        assert metadata["status"] == "success"
+        assert [s["stage"] for s in metadata["stages"]] == ["spatial_filter", "ranking"]
+        assert metadata["stages"][0]["rows_out"] == 12
+        assert metadata["stages"][0]["cache"] == "miss"
+        assert "cache" not in metadata["stages"][1]
+        assert metadata["total_ms"] >= sum(s["wall_ms"] for s in metadata["stages"]) - 0.1
+
+    def test_failing_stage_records_error(self, registry):
+        trace = PipelineTrace("deployment", registry)
+        with pytest.raises(FileNotFoundError):
+            with trace.stage("coverage_csv"):
+                raise FileNotFoundError("missing")
+        trace.finish()
+
+        assert trace.status == "error"
+        assert trace.spans[0].error == "FileNotFoundError"
+        assert 'pipeline_runs_total{pipeline="deployment",status="error"} 1' in registry.render()
+
+
+class TestMetricsRegistry:
+    """Tests for the text exposition format"""
+
+    def test_counter(self, registry):
+        registry.inc("requests_total", help_text="Requests", route="/a")
+        registry.inc("requests_total", 2, route="/a")
+
+        text = registry.render()
+        assert "# HELP requests_total Requests" in text
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/a"} 3' in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        for value in (0.05, 0.5, 5.0):
+            registry.observe("stage_seconds", value, stage="x")
+
+        text = registry.render()
+        assert 'stage_seconds_bucket{stage="x",le="0.1"} 1' in text
+        assert 'stage_seconds_bucket{stage="x",le="1"} 2' in text
+        assert 'stage_seconds_bucket{stage="x",le="+Inf"} 3' in text
+        assert 'stage_seconds_count{stage="x"} 3' in text
+        assert 'stage_seconds_sum{stage="x"} 5.55' in text
+
+    def test_label_escaping(self, registry):
+        registry.inc("errors_total", message='bad "value"')
+        assert 'errors_total{message="bad \\"value\\""} 1' in registry.render()
+
+
+class TestInstrumentation:
+    """Tests for cache collectors and upstream tracking"""
+
+    def test_register_cache_reads_stats_on_scrape(self, registry):
+        stats = {"hits": 1, "misses": 2, "evictions": 0, "entries": 2}
+        register_cache("lru", lambda: stats, registry)
+        stats["hits"] = 5
+
+        text = registry.render()
+        assert "# TYPE cache_hits_total counter" in text
+        assert 'cache_hits_total{cache="lru"} 5' in text
+        assert 'cache_entries{cache="lru"} 2' in text
+        assert "cache_bytes" not in text
+
+    def test_recorded_lookups_share_metric_with_collectors(self, registry):
+        register_cache("lru", lambda: {"hits": 1}, registry)
+        record_cache_lookup("county", True, registry)
+        record_cache_lookup("county", False, registry)
+
+        text = registry.render()
+        assert text.count("# TYPE cache_hits_total counter") == 1
+        assert 'cache_hits_total{cache="county"} 1' in text
+        assert 'cache_misses_total{cache="county"} 1' in text
+
+    def test_failing_collector_is_skipped(self, registry):
+        registry.register_collector("broken", lambda: 1 / 0)
+        registry.inc("ok_total")
+        assert "ok_total 1" in registry.render()
+
+    def test_lru_cache_stats(self):
+        @lru_cache(maxsize=2)
+        def square(x):
+            return x * x
+
+        for x in (1, 2, 1, 3):
+            square(x)
+
+        assert lru_cache_stats(square) == {
+            "hits": 1, "misses": 3, "evictions": 1, "entries": 2, "max_entries": 2
+        }
+
+    def test_track_upstream(self, registry):
+        with track_upstream("census", "acs", registry):
+            pass
+        with pytest.raises(TimeoutError):
+            with track_upstream("census", "acs", registry):
+                raise TimeoutError()
+
+        text = registry.render()
+        assert 'upstream_requests_total{operation="acs",status="ok",upstream="census"} 1' in text
+        assert 'upstream_requests_total{operation="acs",status="error",upstream="census"} 1' in text
+        assert 'upstream_request_duration_seconds_count{operation="acs",upstream="census"} 2' in text
+        assert 'upstream_in_flight{upstream="census"} 0' in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
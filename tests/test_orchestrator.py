@@ -0,0 +1,160 @@
+"""
+Unit tests for agents/orchestrator.py
+
+Tests explanation streaming (explanation_delta events against the final
+response, cancellation of the synthesis task when the client stops early)
+and the speculative pipeline warm-up.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the agents package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from agents import orchestrator as orchestrator_module
+from agents.llm_backend import StubBackend
+from agents.orchestrator import GeminiOrchestrator
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = GeminiOrchestrator(
+        gemini_api_key=None,
+        census_api_key=None,
+        backend=StubBackend(latency_ms=0, chunk_ms=1, words=20),
+    )
+    orchestrator.llm_cache.clear()
+    return orchestrator
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+class TestStreaming:
+    """Tests for explanation_delta streaming"""
+
+    @pytest.mark.parametrize("message", ["How are scores calculated?", "hello"])
+    def test_deltas_join_to_final_text(self, orchestrator, message):
+        events = asyncio.run(collect(orchestrator.process_query(message, "Madison County")))
+
+        deltas = [e["delta"] for e in events if e["type"] == "explanation_delta"]
+        final = [e for e in events if e["type"] == "final_response"]
+
+        assert len(deltas) == 20
+        assert len(final) == 1
+        assert "".join(deltas) == final[0]["explanation"]
+
+    def test_cached_answer_streams_as_one_delta(self, orchestrator):
+        message = "How are scores calculated?"
+        first = asyncio.run(collect(orchestrator.process_query(message, "Madison County")))
+        second = asyncio.run(collect(orchestrator.process_query(message, "Madison County")))
+
+        deltas = [e["delta"] for e in second if e["type"] == "explanation_delta"]
+        assert deltas == [first[-1]["explanation"]]
+
+    def test_deltas_after_synthesis_are_flushed(self):
+        async def run():
+            deltas: asyncio.Queue = asyncio.Queue()
+
+            async def synthesize():
+                for chunk in ("a ", "b ", "c"):
+                    deltas.put_nowait(chunk)
+                return "a b c"
+
+            synthesis = asyncio.create_task(synthesize())
+            events = await collect(GeminiOrchestrator._stream_deltas(synthesis, deltas))
+            return events, synthesis.result()
+
+        events, text = asyncio.run(run())
+        assert "".join(e["delta"] for e in events) == text
+
+    def test_early_exit_cancels_synthesis(self):
+        async def run():
+            deltas: asyncio.Queue = asyncio.Queue()
+            never = asyncio.Event()
+
+            async def synthesize():
+                deltas.put_nowait("first ")
+                await never.wait()
+
+            synthesis = asyncio.create_task(synthesize())
+            stream = GeminiOrchestrator._stream_deltas(synthesis, deltas)
+            first = await stream.__anext__()
+
+            # Client went away after the first chunk
+            await stream.aclose()
+            await asyncio.sleep(0)
+            return first, synthesis
+
+        first, synthesis = asyncio.run(run())
+        assert first == {"type": "explanation_delta", "delta": "first "}
+        assert synthesis.cancelled()
+
+
+class TestSpeculativeWarmup:
+    """Tests for the pipeline warm-up started while Gemini classifies"""
+
+    @pytest.fixture
+    def warmed(self, monkeypatch):
+        """Record warm-ups instead of running the pipeline"""
+        calls = []
+
+        def fake_warm(location_name, location_type, state_name, slug):
+            calls.append((location_name, location_type, state_name))
+            if location_name == "Leon County":
+                raise FileNotFoundError("no boundary")
+
+        monkeypatch.setattr(orchestrator_module, "warm_deployment_pipeline", fake_warm)
+        return calls
+
+    @pytest.mark.parametrize("city,key", [
+        ("Madison County", ("Madison County", "city", "Florida")),
+        ("Georgia", ("Georgia", "state", "Georgia")),
+        ("Atlanta", None),
+        ("Madison County, Georgia", None),
+        ("", None),
+    ])
+    def test_location_key(self, orchestrator, warmed, city, key):
+        async def run():
+            warmup = orchestrator._start_warmup(city)
+            if warmup is not None:
+                await warmup[1]
+            return warmup
+
+        warmup = asyncio.run(run())
+        assert (warmup[0] if warmup else None) == key
+
+    def test_failure_expires(self, orchestrator, warmed, monkeypatch):
+        async def run():
+            await asyncio.gather(orchestrator._start_warmup("Leon County")[1], return_exceptions=True)
+            await asyncio.sleep(0)
+            blocked = orchestrator._start_warmup("Leon County")
+
+            monkeypatch.setattr(orchestrator_module, "WARMUP_RETRY_AFTER_S", 0)
+            retried = orchestrator._start_warmup("Leon County")
+            await asyncio.gather(retried[1], return_exceptions=True)
+            return blocked, retried
+
+        blocked, retried = asyncio.run(run())
+        assert blocked is None
+        assert retried is not None
+        assert len(warmed) == 2
+
+    @pytest.mark.parametrize("message,started", [
+        ("what about it?", 0),
+        ("deploy wifi in Fulton County, Georgia", 1),
+    ])
+    def test_only_deployment_phrasing_is_warmed(self, orchestrator, warmed, message, started):
+        asyncio.run(collect(orchestrator.process_query(message, "Madison County")))
+
+        assert orchestrator.speculation_stats()["started"] == started
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+Unit tests for population_coverage.py
+
+Tests the population-weighted tract coverage calculation.
+"""
+
+import pytest
+import pandas as pd
+
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.backend.data_pipeline.population_coverage import (
+    calculate_population_weighted_coverage,
+)
+
+
+@pytest.fixture
+def fcc_df():
+    """Provider-level availability rows for two blocks in one tract"""
+    return pd.DataFrame(
+        {
+            "block_geoid": [
+                "120010001001000",
+                "120010001001000",
+                "120010001001001",
+                None,
+            ],
+            "max_advertised_download_speed": [30, 1000, 10, 100],
+            "max_advertised_upload_speed": [5, 100, 1, 20],
+        }
+    )
+
+
+class TestCalculatePopulationWeightedCoverage:
+    """Test calculate_population_weighted_coverage function"""
+
+    def test_weights_by_block_population(self, fcc_df):
+        """Test coverage is the share of residents in served blocks"""
+        block_population = {
+            "120010001001000": 100,  # Served at every tier
+            "120010001001001": 300,  # Served below 25/3 only
+        }
+
+        result = calculate_population_weighted_coverage(fcc_df, block_population)
+        row = result.set_index("tract_geoid").loc["12001000100"]
+
+        assert row["total_population"] == 400
+        assert row["served_population_25_3"] == 100
+        assert row["pop_coverage_percent_25_3"] == pytest.approx(25.0)
+        assert row["pop_coverage_percent_1000_100"] == pytest.approx(25.0)
+
+    def test_unserved_tract_has_zero_coverage(self, fcc_df):
+        """Test tracts with no FCC rows are reported with 0% coverage"""
+        block_population = pd.Series({"120010002001000": 50})
+
+        result = calculate_population_weighted_coverage(fcc_df, block_population)
+        row = result.set_index("tract_geoid").loc["12001000200"]
+
+        assert row["total_population"] == 50
+        assert row["pop_coverage_percent_25_3"] == 0
+
+    def test_zero_population_tract(self, fcc_df):
+        """Test tracts without residents do not divide by zero"""
+        block_population = pd.DataFrame(
+            {"block_geoid": ["120010001001000"], "population": [0]}
+        )
+
+        result = calculate_population_weighted_coverage(fcc_df, block_population)
+
+        assert result["pop_coverage_percent_25_3"].tolist() == [0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,82 @@
+"""
+Unit tests for response_cache.py
+
+Tests serialized response caching with ETag/Last-Modified validation.
+"""
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+import sys
+import os
+
+# Add services directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend", "services")))
+
+from response_cache import ResponseCache
+
+
+@pytest.fixture
+def client():
+    """App with one cached endpoint counting payload builds"""
+    app = FastAPI()
+    app.state.builds = 0
+    cache = ResponseCache(max_bytes=10 ** 6)
+
+    @app.get("/items/{name}")
+    async def get_item(name: str, request: Request):
+        async def build():
+            if name == "missing":
+                raise HTTPException(status_code=404, detail="not found")
+            app.state.builds += 1
+            return {"name": name, "values": list(range(1000))}
+
+        return await cache.respond(request, ("item", name), build)
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestResponseCache:
+    """Test ResponseCache endpoint behavior"""
+
+    def test_payload_built_once(self, client):
+        """Test repeated requests reuse the serialized body"""
+        first = client.get("/items/a")
+        second = client.get("/items/a")
+
+        assert first.json() == second.json()
+        assert first.headers["etag"] == second.headers["etag"]
+        assert client.app.state.builds == 1
+
+    def test_conditional_requests_return_304(self, client):
+        """Test If-None-Match and If-Modified-Since validators"""
+        first = client.get("/items/a")
+
+        by_etag = client.get("/items/a", headers={"If-None-Match": first.headers["etag"]})
+        by_date = client.get("/items/a", headers={"If-Modified-Since": first.headers["last-modified"]})
+        stale = client.get("/items/a", headers={"If-None-Match": 'W/"other"'})
+
+        assert by_etag.status_code == 304
+        assert by_etag.content == b""
+        assert by_date.status_code == 304
+        assert stale.status_code == 200
+
+    def test_gzip_only_when_accepted(self, client):
+        """Test the compressed body is served only to clients that accept it"""
+        gzipped = client.get("/items/a", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/items/a", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in plain.headers
+        assert gzipped.json() == plain.json()
+
+    def test_errors_not_cached(self, client):
+        """Test HTTP errors from the builder pass through uncached"""
+        assert client.get("/items/missing").status_code == 404
+        assert client.get("/items/missing").status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
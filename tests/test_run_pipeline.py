@@ -0,0 +1,54 @@
+"""
+Unit tests for run_pipeline.py
+
+Tests the per-file-version cache of the tract coverage table.
+"""
+
+import time
+
+import pandas as pd
+import pytest
+
+import sys
+import os
+
+# Add backend directory to path to import the data_pipeline package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from data_pipeline import run_pipeline
+
+
+@pytest.fixture
+def coverage_csv(tmp_path, monkeypatch):
+    """Small coverage CSV and an empty coverage cache"""
+    monkeypatch.setattr(run_pipeline, "_coverage_cache", {})
+    path = tmp_path / "florida_tract_coverage.csv"
+    pd.DataFrame({"GEOID": [12079110100, 12079110200], "coverage": [40.0, 80.0]}).to_csv(path, index=False)
+    return path
+
+
+class TestLoadCoverage:
+    """Tests for _load_coverage"""
+
+    def test_parsed_once(self, coverage_csv, monkeypatch):
+        first = run_pipeline._load_coverage(coverage_csv)
+
+        monkeypatch.setattr(run_pipeline.pd, "read_csv", lambda *args, **kwargs: pytest.fail("re-read"))
+        assert run_pipeline._load_coverage(coverage_csv) is first
+        assert list(first["coverage"]) == [40.0, 80.0]
+
+    def test_reloaded_when_file_changes(self, coverage_csv):
+        first = run_pipeline._load_coverage(coverage_csv)
+
+        pd.DataFrame({"GEOID": [12079110100], "coverage": [10.0]}).to_csv(coverage_csv, index=False)
+        mtime = time.time() + 10
+        os.utime(coverage_csv, (mtime, mtime))
+
+        second = run_pipeline._load_coverage(coverage_csv)
+        assert second is not first
+        assert list(second["coverage"]) == [10.0]
+        assert len(run_pipeline._coverage_cache) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
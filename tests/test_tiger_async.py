@@ -0,0 +1,89 @@
+"""
+Unit tests for AsyncTIGERAPIService
+
+Tests request coalescing against a mocked TIGERweb transport.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import sys
+import os
+
+# Add services directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend", "services")))
+
+from geometry_cache import GeometryCache
+from tiger_api import AsyncTIGERAPIService, TIGERAPIService
+
+
+class FakeLocalSource:
+    """Local TIGER/Line source with no data"""
+
+    def get_state(self, state_fips):
+        return None
+
+    def get_tract(self, geoid):
+        return None
+
+
+def make_service(tmp_path, handler):
+    """Async service over an empty cache and a mocked TIGERweb"""
+    service = TIGERAPIService(
+        cache_dir=tmp_path,
+        cache=GeometryCache(tmp_path / "geometry.sqlite"),
+        local_source=FakeLocalSource(),
+        use_live_api=True,
+    )
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncTIGERAPIService(service, client=client)
+
+
+class TestAsyncTIGERAPIService:
+    """Test AsyncTIGERAPIService"""
+
+    def test_concurrent_requests_share_one_upstream_call(self, tmp_path):
+        """Test simultaneous requests for one state trigger a single TIGERweb call"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.params["where"])
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"features": [{
+                "type": "Feature",
+                "properties": {"GEOID": "13"},
+                "geometry": {"type": "Point", "coordinates": [-83.4, 32.6]},
+            }]})
+
+        async def run():
+            tiger = make_service(tmp_path, handler)
+            results = await asyncio.gather(*[tiger.fetch_state_boundary("Georgia") for _ in range(10)])
+            cached = await tiger.fetch_state_boundary("Georgia")
+            await tiger.aclose()
+            return tiger, results, cached
+
+        tiger, results, cached = asyncio.run(run())
+
+        assert calls == ["STATE='13'"]
+        assert tiger.coalesced_requests == 9
+        assert all(r["properties"]["GEOID"] == "13" for r in results)
+        assert cached["properties"]["GEOID"] == "13"
+
+    def test_upstream_error_returns_none(self, tmp_path):
+        """Test TIGERweb failures are reported as missing boundaries"""
+        def handler(request):
+            return httpx.Response(503)
+
+        async def run():
+            tiger = make_service(tmp_path, handler)
+            result = await tiger.fetch_tract_boundary("12079110200")
+            await tiger.aclose()
+            return result
+
+        assert asyncio.run(run()) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
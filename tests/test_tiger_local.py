@@ -0,0 +1,93 @@
+"""
+Unit tests for tiger_local.py
+
+Tests boundary lookups from local TIGER/Line shapefiles.
+"""
+
+import pytest
+
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend", "services")))
+
+shapefile = pytest.importorskip("shapefile")
+
+from geometry_cache import GeometryCache
+from tiger_local import LocalTIGERSource
+
+
+def square(x):
+    """Unit square ring starting at x"""
+    return [[[x, 0], [x, 1], [x + 1, 1], [x + 1, 0], [x, 0]]]
+
+
+@pytest.fixture
+def tiger_dir(tmp_path):
+    """Directory with small county and Florida tract shapefiles"""
+    counties = shapefile.Writer(str(tmp_path / "tl_2024_us_county"), shapeType=shapefile.POLYGON)
+    for field in ["STATEFP", "COUNTYFP", "GEOID", "NAME", "NAMELSAD", "INTPTLAT", "INTPTLON"]:
+        counties.field(field, "C", 40)
+    counties.poly(square(0))
+    counties.record("12", "079", "12079", "Madison", "Madison County", "+0.5", "+0.5")
+    counties.poly(square(2))
+    counties.record("12", "080", "12080", "Madisonville", "Madisonville County", "+0.5", "+2.5")
+    counties.poly(square(4))
+    counties.record("13", "079", "13079", "Crawford", "Crawford County", "+0.5", "+4.5")
+    counties.close()
+
+    tracts = shapefile.Writer(str(tmp_path / "tl_2024_12_tract"), shapeType=shapefile.POLYGON)
+    for field in ["STATEFP", "COUNTYFP", "TRACTCE", "GEOID", "NAME", "NAMELSAD", "INTPTLAT", "INTPTLON"]:
+        tracts.field(field, "C", 40)
+    tracts.poly(square(0))
+    tracts.record("12", "079", "110200", "12079110200", "1102", "Census Tract 1102", "+0.5", "+0.5")
+    tracts.close()
+
+    return tmp_path
+
+
+@pytest.fixture
+def source(tiger_dir, tmp_path):
+    """Local source backed by a temporary store"""
+    store = GeometryCache(tmp_path / "tiger_line.sqlite", ttl_seconds=None)
+    yield LocalTIGERSource(tiger_dir, store=store)
+    store.close()
+
+
+class TestLocalTIGERSource:
+    """Test LocalTIGERSource lookups"""
+
+    def test_county_exact_name_preferred(self, source):
+        """Test an exact base-name match wins over a partial one"""
+        county = source.get_county("Madison County", "12")
+
+        assert county["properties"]["GEOID"] == "12079"
+        assert county["properties"]["NAME"] == "Madison County"
+        assert county["properties"]["BASENAME"] == "Madison"
+
+    def test_county_partial_name_within_state(self, source):
+        """Test partial names match like BASENAME LIKE '%name%' within the state only"""
+        assert source.find_county_geoid("ville", "12") == "12080"
+        assert source.find_county_geoid("Crawford", "12") is None
+
+    def test_tract_lookup(self, source):
+        """Test tracts load per state and missing states return nothing"""
+        tract = source.get_tract("12079110200")
+
+        assert tract["geometry"]["type"] == "Polygon"
+        assert tract["properties"]["BASENAME"] == "1102"
+        assert source.get_tract("13079000100") is None
+
+    def test_store_reused_without_reloading(self, source, tiger_dir, monkeypatch):
+        """Test a second source reads the existing store instead of the shapefile"""
+        source.get_tract("12079110200")
+
+        reopened = LocalTIGERSource(tiger_dir, store=source.store)
+        monkeypatch.setattr(reopened, "_load_shapefile", lambda kind, path: pytest.fail("reloaded"))
+
+        assert reopened.get_tract("12079110200") is not None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
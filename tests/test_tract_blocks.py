@@ -0,0 +1,76 @@
+"""
+Unit tests for tract_blocks.py
+
+Tests the per-tract block arrays: boundary filtering, subsetting and
+record conversion.
+"""
+
+import pytest
+import shapely
+from shapely.geometry import box
+
+import sys
+import os
+
+# Add backend directory to path to import the data_pipeline package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from data_pipeline.tract_blocks import TractBlocks
+
+
+@pytest.fixture
+def blocks():
+    """Four unit blocks along the x axis"""
+    return TractBlocks(
+        geoids=[f"12079110100100{i}" for i in range(4)],
+        geometries=[box(i, 0, i + 1, 1) for i in range(4)],
+        land_area_m2=[100, 200, 300, 400],
+        water_area_m2=[0, 0, 0, 10],
+        population=[10, 20, 30, 40],
+    )
+
+
+class TestTractBlocks:
+    """Tests for TractBlocks"""
+
+    def test_centroids_precomputed(self, blocks):
+        assert list(blocks.centroid_x) == [0.5, 1.5, 2.5, 3.5]
+        assert list(blocks.centroid_y) == [0.5, 0.5, 0.5, 0.5]
+
+    def test_intersecting_includes_touching_blocks(self, blocks):
+        # Covers blocks 0-1 and touches block 2 along x=2; block 3 is outside
+        tract = box(0, 0, 2, 1)
+        result = blocks.intersecting(tract)
+
+        assert list(result.geoids) == [f"12079110100100{i}" for i in range(3)]
+        assert list(result.population) == [10, 20, 30]
+        assert list(result.centroid_x) == [0.5, 1.5, 2.5]
+
+    def test_intersecting_prepares_caller_geometry(self, blocks):
+        tract = box(0, 0, 2, 1)
+        blocks.intersecting(tract)
+        assert shapely.is_prepared(tract)
+
+    def test_empty(self):
+        empty = TractBlocks.empty()
+        assert len(empty) == 0
+        assert empty.intersecting(box(0, 0, 1, 1)) is empty
+        assert empty.to_records() == []
+
+    def test_to_records(self, blocks):
+        records = blocks.subset([3]).to_records()
+
+        assert records == [{
+            "geoid": "120791101001003",
+            "geometry": blocks.geometries[3],
+            "land_area_m2": 400.0,
+            "water_area_m2": 10.0,
+            "centroid": {"lng": 3.5, "lat": 0.5},
+            "population": 40,
+        }]
+        # Fresh dictionaries on every call
+        assert blocks.subset([3]).to_records()[0] is not records[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""
+Unit tests for warmup.py
+
+Tests warm-up location parsing, step timing and readiness reporting.
+"""
+
+import asyncio
+
+import pytest
+
+import sys
+import os
+
+# Add backend and services directories to path
+backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend"))
+sys.path.insert(0, os.path.join(backend_dir, "services"))
+sys.path.insert(0, backend_dir)
+
+import warmup
+from warmup import WarmupState, parse_locations, parse_warmup_mode, warm_up
+
+
+class TestParseLocations:
+    """Tests for WARMUP_LOCATIONS parsing"""
+
+    def test_cities_and_states(self):
+        assert parse_locations("Madison County, Florida, madison-county-fl; Georgia") == [
+            ("Madison County", "city", "Florida", "madison-county-fl"),
+            ("Georgia", "state", None, None),
+        ]
+
+    def test_empty(self):
+        assert parse_locations("") == []
+        assert parse_locations(" ; ") == []
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_locations("Madison County,Florida")
+
+
+class TestParseWarmupMode:
+    """Tests for STARTUP_WARMUP parsing"""
+
+    @pytest.mark.parametrize("value,mode", [
+        ("background", "background"),
+        (" Blocking ", "blocking"),
+        ("OFF", "off"),
+        ("false", "background"),
+        ("", "background"),
+    ])
+    def test_modes(self, value, mode):
+        assert parse_warmup_mode(value) == mode
+
+
+class TestWarmupState:
+    """Tests for step timing and readiness"""
+
+    def test_run_step_records_result_and_errors(self):
+        state = WarmupState()
+        state.start()
+
+        assert state.run_step("count", lambda: 3) == 3
+        assert state.run_step("broken", lambda: 1 / 0) is None
+
+        steps = state.to_dict()["steps"]
+        assert steps["count"]["status"] == "ok"
+        assert steps["count"]["items"] == 3
+        assert steps["broken"]["status"] == "error"
+        assert "ZeroDivisionError" in steps["broken"]["error"]
+        assert not state.ready
+
+    def test_warm_up_marks_ready(self, monkeypatch):
+        # Stub the steps so the test does not touch the real caches and data files
+        for step in ("_import_modules", "_open_caches", "_warm_coverage"):
+            monkeypatch.setattr(warmup, step, lambda: 1)
+        monkeypatch.setattr(warmup, "_warm_tract_geometries", lambda: 1 / 0)
+
+        state = WarmupState()
+        asyncio.run(warm_up(state, locations=[]))
+
+        # A failed step does not block readiness
+        assert state.ready
+        assert set(state.steps) == {"imports", "caches", "coverage", "tract_geometries"}
+        assert state.steps["coverage"]["status"] == "ok"
+        assert state.steps["coverage"]["items"] == 1
+        assert state.steps["tract_geometries"]["status"] == "error"
+
+        samples = {(name, tuple(sorted(labels.items()))): value for name, _, _, labels, value in state.metrics_samples()}
+        assert samples[("startup_ready", ())] == 1
+        assert ("startup_warmup_step_seconds", (("status", "ok"), ("step", "imports"))) in samples
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,119 @@
+"""
+Unit tests for wifi_zone_placement.py
+
+Tests greedy maximum-coverage site selection and the fallbacks for tracts
+without usable block populations.
+"""
+
+import pytest
+import numpy as np
+from shapely.geometry import box
+
+import sys
+import os
+
+# Add backend directory to path to import the data_pipeline package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app", "backend")))
+
+from data_pipeline import wifi_zone_placement
+from data_pipeline.tract_blocks import TractBlocks
+from data_pipeline.wifi_zone_placement import place_wifi_zones_in_tract, solve_max_coverage
+
+
+def _unit_blocks(population):
+    """Small blocks on a row, ~1.1 km apart, with the given populations"""
+    n = len(population)
+    return TractBlocks(
+        geoids=[f"1207911010010{i:02d}" for i in range(n)],
+        geometries=[box(i * 0.01, 0, i * 0.01 + 0.001, 0.001) for i in range(n)],
+        land_area_m2=[1] * n,
+        water_area_m2=[0] * n,
+        population=population,
+    )
+
+
+class TestSolveMaxCoverage:
+    """Tests for solve_max_coverage"""
+
+    def test_greedy_on_grid(self):
+        # 3x3 grid with 1 km spacing; radius 1 covers a cross around a site
+        xs, ys = np.meshgrid(np.arange(3.0), np.arange(3.0))
+        x_km, y_km = xs.ravel(), ys.ravel()
+        weights = np.ones(9)
+        weights[8] = 10  # heavy corner at (2, 2)
+
+        sites = solve_max_coverage(x_km, y_km, weights, np.ones(9, dtype=bool), 2, 1.0)
+
+        # First site sits next to the heavy corner: (2, 1) covers it plus three others
+        assert sites[0] == {'index': 5, 'covered_weight': 13.0}
+        # Second site only counts demand not covered by the first
+        assert sites[1] == {'index': 0, 'covered_weight': 3.0}
+
+    def test_respects_candidate_mask(self):
+        x_km = np.array([0.0, 5.0])
+        y_km = np.zeros(2)
+        weights = np.array([0.0, 100.0])
+
+        sites = solve_max_coverage(x_km, y_km, weights, np.array([True, False]), 1, 1.0)
+
+        # The only candidate is out of reach of all demand
+        assert sites == []
+
+    def test_stops_when_everything_covered(self):
+        sites = solve_max_coverage(
+            np.zeros(3), np.zeros(3), np.ones(3), np.ones(3, dtype=bool), 3, 1.0
+        )
+        assert len(sites) == 1
+        assert sites[0]['covered_weight'] == 3.0
+
+
+class TestPlaceWifiZonesInTract:
+    """Tests for place_wifi_zones_in_tract"""
+
+    def test_places_at_populated_blocks(self):
+        blocks = _unit_blocks([0, 500, 0, 0, 300])
+        zones = place_wifi_zones_in_tract(blocks, box(-1, -1, 1, 1), num_zones=3)
+
+        assert [z['block_geoid'] for z in zones] == ["120791101001001", "120791101001004"]
+        assert [z['covered_population'] for z in zones] == [500, 300]
+        assert all(z['placement'] == 'population' for z in zones)
+
+    def test_no_blocks(self):
+        assert place_wifi_zones_in_tract(TractBlocks.empty(), box(0, 0, 1, 1)) == []
+
+    def test_blocks_without_population(self):
+        blocks = _unit_blocks([1, 2])
+        blocks = TractBlocks(blocks.geoids, blocks.geometries, blocks.land_area_m2, blocks.water_area_m2)
+        assert place_wifi_zones_in_tract(blocks, box(-1, -1, 1, 1)) == []
+
+    def test_zero_population_tract(self):
+        assert place_wifi_zones_in_tract(_unit_blocks([0, 0, 0]), box(-1, -1, 1, 1)) == []
+
+
+class TestGetBlockSource:
+    """Tests for block source resolution"""
+
+    @pytest.fixture(autouse=True)
+    def reset_source(self, monkeypatch):
+        monkeypatch.setattr(wifi_zone_placement, "_block_source", None)
+        monkeypatch.setattr(wifi_zone_placement, "_block_source_resolved", False)
+
+    def test_resolved_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(wifi_zone_placement, "_snowflake_block_source", lambda: calls.append(1))
+        monkeypatch.setattr(wifi_zone_placement, "_local_block_source", lambda: None)
+
+        assert wifi_zone_placement.get_block_source() is None
+        assert wifi_zone_placement.get_block_source() is None
+        assert calls == [1]
+
+    def test_local_source_requires_block_store(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SNOWFLAKE_ACCOUNT", raising=False)
+        from data_pipeline import census_blocks
+        monkeypatch.setattr(census_blocks, "DEFAULT_SHAPEFILE_PATH", tmp_path / "missing.shp")
+
+        assert wifi_zone_placement.get_block_source() is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])